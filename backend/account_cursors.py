@@ -0,0 +1,104 @@
+import logging
+import re
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Iterable, Optional, Set, Tuple
+from pymongo import UpdateOne
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+logger = logging.getLogger(__name__)
+
+_STATUS_ID_RE = re.compile(r'/status(?:es)?/(\d+)')
+
+
+def tweet_id_from_url(url: Optional[str]) -> Optional[int]:
+    """Numeric tweet ID from an x.com / twitter.com / nitter status URL"""
+    match = _STATUS_ID_RE.search(url or '')
+    return int(match.group(1)) if match else None
+
+
+class AccountCursors:
+    """Per-account high-water marks: the newest tweet ID and timestamp already processed.
+
+    Tweets are new when their ID (or, without an ID, their timestamp) is past the account's mark,
+    so every fetch stage only does work for tweets it hasn't seen. Marks live in a compact
+    in-memory map and are written to `account_cursors` in batches by flush(); accounts without a
+    mark fall back to the last `lookback` of tweets.
+    """
+
+    def __init__(self, lookback: timedelta = timedelta(hours=1)):
+        self.lookback = lookback
+        # account key -> (tweet id or 0, tweet timestamp as epoch seconds)
+        self.marks: Dict[str, Tuple[int, float]] = {}
+        self.dirty: Set[str] = set()
+        self.loaded = False
+
+    @staticmethod
+    def _key(account: str) -> str:
+        return account.lstrip('@').lower()
+
+    async def load(self, db: AsyncIOMotorDatabase):
+        """Restore every stored mark (once, at startup)"""
+        if self.loaded:
+            return
+        try:
+            async for doc in db.account_cursors.find({}, {"tweet_id": 1, "tweet_at": 1}):
+                tweet_at = doc["tweet_at"]
+                if tweet_at.tzinfo is None:
+                    tweet_at = tweet_at.replace(tzinfo=timezone.utc)
+                self.marks.setdefault(doc["_id"], (int(doc.get("tweet_id") or 0), tweet_at.timestamp()))
+            self.loaded = True
+            logger.info(f"Loaded {len(self.marks)} account cursors")
+        except Exception as e:
+            logger.error(f"Error loading account cursors: {e}")
+
+    def since(self, account: str, now: Optional[datetime] = None) -> datetime:
+        """Timestamp of the newest processed tweet, or the lookback start for unseen accounts"""
+        mark = self.marks.get(self._key(account))
+        if mark is None:
+            return (now or datetime.now(timezone.utc)) - self.lookback
+        return datetime.fromtimestamp(mark[1], timezone.utc)
+
+    def is_new(self, account: str, tweet_id: Optional[int], tweet_time: datetime) -> bool:
+        mark = self.marks.get(self._key(account))
+        if mark is None:
+            return tweet_time > datetime.now(timezone.utc) - self.lookback
+        if tweet_id and mark[0]:
+            return tweet_id > mark[0]
+        return tweet_time.timestamp() > mark[1]
+
+    def advance(self, account: str, seen: Iterable[Tuple[Optional[int], datetime]]):
+        """Move an account's mark past the given (tweet_id, tweet_time) pairs; it never moves back"""
+        key = self._key(account)
+        tweet_id, tweet_at = self.marks.get(key, (0, 0.0))
+        for seen_id, seen_time in seen:
+            tweet_id = max(tweet_id, seen_id or 0)
+            tweet_at = max(tweet_at, seen_time.timestamp())
+        if tweet_at and (tweet_id, tweet_at) != self.marks.get(key):
+            self.marks[key] = (tweet_id, tweet_at)
+            self.dirty.add(key)
+
+    async def flush(self, db: AsyncIOMotorDatabase, batch_size: int = 500) -> int:
+        """Write the marks changed since the last flush in bulk; returns the number written"""
+        dirty, self.dirty = self.dirty, set()
+        now = datetime.now(timezone.utc)
+        updates = [
+            UpdateOne({"_id": key}, {"$set": {
+                "tweet_id": self.marks[key][0],
+                "tweet_at": datetime.fromtimestamp(self.marks[key][1], timezone.utc),
+                "updated_at": now
+            }}, upsert=True)
+            for key in dirty if key in self.marks
+        ]
+        written = 0
+        try:
+            for start in range(0, len(updates), batch_size):
+                await db.account_cursors.bulk_write(updates[start:start + batch_size], ordered=False)
+                written += len(updates[start:start + batch_size])
+        except Exception as e:
+            # Keep them dirty so the next flush retries
+            self.dirty |= dirty
+            logger.error(f"Error flushing account cursors: {e}")
+        return written
+
+    def __len__(self) -> int:
+        return len(self.marks)
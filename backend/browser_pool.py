@@ -0,0 +1,349 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, List, Optional, Set
+from urllib.parse import urlsplit
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route
+
+logger = logging.getLogger(__name__)
+
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-features=VizDisplayCompositor',
+]
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+VIEWPORT = {"width": 1920, "height": 1080}
+
+# Requests aborted in lean navigation mode: nothing the tweet text extraction needs
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "ads-twitter.com",
+    "analytics.twitter.com",
+    "scribe.twitter.com",
+    "ads-api.x.com",
+)
+
+
+# Network-capture navigation never looks at the rendered page, so styles can go too
+NETWORK_BLOCKED_RESOURCE_TYPES = BLOCKED_RESOURCE_TYPES | {"stylesheet"}
+
+
+def is_blocked_request(resource_type: str, url: str, resource_types: frozenset = BLOCKED_RESOURCE_TYPES) -> bool:
+    """Whether lean navigation aborts this request (media, fonts and analytics)"""
+    if resource_type in resource_types:
+        return True
+    host = (urlsplit(url).hostname or "").lower()
+    return any(host == blocked or host.endswith("." + blocked) for blocked in BLOCKED_HOSTS)
+
+
+async def _limited_load(load, url: str, rate_limits):
+    if rate_limits is None:
+        return await load()
+    async with rate_limits.slot(url) as slot:
+        response = await load()
+        if response is not None:
+            slot.report(response.status, await response.header_value('retry-after'))
+        return response
+
+
+async def navigate(page: Page, url: str, wait_until: str, rate_limits=None, timeout_ms: int = 30000):
+    """page.goto through the domain's adaptive limiter (if given), so 429s, 5xx and timeouts shrink its window"""
+    return await _limited_load(lambda: page.goto(url, wait_until=wait_until, timeout=timeout_ms), url, rate_limits)
+
+
+async def reload(page: Page, url: str, wait_until: str, rate_limits=None, timeout_ms: int = 30000):
+    """page.reload through the limiter of `url`'s domain, like navigate()"""
+    return await _limited_load(lambda: page.reload(wait_until=wait_until, timeout=timeout_ms), url, rate_limits)
+
+
+class NavigationTimings:
+    """Recent navigation durations per navigation mode, for comparing lean and full page loads"""
+
+    def __init__(self, max_samples: int = 500):
+        self.max_samples = max_samples
+        self.samples: Dict[str, Deque[float]] = {}
+        self.counts: Dict[str, int] = {}
+
+    def record(self, mode: str, seconds: float):
+        self.samples.setdefault(mode, deque(maxlen=self.max_samples)).append(seconds)
+        self.counts[mode] = self.counts.get(mode, 0) + 1
+
+    def get_stats(self) -> Dict:
+        stats = {}
+        for mode, samples in self.samples.items():
+            ordered = sorted(samples)
+            stats[mode] = {
+                "navigations": self.counts[mode],
+                "avg_seconds": round(sum(ordered) / len(ordered), 3),
+                "p50_seconds": round(ordered[len(ordered) // 2], 3),
+                "p95_seconds": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+                "last_seconds": round(samples[-1], 3)
+            }
+        return stats
+
+
+class PooledPage:
+    """A page owned by the pool, with the context it lives in and its navigation count"""
+
+    def __init__(self, slot: "_ContextSlot", page: Page):
+        self.slot = slot
+        self.page = page
+        self.navigations = 0
+        self.crashed = False
+        self.suspect = False
+        page.on("crash", self._on_crash)
+        page.on("framenavigated", self._on_navigated)
+
+    def _on_crash(self, *_):
+        self.crashed = True
+
+    def _on_navigated(self, frame):
+        if frame == self.page.main_frame:
+            self.navigations += 1
+
+
+class _ContextSlot:
+    """One isolated browser context (own cookies and cache) in one Chromium process"""
+
+    def __init__(self, browser_index: int):
+        self.browser_index = browser_index
+        self.context: Optional[BrowserContext] = None
+
+
+class BrowserPool:
+    """Pool of Playwright pages spread over isolated contexts and one or more Chromium processes.
+
+    Callers check a page out with `async with pool.page() as page:` and get it back automatically.
+    Pages are replaced after `max_navigations` navigations, after a crash, or when a page that
+    raised fails its health probe; a disconnected Chromium process is relaunched with its contexts.
+    While block_resources is set, every context aborts images, media, fonts and analytics requests;
+    otherwise no route is installed at all, so requests never detour through Python and Chromium
+    keeps its HTTP cache.
+    """
+
+    def __init__(self, browsers: int = 1, contexts_per_browser: int = 2, pages_per_context: int = 2,
+                 max_navigations: int = 50, health_check_timeout_seconds: float = 5.0,
+                 block_resources: bool = True):
+        self.browser_count = browsers
+        self.contexts_per_browser = contexts_per_browser
+        self.pages_per_context = pages_per_context
+        self.max_navigations = max_navigations
+        self.health_check_timeout_seconds = health_check_timeout_seconds
+        self.block_resources = block_resources
+        self.blocked_resource_types = BLOCKED_RESOURCE_TYPES
+        self.blocked_requests = 0
+        self.playwright = None
+        self.browsers: List[Optional[Browser]] = []
+        self.slots: List[_ContextSlot] = []
+        self.idle: asyncio.Queue = asyncio.Queue()
+        self.pages: List[PooledPage] = []
+        self.started = False
+        self.recycled = 0
+        self.crashes = 0
+        self.dedicated_opened = 0
+        self.dedicated_contexts: Set[BrowserContext] = set()
+        self._relaunch_lock = asyncio.Lock()
+
+    @property
+    def size(self) -> int:
+        return self.browser_count * self.contexts_per_browser * self.pages_per_context
+
+    async def _launch_browser(self) -> Browser:
+        return await self.playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+
+    async def _route(self, route: Route):
+        request = route.request
+        if is_blocked_request(request.resource_type, request.url, self.blocked_resource_types):
+            self.blocked_requests += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _new_context(self, browser_index: int) -> BrowserContext:
+        context = await self.browsers[browser_index].new_context(user_agent=USER_AGENT, viewport=VIEWPORT)
+        if self.block_resources:
+            await context.route("**/*", self._route)
+        return context
+
+    async def set_resource_blocking(self, enabled: bool, resource_types: frozenset = BLOCKED_RESOURCE_TYPES):
+        """Turn request blocking on or off by routing or unrouting every open context"""
+        self.blocked_resource_types = resource_types
+        if enabled == self.block_resources:
+            return
+        self.block_resources = enabled
+        contexts = [slot.context for slot in self.slots if slot.context] + list(self.dedicated_contexts)
+        for context in contexts:
+            try:
+                if enabled:
+                    await context.route("**/*", self._route)
+                else:
+                    await context.unroute("**/*", self._route)
+            except Exception as e:
+                logger.debug(f"Error switching request blocking on a context: {e}")
+
+    async def _new_page(self, slot: _ContextSlot) -> PooledPage:
+        pooled = PooledPage(slot, await slot.context.new_page())
+        self.pages.append(pooled)
+        return pooled
+
+    async def start(self, playwright=None):
+        """Launch the browsers and fill every context with pages"""
+        if self.started:
+            return
+        self.playwright = playwright or await async_playwright().start()
+        self.idle = asyncio.Queue()
+
+        for browser_index in range(self.browser_count):
+            self.browsers.append(await self._launch_browser())
+            for _ in range(self.contexts_per_browser):
+                slot = _ContextSlot(browser_index)
+                slot.context = await self._new_context(browser_index)
+                self.slots.append(slot)
+                for _ in range(self.pages_per_context):
+                    self.idle.put_nowait(await self._new_page(slot))
+
+        self.started = True
+        logger.info(f"Browser pool started: {self.browser_count} browsers x {self.contexts_per_browser} contexts "
+                    f"x {self.pages_per_context} pages")
+
+    async def close(self):
+        """Close every page, context and browser"""
+        self.started = False
+        for browser in self.browsers:
+            try:
+                if browser:
+                    await browser.close()
+            except Exception as e:
+                logger.error(f"Error closing pooled browser: {e}")
+        try:
+            if self.playwright:
+                await self.playwright.stop()
+        except Exception as e:
+            logger.error(f"Error stopping Playwright: {e}")
+        self.playwright = None
+        self.browsers = []
+        self.slots = []
+        self.pages = []
+        self.dedicated_contexts = set()
+        self.idle = asyncio.Queue()
+
+    async def _is_healthy(self, pooled: PooledPage) -> bool:
+        if pooled.crashed or pooled.page.is_closed():
+            return False
+        if not self.browsers[pooled.slot.browser_index].is_connected():
+            return False
+        if pooled.suspect:
+            try:
+                await asyncio.wait_for(pooled.page.evaluate("1"), self.health_check_timeout_seconds)
+            except Exception:
+                return False
+        return True
+
+    async def _ensure_browser(self, browser_index: int):
+        """Relaunch a disconnected Chromium process and rebuild its contexts"""
+        async with self._relaunch_lock:
+            if self.browsers[browser_index].is_connected():
+                return
+            logger.warning(f"Pooled browser {browser_index} disconnected, relaunching")
+            self.browsers[browser_index] = await self._launch_browser()
+            for slot in self.slots:
+                if slot.browser_index == browser_index:
+                    slot.context = await self._new_context(browser_index)
+
+    async def _recycle(self, pooled: PooledPage) -> PooledPage:
+        """Replace a page with a fresh one in the same context"""
+        self.recycled += 1
+        if pooled.crashed:
+            self.crashes += 1
+        if pooled in self.pages:
+            self.pages.remove(pooled)
+        try:
+            if not pooled.page.is_closed():
+                await pooled.page.close()
+        except Exception:
+            pass
+
+        await self._ensure_browser(pooled.slot.browser_index)
+        try:
+            return await self._new_page(pooled.slot)
+        except Exception:
+            # The context itself is gone; give the slot a new one
+            pooled.slot.context = await self._new_context(pooled.slot.browser_index)
+            return await self._new_page(pooled.slot)
+
+    async def checkout(self) -> PooledPage:
+        """Take an idle page, waiting for one if every page is in use, and replace it if unhealthy"""
+        if not self.started:
+            # Without pages the queue below would never yield
+            raise RuntimeError("browser pool not started")
+        pooled = await self.idle.get()
+        try:
+            if not await self._is_healthy(pooled):
+                pooled = await self._recycle(pooled)
+        except Exception:
+            # Keep the pool at full size even if the replacement could not be built
+            self.idle.put_nowait(pooled)
+            raise
+        pooled.suspect = False
+        return pooled
+
+    async def release(self, pooled: PooledPage, failed: bool = False):
+        """Give a page back, recycling it once it has done max_navigations navigations"""
+        pooled.suspect = pooled.suspect or failed
+        try:
+            if pooled.crashed or pooled.navigations >= self.max_navigations:
+                pooled = await self._recycle(pooled)
+        except Exception as e:
+            logger.error(f"Error recycling pooled page: {e}")
+        self.idle.put_nowait(pooled)
+
+    async def open_dedicated_page(self) -> Page:
+        """A long-lived page in its own context, outside the checkout pool"""
+        browser_index = self.dedicated_opened % self.browser_count
+        self.dedicated_opened += 1
+        await self._ensure_browser(browser_index)
+        context = await self._new_context(browser_index)
+        self.dedicated_contexts.add(context)
+        return await context.new_page()
+
+    async def close_dedicated_page(self, page: Page):
+        """Close a page from open_dedicated_page together with its context"""
+        self.dedicated_contexts.discard(page.context)
+        try:
+            await page.context.close()
+        except Exception as e:
+            logger.debug(f"Error closing dedicated page: {e}")
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Check a page out for the duration of the block"""
+        pooled = await self.checkout()
+        failed = False
+        try:
+            yield pooled.page
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            await self.release(pooled, failed)
+
+    def get_stats(self) -> Dict:
+        return {
+            "browsers": self.browser_count,
+            "contexts": len(self.slots),
+            "pages": self.size,
+            "idle_pages": self.idle.qsize(),
+            "max_navigations": self.max_navigations,
+            "block_resources": self.block_resources,
+            "blocked_requests": self.blocked_requests,
+            "recycled": self.recycled,
+            "crashes": self.crashes
+        }
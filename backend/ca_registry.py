@@ -0,0 +1,65 @@
+import logging
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from token_index import token_key
+
+logger = logging.getLogger(__name__)
+
+
+class KnownCARegistry:
+    """In-memory registry of tokens that already have a contract address.
+
+    Streams the whole ca_alerts collection once at startup and is updated in place by every code
+    path that creates a CA alert, so membership checks never go to Mongo. Lookups are by token_key
+    and accept any spelling of the token name.
+    """
+
+    def __init__(self):
+        self.keys = set()
+        self.loaded = False
+        self.loaded_at: Optional[datetime] = None
+
+    async def load(self, db: AsyncIOMotorDatabase, force: bool = False, batch_size: int = 5000):
+        """Stream every CA alert into the registry (only once unless force is set)"""
+        if self.loaded and not force:
+            return
+
+        try:
+            keys = set()
+            cursor = db.ca_alerts.find({}, {"token_key": 1, "token_name": 1}).batch_size(batch_size)
+            async for alert in cursor:
+                key = alert.get('token_key') or token_key(alert.get('token_name'))
+                if key:
+                    keys.add(key)
+
+            # CAs added while the stream was running are kept
+            self.keys |= keys
+            self.loaded = True
+            self.loaded_at = datetime.now(timezone.utc)
+            logger.info(f"Known CA registry loaded: {len(self.keys)} tokens")
+        except Exception as e:
+            logger.error(f"Error loading known CA registry: {e}")
+
+    def add(self, token_name: str):
+        """Register a token that just got a CA"""
+        key = token_key(token_name)
+        if key:
+            self.keys.add(key)
+
+    def update(self, token_names: Iterable[str]):
+        for token_name in token_names:
+            self.add(token_name)
+
+    def __contains__(self, token_name: str) -> bool:
+        return token_key(token_name) in self.keys
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys)
+
+
+# Shared instance consulted by extraction and quorum in every monitor
+known_ca_registry = KnownCARegistry()
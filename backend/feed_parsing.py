@@ -0,0 +1,102 @@
+import asyncio
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    try:
+        published = parsedate_to_datetime(value) if value else None
+    except (TypeError, ValueError):
+        return None
+    # "-0000" offsets parse naive; treat them as UTC like the rest of the monitor
+    if published is not None and published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published
+
+
+def parse_rss_items(content: bytes, limit: int = 10) -> List[Dict]:
+    """The first `limit` feed items as compact dicts, parsed incrementally and stopping early"""
+    items = []
+    try:
+        for _, item in etree.iterparse(io.BytesIO(content), events=("end",), tag="item",
+                                       recover=True, resolve_entities=False, no_network=True):
+            items.append({
+                "title": item.findtext("title"),
+                "description": item.findtext("description"),
+                "link": item.findtext("link"),
+                "published": _parse_date(item.findtext("pubDate"))
+            })
+            item.clear(keep_tail=True)
+            if len(items) >= limit:
+                break
+    except etree.LxmlError as e:
+        logger.debug(f"Error parsing feed: {e}")
+    return items
+
+
+def extract_scripts(html: bytes, keyword: str = "tweet") -> List[str]:
+    """Text of every <script> mentioning `keyword`; the rest of the page is discarded while parsing"""
+    scripts = []
+    try:
+        for _, element in etree.iterparse(io.BytesIO(html), events=("end",), html=True, recover=True, no_network=True):
+            if element.tag == "script" and element.text and keyword in element.text.lower():
+                scripts.append(element.text)
+            element.clear(keep_tail=True)
+    except etree.LxmlError as e:
+        logger.debug(f"Error parsing HTML: {e}")
+    return scripts
+
+
+class ParsingPool:
+    """Feed and page parsing with lxml, off the event loop for anything large.
+
+    Small payloads (a typical 10-item RSS feed) are parsed inline, which is cheaper than a round
+    trip to a worker; larger ones go to a process pool. Only the compact fields extraction needs
+    come back, never a parse tree.
+    """
+
+    def __init__(self, max_workers: int = 2, inline_threshold_bytes: int = 64 * 1024):
+        self.max_workers = max_workers
+        self.inline_threshold_bytes = inline_threshold_bytes
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.inline = 0
+        self.offloaded = 0
+
+    def start(self):
+        """Start the worker processes (idempotent)"""
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    async def _run(self, function, payload: bytes, *args):
+        executor = self.executor
+        if executor is None or len(payload) < self.inline_threshold_bytes:
+            self.inline += 1
+            return function(payload, *args)
+        self.offloaded += 1
+        return await asyncio.get_running_loop().run_in_executor(executor, function, payload, *args)
+
+    async def rss_items(self, content: bytes, limit: int = 10) -> List[Dict]:
+        return await self._run(parse_rss_items, content, limit)
+
+    async def profile_scripts(self, html: bytes, keyword: str = "tweet") -> List[str]:
+        return await self._run(extract_scripts, html, keyword)
+
+    def get_stats(self) -> Dict:
+        return {"workers": self.max_workers if self.executor else 0, "inline": self.inline, "offloaded": self.offloaded}
@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from browser_pool import navigate
+
+logger = logging.getLogger(__name__)
+
+FOLLOWING_URL_TEMPLATE = "https://x.com/{account}/following"
+
+USER_CELL_SELECTOR = '[data-testid="UserCell"]'
+
+# The profile link is the first one in a cell; later links are @mentions in the bio
+READ_USER_CELLS_JS = """
+() => Array.from(document.querySelectorAll('[data-testid="UserCell"]'), cell => {
+    const link = cell.querySelector('a[href^="/"]');
+    return link ? link.getAttribute('href').split('/')[1] : null;
+}).filter(Boolean)
+"""
+
+# True once the last rendered cell is someone other than `last`, i.e. the scroll loaded more
+NEW_USER_CELLS_JS = """
+(last) => {
+    const cells = document.querySelectorAll('[data-testid="UserCell"]');
+    if (!cells.length) return false;
+    const link = cells[cells.length - 1].querySelector('a[href^="/"]');
+    return !!link && link.getAttribute('href').split('/')[1] !== last;
+}
+"""
+
+
+class FollowingList:
+    """The accounts a target account follows, served from the last crawl and refreshed in the background.
+
+    Startup reads the snapshot persisted in `following_snapshots` instead of crawling. The crawl
+    scrolls the following page until no new UserCell appears (waiting for new cells rather than
+    sleeping), deduplicating with a dict keyed by lowercased username. Each refresh computes the
+    accounts added and removed since the snapshot and hands them to `on_change`. Removals only
+    count when the crawl reached the end of the list, so an interrupted crawl never drops accounts.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase, pool, account: str = "Sploofmeme", rate_limits=None,
+                 on_change: Optional[Callable[[List[str], List[str]], None]] = None,
+                 refresh_interval_seconds: float = 1800.0, max_accounts: int = 1000, max_scrolls: int = 200,
+                 cell_timeout_ms: int = 5000, url_template: str = FOLLOWING_URL_TEMPLATE):
+        self.db = db
+        self.pool = pool
+        self.account = account
+        self.rate_limits = rate_limits
+        self.on_change = on_change
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.max_accounts = max_accounts
+        self.max_scrolls = max_scrolls
+        self.cell_timeout_ms = cell_timeout_ms
+        self.url_template = url_template
+        self.accounts: List[str] = []
+        self.task: Optional[asyncio.Task] = None
+        self.refreshed_at: Optional[float] = None
+        self.refreshes = 0
+        self.failures = 0
+        self.last_refresh: Optional[Dict] = None
+
+    @property
+    def _key(self) -> str:
+        return self.account.lstrip('@').lower()
+
+    async def load(self) -> List[str]:
+        """The last persisted crawl (empty if there is none)"""
+        try:
+            snapshot = await self.db.following_snapshots.find_one({"_id": self._key})
+            if snapshot:
+                self.accounts = list(snapshot.get("accounts", []))
+                logger.info(f"Loaded {len(self.accounts)} followed accounts of @{self.account} "
+                            f"crawled at {snapshot.get('crawled_at')}")
+        except Exception as e:
+            logger.error(f"Error loading following snapshot: {e}")
+        return self.accounts
+
+    async def crawl(self) -> Tuple[Dict[str, str], bool]:
+        """Followed accounts keyed by lowercased username, and whether the crawl reached the end"""
+        url = self.url_template.format(account=self.account.lstrip('@'))
+        own = self._key
+        accounts: Dict[str, str] = {}
+        complete = False
+        async with self.pool.page() as page:
+            await navigate(page, url, "domcontentloaded", self.rate_limits)
+            try:
+                await page.wait_for_selector(USER_CELL_SELECTOR, timeout=3 * self.cell_timeout_ms)
+            except PlaywrightTimeoutError:
+                logger.warning(f"No accounts rendered on @{self.account}'s following page")
+                return accounts, False
+
+            stalled = 0
+            for _ in range(self.max_scrolls):
+                usernames = await page.evaluate(READ_USER_CELLS_JS)
+                for username in usernames:
+                    if username.lower() != own:
+                        accounts.setdefault(username.lower(), username)
+                if len(accounts) >= self.max_accounts:
+                    complete = True
+                    break
+
+                await page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
+                try:
+                    await page.wait_for_function(NEW_USER_CELLS_JS, arg=usernames[-1] if usernames else "",
+                                                 timeout=self.cell_timeout_ms)
+                    stalled = 0
+                except PlaywrightTimeoutError:
+                    # Nothing new after two scrolls in a row: that's the end of the list
+                    stalled += 1
+                    if stalled >= 2:
+                        complete = True
+                        break
+
+        return dict(list(accounts.items())[:self.max_accounts]), complete
+
+    async def save(self, complete: bool):
+        try:
+            await self.db.following_snapshots.update_one({"_id": self._key}, {"$set": {
+                "accounts": self.accounts,
+                "complete": complete,
+                "crawled_at": datetime.now(timezone.utc)
+            }}, upsert=True)
+        except Exception as e:
+            logger.error(f"Error saving following snapshot: {e}")
+
+    async def refresh(self) -> Tuple[List[str], List[str]]:
+        """Crawl, persist the result and report (added, removed) against the previous snapshot"""
+        self.refreshed_at = time.monotonic()
+        try:
+            crawled, complete = await self.crawl()
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"Error crawling @{self.account}'s following list: {e}")
+            return [], []
+        if not crawled:
+            self.failures += 1
+            return [], []
+
+        previous = {account.lower(): account for account in self.accounts}
+        added = [account for key, account in crawled.items() if key not in previous]
+        removed = [account for key, account in previous.items() if key not in crawled] if complete else []
+        self.accounts = list(crawled.values()) if complete else self.accounts + added
+        await self.save(complete)
+
+        self.refreshes += 1
+        self.last_refresh = {
+            "accounts": len(self.accounts),
+            "added": len(added),
+            "removed": len(removed),
+            "complete": complete,
+            "refreshed_at": datetime.now(timezone.utc).isoformat()
+        }
+        logger.info(f"Following list of @{self.account}: {len(self.accounts)} accounts "
+                    f"(+{len(added)} -{len(removed)})")
+        if (added or removed) and self.on_change:
+            self.on_change(added, removed)
+        return added, removed
+
+    async def _run(self):
+        while True:
+            if self.refreshed_at is not None:
+                await asyncio.sleep(max(0.0, self.refreshed_at + self.refresh_interval_seconds - time.monotonic()))
+            await self.refresh()
+
+    def start(self):
+        """Refresh every refresh_interval_seconds in the background (right away unless a crawl just ran)"""
+        if self.task is None:
+            self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+    def get_stats(self) -> Dict:
+        return {
+            "account": self.account,
+            "accounts": len(self.accounts),
+            "refreshing": self.task is not None,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_refresh": self.last_refresh
+        }
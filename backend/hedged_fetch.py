@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AllSourcesFailed(Exception):
+    """Every source of a hedged fetch raised"""
+
+    def __init__(self, errors: Dict[str, BaseException]):
+        self.errors = errors
+        super().__init__("; ".join(f"{name}: {error}" for name, error in errors.items()) or "no sources")
+
+
+class HedgedFetcher:
+    """Runs fetch sources as a hedged race instead of a sequential fallback chain.
+
+    The first source starts immediately. If it hasn't answered after `hedge_delay_seconds` (or as
+    soon as it fails) the next one is launched, and so on. The first successful answer wins and
+    every other source still running is cancelled, so latency follows the fastest healthy source.
+    Sources that finish in the same instant as the winner are merged into its result.
+    """
+
+    def __init__(self, hedge_delay_seconds: float = 1.5):
+        self.hedge_delay_seconds = hedge_delay_seconds
+        self.wins: Dict[str, int] = {}
+        self.failures: Dict[str, int] = {}
+        self.hedges = 0
+        self.exhausted = 0
+
+    async def fetch(self, sources: List[Tuple[str, Callable[[], Awaitable[List]]]],
+                    hedge_delay_seconds: Optional[float] = None,
+                    observer: Optional[Callable[[str, bool, float, Any], None]] = None) -> Tuple[str, List]:
+        """Race the sources in order; returns (winning source, result) or raises AllSourcesFailed.
+
+        observer(source, succeeded, seconds, result) is called for every source that finished.
+        """
+        if not sources:
+            raise AllSourcesFailed({})
+        hedge_delay = self.hedge_delay_seconds if hedge_delay_seconds is None else hedge_delay_seconds
+        remaining = list(sources)
+        pending: Dict[asyncio.Task, str] = {}
+        started: Dict[str, float] = {}
+        errors: Dict[str, BaseException] = {}
+
+        def launch():
+            name, fetch = remaining.pop(0)
+            started[name] = time.monotonic()
+            pending[asyncio.create_task(fetch())] = name
+
+        try:
+            launch()
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, timeout=hedge_delay if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # No answer within the hedge delay: start the next source alongside
+                    self.hedges += 1
+                    launch()
+                    continue
+
+                winner, result = None, []
+                for task in done:
+                    name = pending.pop(task)
+                    if observer:
+                        observer(name, task.exception() is None, time.monotonic() - started[name],
+                                 task.result() if task.exception() is None else None)
+                    if task.exception() is None:
+                        winner = winner or name
+                        result = result + list(task.result() or [])
+                    else:
+                        errors[name] = task.exception()
+                        self.failures[name] = self.failures.get(name, 0) + 1
+                        logger.debug(f"Source {name} failed: {task.exception()}")
+
+                if winner is not None:
+                    self.wins[winner] = self.wins.get(winner, 0) + 1
+                    return winner, result
+
+                # A failure is as good as a timeout for hedging: try the next source right away
+                if remaining:
+                    launch()
+
+            self.exhausted += 1
+            raise AllSourcesFailed(errors)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "hedge_delay_seconds": self.hedge_delay_seconds,
+            "wins": self.wins,
+            "failures": self.failures,
+            "hedges": self.hedges,
+            "exhausted": self.exhausted
+        }
@@ -0,0 +1,127 @@
+import logging
+import time
+from collections import deque
+from types import SimpleNamespace
+from typing import Deque, Dict, Optional
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+# One long-lived session per purpose: connection caps, per-host caps and total timeout
+SESSION_PROFILES: Dict[str, Dict] = {
+    "rss": {"limit": 50, "limit_per_host": 6, "timeout": 10},
+    "pump": {"limit": 10, "limit_per_host": 4, "timeout": 5},
+}
+
+
+class HostTimings:
+    """Request counts, errors and latency percentiles per host"""
+
+    def __init__(self, max_samples: int = 200):
+        self.max_samples = max_samples
+        self.samples: Dict[str, Deque[float]] = {}
+        self.requests: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.statuses: Dict[str, Dict[int, int]] = {}
+
+    def record(self, host: str, seconds: float, status: Optional[int] = None):
+        self.samples.setdefault(host, deque(maxlen=self.max_samples)).append(seconds)
+        self.requests[host] = self.requests.get(host, 0) + 1
+        if status is None:
+            self.errors[host] = self.errors.get(host, 0) + 1
+        else:
+            statuses = self.statuses.setdefault(host, {})
+            statuses[status] = statuses.get(status, 0) + 1
+
+    def get_stats(self) -> Dict:
+        stats = {}
+        for host, samples in self.samples.items():
+            ordered = sorted(samples)
+            stats[host] = {
+                "requests": self.requests[host],
+                "errors": self.errors.get(host, 0),
+                "statuses": self.statuses.get(host, {}),
+                "avg_ms": round(1000 * sum(ordered) / len(ordered), 1),
+                "p95_ms": round(1000 * ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1)
+            }
+        return stats
+
+
+class HttpClients:
+    """Long-lived pooled aiohttp sessions for the monitor, one per purpose.
+
+    Sessions keep connections alive across polls, cache DNS and cap connections overall and per
+    host. Every request is timed per host through an aiohttp trace config. start()/close() follow
+    the monitor's lifecycle; session() also opens a missing session on first use.
+    """
+
+    def __init__(self, profiles: Optional[Dict[str, Dict]] = None, dns_cache_seconds: int = 300,
+                 keepalive_seconds: float = 30.0):
+        self.profiles = dict(SESSION_PROFILES if profiles is None else profiles)
+        self.dns_cache_seconds = dns_cache_seconds
+        self.keepalive_seconds = keepalive_seconds
+        self.sessions: Dict[str, aiohttp.ClientSession] = {}
+        self.timings = HostTimings()
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_start.append(self._on_request_start)
+        self.trace_config.on_request_end.append(self._on_request_end)
+        self.trace_config.on_request_exception.append(self._on_request_exception)
+
+    async def _on_request_start(self, session, context: SimpleNamespace, params):
+        context.started = time.monotonic()
+
+    async def _on_request_end(self, session, context: SimpleNamespace, params):
+        self.timings.record(params.url.host or "", time.monotonic() - context.started, params.response.status)
+
+    async def _on_request_exception(self, session, context: SimpleNamespace, params):
+        self.timings.record(params.url.host or "", time.monotonic() - context.started)
+
+    def _open(self, purpose: str) -> aiohttp.ClientSession:
+        profile = self.profiles[purpose]
+        connector = aiohttp.TCPConnector(
+            limit=profile["limit"],
+            limit_per_host=profile["limit_per_host"],
+            ttl_dns_cache=self.dns_cache_seconds,
+            keepalive_timeout=self.keepalive_seconds
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=profile.get("headers"),
+            timeout=aiohttp.ClientTimeout(total=profile["timeout"]),
+            trace_configs=[self.trace_config]
+        )
+
+    async def start(self):
+        """Open a session for every purpose"""
+        for purpose in self.profiles:
+            self.session(purpose)
+        logger.info(f"HTTP sessions ready: {', '.join(self.profiles)}")
+
+    def session(self, purpose: str) -> aiohttp.ClientSession:
+        """The shared session for a purpose ("rss", "pump")"""
+        session = self.sessions.get(purpose)
+        if session is None or session.closed:
+            session = self.sessions[purpose] = self._open(purpose)
+        return session
+
+    async def close(self):
+        for purpose, session in list(self.sessions.items()):
+            try:
+                await session.close()
+            except Exception as e:
+                logger.error(f"Error closing {purpose} HTTP session: {e}")
+        self.sessions = {}
+
+    def get_stats(self) -> Dict:
+        return {
+            "sessions": {purpose: not session.closed for purpose, session in self.sessions.items()},
+            "hosts": self.timings.get_stats()
+        }
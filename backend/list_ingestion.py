@@ -0,0 +1,145 @@
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from account_cursors import tweet_id_from_url
+from browser_pool import navigate
+from timeline_json import TimelineCapture
+
+logger = logging.getLogger(__name__)
+
+# X caps a List at 5000 members
+LIST_MEMBER_LIMIT = 5000
+
+LIST_URL_TEMPLATE = "https://x.com/i/lists/{list_id}"
+
+TWEET_SELECTOR = '[data-testid="tweet"]'
+
+# Every rendered tweet with its author, unlike the profile scrape which only needs the first 10
+READ_LIST_TWEETS_JS = """
+() => {
+    const tweets = [];
+    for (const tweet of document.querySelectorAll('[data-testid="tweet"]')) {
+        const textElement = tweet.querySelector('[data-testid="tweetText"]');
+        const timeElement = tweet.querySelector('time');
+        const link = tweet.querySelector('a[href*="/status/"]');
+        const author = tweet.querySelector('[data-testid="User-Name"] a[href^="/"]');
+        if (textElement && timeElement && link && author) {
+            tweets.push({
+                text: textElement.innerText,
+                timestamp: timeElement.getAttribute('datetime'),
+                url: link.href,
+                username: author.getAttribute('href').substring(1)
+            });
+        }
+    }
+    return tweets;
+}
+"""
+
+
+def chunk_accounts(accounts: List[str], size: int = LIST_MEMBER_LIMIT) -> List[List[str]]:
+    """Split accounts into List-sized chunks, keeping their order"""
+    return [accounts[i:i + size] for i in range(0, len(accounts), size)]
+
+
+def _tweet_time(tweet: Dict) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(tweet['timestamp'].replace('Z', '+00:00'))
+    except (KeyError, AttributeError, ValueError):
+        return None
+
+
+class XListIngestor:
+    """Reads monitored accounts' tweets from a few aggregate X List timelines instead of one profile each.
+
+    The monitored accounts are assigned to the configured Lists in chunks of LIST_MEMBER_LIMIT;
+    the resulting membership plan is what each List on X has to contain. Each cycle, every List
+    timeline is opened once and scrolled back to the last check, collecting tweets from the
+    timeline JSON responses and the rendered DOM. Accounts that don't fit in any List stay with
+    the per-profile poller.
+    """
+
+    def __init__(self, pool, rate_limits=None, url_template: str = LIST_URL_TEMPLATE,
+                 member_limit: int = LIST_MEMBER_LIMIT, max_scrolls: int = 30, scroll_pause_ms: int = 800):
+        self.pool = pool
+        self.rate_limits = rate_limits
+        self.url_template = url_template
+        self.member_limit = member_limit
+        self.max_scrolls = max_scrolls
+        self.scroll_pause_ms = scroll_pause_ms
+        self.list_members: Dict[str, List[str]] = {}
+        self.member_lookup: Dict[str, str] = {}
+        self.navigations = 0
+        self.last_fetch: Dict[str, Dict] = {}
+
+    def assign(self, accounts: List[str], list_ids: List[str]) -> Dict[str, List[str]]:
+        """Spread the accounts over the Lists in order; returns list_id -> members"""
+        chunks = chunk_accounts(list(dict.fromkeys(accounts)), self.member_limit)
+        self.list_members = {list_id: members for list_id, members in zip(list_ids, chunks)}
+        self.member_lookup = {
+            member.lower(): member for members in self.list_members.values() for member in members
+        }
+        uncovered = len(accounts) - len(self.member_lookup)
+        if uncovered > 0:
+            logger.warning(f"{uncovered} accounts don't fit in {len(list_ids)} X Lists, polling them per profile")
+        return self.list_members
+
+    def covered_accounts(self) -> set:
+        return set(self.member_lookup.values())
+
+    async def fetch_list(self, list_id: str, since: datetime) -> List[Dict]:
+        """Tweets on a List timeline newer than `since` (plus the page that crosses it), newest first"""
+        url = self.url_template.format(list_id=list_id)
+        # Keyed by tweet ID: the JSON and DOM copies of a tweet can carry different URLs (i/web, twitter.com)
+        tweets: Dict = {}
+        scrolls = 0
+        async with self.pool.page() as page:
+            async with TimelineCapture(page) as capture:
+                await navigate(page, url, "domcontentloaded", self.rate_limits)
+                self.navigations += 1
+                try:
+                    await page.wait_for_selector(TWEET_SELECTOR, timeout=15000)
+                except PlaywrightTimeoutError:
+                    logger.warning(f"No tweets rendered on X List {list_id}")
+
+                stalled = 0
+                while True:
+                    before = len(tweets)
+                    for tweet in capture.tweets() + await page.evaluate(READ_LIST_TWEETS_JS):
+                        tweets.setdefault(tweet_id_from_url(tweet['url']) or tweet['url'], tweet)
+
+                    times = [t for t in map(_tweet_time, tweets.values()) if t]
+                    if times and min(times) <= since:
+                        break
+                    stalled = stalled + 1 if len(tweets) == before else 0
+                    if stalled >= 2 or scrolls >= self.max_scrolls:
+                        break
+
+                    await page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
+                    await page.wait_for_timeout(self.scroll_pause_ms)
+                    scrolls += 1
+
+        self.last_fetch[list_id] = {
+            "tweets": len(tweets),
+            "scrolls": scrolls,
+            "fetched_at": datetime.now(timezone.utc).isoformat()
+        }
+        return sorted(tweets.values(), key=lambda tweet: tweet.get('timestamp') or '', reverse=True)
+
+    def group_by_member(self, tweets: List[Dict]) -> Dict[str, List[Dict]]:
+        """Tweets per monitored account; tweets by anyone else on the timeline are dropped"""
+        by_member: Dict[str, List[Dict]] = {}
+        for tweet in tweets:
+            member = self.member_lookup.get((tweet.get('username') or '').lower())
+            if member:
+                by_member.setdefault(member, []).append(tweet)
+        return by_member
+
+    def get_stats(self) -> Dict:
+        return {
+            "lists": {list_id: len(members) for list_id, members in self.list_members.items()},
+            "covered_accounts": len(self.member_lookup),
+            "navigations": self.navigations,
+            "last_fetch": self.last_fetch
+        }
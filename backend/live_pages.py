@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional
+from browser_pool import navigate, reload
+
+logger = logging.getLogger(__name__)
+
+LIVE_TWEET_BINDING = "__onLiveTweets"
+
+# Injected into every document of a live page: reports the tweets already rendered and then every
+# tweet node React inserts later, each one once per document
+LIVE_TWEET_OBSERVER_JS = """
+(() => {
+    const seen = new Set();
+    const read = (tweet) => {
+        const textElement = tweet.querySelector('[data-testid="tweetText"]');
+        const timeElement = tweet.querySelector('time');
+        const link = tweet.querySelector('a[href*="/status/"]');
+        if (!textElement || !timeElement || !link) return null;
+        const url = link.href;
+        if (seen.has(url)) return null;
+        seen.add(url);
+        const author = tweet.querySelector('[data-testid="User-Name"] a[href^="/"]');
+        return {
+            text: textElement.innerText,
+            timestamp: timeElement.getAttribute('datetime'),
+            url: url,
+            username: author ? author.getAttribute('href').substring(1) : ''
+        };
+    };
+    const collect = (root) => {
+        const found = [];
+        const nodes = root.matches && root.matches('[data-testid="tweet"]')
+            ? [root] : (root.querySelectorAll ? root.querySelectorAll('[data-testid="tweet"]') : []);
+        for (const node of nodes) {
+            const tweet = read(node);
+            if (tweet) found.push(tweet);
+        }
+        return found;
+    };
+    const start = () => {
+        const initial = collect(document.body);
+        if (initial.length) window.__onLiveTweets(initial);
+        new MutationObserver((mutations) => {
+            const added = [];
+            for (const mutation of mutations) {
+                for (const node of mutation.addedNodes) {
+                    if (node.nodeType === 1) added.push(...collect(node));
+                }
+            }
+            if (added.length) window.__onLiveTweets(added);
+        }).observe(document.body, {childList: true, subtree: true});
+    };
+    if (document.body) start(); else document.addEventListener('DOMContentLoaded', start);
+})();
+"""
+
+
+class _LiveTimeline:
+    """One watched timeline: its page, the task driving it and the tweets already delivered"""
+
+    def __init__(self, key: str, url: str, account: Optional[str]):
+        self.key = key
+        self.url = url
+        self.account = account
+        self.task: Optional[asyncio.Task] = None
+        self.seen: "OrderedDict[str, None]" = OrderedDict()
+        self.tweets = 0
+        self.restarts = 0
+        self.last_tweet_at: Optional[float] = None
+
+
+class LiveTimelineStreamer:
+    """Keeps dedicated pages open on hot timelines and streams newly rendered tweets into Python.
+
+    Each watched timeline (a profile, a List or the home timeline) gets its own page from the
+    browser pool. An injected MutationObserver pushes tweets through page.expose_binding as React
+    renders them, so they reach `on_tweets(account, tweets)` without a reload cycle. Pages are
+    reloaded every refresh_seconds to pick up timelines that don't insert new tweets on their own,
+    and are rebuilt after a crash. Navigations and reloads go through `rate_limits` when given.
+    """
+
+    def __init__(self, pool, on_tweets: Callable[[str, List[Dict]], Awaitable], refresh_seconds: float = 60.0,
+                 max_seen: int = 2000, rate_limits=None):
+        self.pool = pool
+        self.on_tweets = on_tweets
+        self.rate_limits = rate_limits
+        self.refresh_seconds = refresh_seconds
+        self.max_seen = max_seen
+        self.timelines: Dict[str, _LiveTimeline] = {}
+        self.dispatches = set()
+        self.running = False
+
+    async def start(self):
+        """Open pages for every timeline watched so far"""
+        self.running = True
+        for timeline in self.timelines.values():
+            self._launch(timeline)
+
+    async def stop(self):
+        self.running = False
+        tasks = [timeline.task for timeline in self.timelines.values() if timeline.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for timeline in self.timelines.values():
+            timeline.task = None
+
+    def watch(self, key: str, url: str, account: Optional[str] = None):
+        """Stream a timeline; tweets are attributed to `account`, or to their author when None"""
+        if key in self.timelines:
+            return
+        timeline = self.timelines[key] = _LiveTimeline(key, url, account)
+        if self.running:
+            self._launch(timeline)
+
+    def unwatch(self, key: str):
+        timeline = self.timelines.pop(key, None)
+        if timeline and timeline.task:
+            timeline.task.cancel()
+
+    def _launch(self, timeline: _LiveTimeline):
+        if timeline.task is None or timeline.task.done():
+            timeline.task = asyncio.create_task(self._run(timeline))
+
+    def _deliver(self, timeline: _LiveTimeline, tweets: List[Dict]):
+        """Binding callback: drop tweets already delivered and hand the rest to on_tweets"""
+        by_account: Dict[str, List[Dict]] = {}
+        for tweet in tweets:
+            url = tweet.get('url')
+            if not url or url in timeline.seen:
+                continue
+            timeline.seen[url] = None
+            if len(timeline.seen) > self.max_seen:
+                timeline.seen.popitem(last=False)
+            account = timeline.account or tweet.get('username')
+            if account:
+                by_account.setdefault(account, []).append(tweet)
+
+        for account, account_tweets in by_account.items():
+            timeline.tweets += len(account_tweets)
+            timeline.last_tweet_at = time.monotonic()
+            task = asyncio.create_task(self._dispatch(account, account_tweets))
+            self.dispatches.add(task)
+            task.add_done_callback(self.dispatches.discard)
+
+    async def _dispatch(self, account: str, tweets: List[Dict]):
+        try:
+            await self.on_tweets(account, tweets)
+        except Exception as e:
+            logger.error(f"Error processing live tweets from @{account}: {e}")
+
+    async def _run(self, timeline: _LiveTimeline):
+        backoff = 1.0
+        while self.running:
+            page = None
+            try:
+                page = await self.pool.open_dedicated_page()
+                crashed = asyncio.Event()
+                page.on("crash", lambda *_: crashed.set())
+                await page.expose_binding(LIVE_TWEET_BINDING, lambda source, tweets: self._deliver(timeline, tweets))
+                await page.add_init_script(LIVE_TWEET_OBSERVER_JS)
+                await navigate(page, timeline.url, "domcontentloaded", self.rate_limits)
+                logger.info(f"Live page streaming {timeline.url}")
+                backoff = 1.0
+
+                while self.running and not crashed.is_set():
+                    try:
+                        await asyncio.wait_for(crashed.wait(), self.refresh_seconds)
+                    except asyncio.TimeoutError:
+                        # The observer is re-injected into the reloaded document
+                        await reload(page, timeline.url, "domcontentloaded", self.rate_limits)
+                if crashed.is_set():
+                    logger.warning(f"Live page for {timeline.url} crashed, reopening")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Live page for {timeline.url} failed: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60.0)
+            finally:
+                if page is not None:
+                    await self.pool.close_dedicated_page(page)
+            timeline.restarts += 1
+
+    def get_stats(self) -> Dict:
+        return {
+            "running": self.running,
+            "refresh_seconds": self.refresh_seconds,
+            "timelines": {
+                key: {
+                    "url": timeline.url,
+                    "tweets": timeline.tweets,
+                    "restarts": timeline.restarts,
+                    "active": bool(timeline.task and not timeline.task.done())
+                }
+                for key, timeline in self.timelines.items()
+            }
+        }
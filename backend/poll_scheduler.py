@@ -0,0 +1,174 @@
+import heapq
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _SourceActivity:
+    """Posting rate and quorum history of one polled source"""
+    __slots__ = ("posting_rate", "quorum_score", "quorum_updated", "last_polled", "next_due", "weight",
+                 "fixed_interval", "pending_tweets")
+
+    def __init__(self, now: float, fixed_interval: Optional[float]):
+        self.posting_rate = 0.0      # EWMA of new tweets per hour
+        self.quorum_score = 0.0      # Decayed count of quorums this source contributed to
+        self.quorum_updated = now
+        self.last_polled: Optional[float] = None
+        self.next_due = now
+        self.weight = 0.0
+        self.fixed_interval = fixed_interval
+        self.pending_tweets = 0
+
+
+class AdaptivePollScheduler:
+    """Priority-queue scheduler that spends a fixed polling budget on the accounts that move tokens.
+
+    The budget is one poll per source every `budget_interval_seconds` on average. It is shared in
+    proportion to each source's weight: its recent posting rate plus `quorum_weight` times its
+    decayed history of contributing to a quorum (with a small floor so quiet accounts are still
+    sampled). Every interval is clamped to [min_interval_seconds, max_interval_seconds]. Sources
+    registered with a fixed interval (X List timelines) bypass the weighting.
+    """
+
+    def __init__(self, budget_interval_seconds: float = 30.0, min_interval_seconds: float = 10.0,
+                 max_interval_seconds: float = 1800.0, quorum_weight: float = 5.0,
+                 quorum_half_life_seconds: float = 86400.0, rate_smoothing: float = 0.3,
+                 base_weight: float = 0.05):
+        self.budget_interval_seconds = budget_interval_seconds
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+        self.quorum_weight = quorum_weight
+        self.quorum_half_life_seconds = quorum_half_life_seconds
+        self.rate_smoothing = rate_smoothing
+        self.base_weight = base_weight
+        self.sources: Dict[str, _SourceActivity] = {}
+        self.queue: List[Tuple[float, str]] = []
+        self.total_weight = 0.0
+        self.weighted_sources = 0
+        self.polls = 0
+
+    def _decayed_quorum(self, activity: _SourceActivity, now: float) -> float:
+        elapsed = now - activity.quorum_updated
+        return activity.quorum_score * 0.5 ** (elapsed / self.quorum_half_life_seconds)
+
+    def _update_weight(self, activity: _SourceActivity, now: float):
+        if activity.fixed_interval is not None:
+            return
+        weight = self.base_weight + activity.posting_rate + self.quorum_weight * self._decayed_quorum(activity, now)
+        self.total_weight += weight - activity.weight
+        activity.weight = weight
+
+    def interval(self, source: str) -> float:
+        """Seconds until this source's next poll under the current budget split"""
+        activity = self.sources[source]
+        if activity.fixed_interval is not None:
+            return activity.fixed_interval
+        budget_per_second = self.weighted_sources / self.budget_interval_seconds
+        share = activity.weight / self.total_weight if self.total_weight > 0 else 1.0 / max(self.weighted_sources, 1)
+        polls_per_second = budget_per_second * share
+        interval = 1.0 / polls_per_second if polls_per_second > 0 else self.max_interval_seconds
+        return min(self.max_interval_seconds, max(self.min_interval_seconds, interval))
+
+    def _schedule(self, source: str, due: float):
+        self.sources[source].next_due = due
+        heapq.heappush(self.queue, (due, source))
+
+    def sync(self, sources: Iterable[str], fixed_intervals: Optional[Dict[str, float]] = None, now: Optional[float] = None):
+        """Make the scheduled sources match `sources`; new ones are due immediately"""
+        fixed_intervals = fixed_intervals or {}
+        wanted = set(sources) | set(fixed_intervals)
+        self.apply_diff([source for source in wanted if source not in self.sources],
+                        [source for source in self.sources if source not in wanted], fixed_intervals, now)
+
+    def apply_diff(self, added: Iterable[str], removed: Iterable[str],
+                   fixed_intervals: Optional[Dict[str, float]] = None, now: Optional[float] = None):
+        """Add and drop individual sources without a full sync; added ones are due immediately"""
+        now = time.monotonic() if now is None else now
+        fixed_intervals = fixed_intervals or {}
+        for source in removed:
+            activity = self.sources.pop(source, None)
+            if activity is not None and activity.fixed_interval is None:
+                self.total_weight -= activity.weight
+                self.weighted_sources -= 1
+        for source in added:
+            if source not in self.sources:
+                activity = self.sources[source] = _SourceActivity(now, fixed_intervals.get(source))
+                if activity.fixed_interval is None:
+                    self.weighted_sources += 1
+                self._update_weight(activity, now)
+                self._schedule(source, now)
+
+    def due(self, limit: Optional[int] = None, now: Optional[float] = None) -> List[str]:
+        """Pop the sources whose poll time has come, most overdue first"""
+        now = time.monotonic() if now is None else now
+        ready = []
+        while self.queue and self.queue[0][0] <= now and (limit is None or len(ready) < limit):
+            due, source = heapq.heappop(self.queue)
+            activity = self.sources.get(source)
+            # Skip heap entries for removed or rescheduled sources
+            if activity is None or activity.next_due != due:
+                continue
+            activity.next_due = float('inf')
+            ready.append(source)
+        return ready
+
+    def seconds_until_next(self, now: Optional[float] = None) -> Optional[float]:
+        now = time.monotonic() if now is None else now
+        while self.queue:
+            due, source = self.queue[0]
+            activity = self.sources.get(source)
+            if activity is not None and activity.next_due == due:
+                return max(0.0, due - now)
+            heapq.heappop(self.queue)
+        return None
+
+    def record_tweets(self, source: str, new_tweets: int):
+        """Count new tweets seen for a source during its current poll"""
+        activity = self.sources.get(source)
+        if activity is not None:
+            activity.pending_tweets += new_tweets
+
+    def record_poll(self, source: str, now: Optional[float] = None):
+        """Update a source's posting rate from the poll that just finished and schedule its next one"""
+        now = time.monotonic() if now is None else now
+        activity = self.sources.get(source)
+        if activity is None:
+            return
+        self.polls += 1
+        if activity.last_polled is not None:
+            hours = max(now - activity.last_polled, 1.0) / 3600
+            activity.posting_rate += self.rate_smoothing * (activity.pending_tweets / hours - activity.posting_rate)
+        activity.pending_tweets = 0
+        activity.last_polled = now
+        self._update_weight(activity, now)
+        self._schedule(source, now + self.interval(source))
+
+    def record_quorum(self, source: str, now: Optional[float] = None):
+        """Credit a source for contributing to a token's quorum"""
+        now = time.monotonic() if now is None else now
+        activity = self.sources.get(source)
+        if activity is None:
+            return
+        activity.quorum_score = self._decayed_quorum(activity, now) + 1.0
+        activity.quorum_updated = now
+        self._update_weight(activity, now)
+
+    def get_stats(self, top: int = 10) -> Dict:
+        weighted = sorted(
+            (source for source, activity in self.sources.items() if activity.fixed_interval is None),
+            key=lambda source: self.sources[source].weight, reverse=True
+        )
+        return {
+            "sources": len(self.sources),
+            "budget_interval_seconds": self.budget_interval_seconds,
+            "min_interval_seconds": self.min_interval_seconds,
+            "max_interval_seconds": self.max_interval_seconds,
+            "polls": self.polls,
+            "most_active": [
+                {"source": source, "interval_seconds": round(self.interval(source), 1),
+                 "posting_rate": round(self.sources[source].posting_rate, 2)}
+                for source in weighted[:top]
+            ]
+        }
@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Starting requests per second per upstream domain (anything else uses the default rate); the
+# adaptive limiters then move each rate between a tenth and `max_rate_multiplier` times this
+DEFAULT_DOMAIN_RATES = {
+    "x.com": 2.0,
+    "twitter.com": 1.0,
+    "nitter.net": 1.0,
+    "nitter.it": 1.0,
+    "client-api-v1.pump.fun": 0.5,
+    "api.pump.fun": 0.5,
+}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class DomainRateLimiter:
+    """Adaptive (AIMD) limiter for one domain.
+
+    A token bucket paces requests at `rate` per second with bursts of up to `burst`, and a
+    concurrency window caps how many slot() requests are in flight. Every success grows the window
+    by about one request per window and the rate by `rate_increase` of its starting value; a 429,
+    5xx or timeout multiplies both by `decrease_factor` (at most once per `backoff_interval_seconds`,
+    so one burst of failures counts once), and a Retry-After pauses the domain for that long.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, initial_concurrency: int = 4, max_concurrency: int = 32,
+                 max_rate_multiplier: float = 4.0, rate_increase: float = 0.05, decrease_factor: float = 0.5,
+                 backoff_interval_seconds: float = 1.0):
+        self.base_rate = rate
+        self.rate = rate
+        self.min_rate = rate / 10
+        self.max_rate = rate * max_rate_multiplier
+        self.rate_increase = rate_increase
+        self.burst = burst
+        self.concurrency = float(initial_concurrency)
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.backoff_interval_seconds = backoff_interval_seconds
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.last_backoff = float("-inf")
+        self.in_flight = 0
+        self.successes = 0
+        self.throttled = 0
+        self.failures = 0
+        self.lock = asyncio.Lock()
+        self.slot_freed = asyncio.Event()
+
+    async def acquire(self):
+        # Waiters queue on the lock, so requests are released in arrival order
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def open_slot(self):
+        """Wait for room in the concurrency window, then for a token"""
+        while self.in_flight >= int(self.concurrency):
+            self.slot_freed.clear()
+            await self.slot_freed.wait()
+        self.in_flight += 1
+        try:
+            await self.acquire()
+        except BaseException:
+            self.close_slot()
+            raise
+
+    def close_slot(self):
+        self.in_flight -= 1
+        self.slot_freed.set()
+
+    def record_success(self):
+        self.successes += 1
+        self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+        self.rate = min(self.max_rate, self.rate + self.rate_increase * self.base_rate)
+
+    def record_congestion(self, status: Optional[int] = None, retry_after: Optional[float] = None):
+        """A 429, 5xx or timeout (status None): back off, and pause for Retry-After if given"""
+        now = time.monotonic()
+        if status == 429:
+            self.throttled += 1
+        else:
+            self.failures += 1
+        if retry_after:
+            self.paused_until = max(self.paused_until, now + retry_after)
+        if now - self.last_backoff >= self.backoff_interval_seconds:
+            self.last_backoff = now
+            self.concurrency = max(1.0, self.concurrency * self.decrease_factor)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+
+    def get_stats(self) -> Dict:
+        return {
+            "rate": round(self.rate, 3),
+            "concurrency": int(self.concurrency),
+            "in_flight": self.in_flight,
+            "successes": self.successes,
+            "throttled": self.throttled,
+            "failures": self.failures,
+            "paused_seconds": round(max(0.0, self.paused_until - time.monotonic()), 1)
+        }
+
+
+class DomainSlot:
+    """One in-flight request to a domain; report() its status so the limiter can adapt"""
+
+    def __init__(self, limiter: DomainRateLimiter):
+        self.limiter = limiter
+        self.reported = False
+
+    def report(self, status: int, retry_after: Optional[str] = None):
+        self.reported = True
+        if status == 429 or status >= 500:
+            self.limiter.record_congestion(status, parse_retry_after(retry_after))
+        else:
+            # Anything else means the host answered normally, even if the answer was a 404
+            self.limiter.record_success()
+
+
+class DomainRateLimits:
+    """Per-domain adaptive limiters, replacing fixed sleeps between requests"""
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None, default_rate: float = 5.0, burst: int = 2,
+                 **limiter_options):
+        self.rates = dict(DEFAULT_DOMAIN_RATES if rates is None else rates)
+        self.default_rate = default_rate
+        self.burst = burst
+        self.limiter_options = limiter_options
+        self.limiters: Dict[str, DomainRateLimiter] = {}
+
+    @staticmethod
+    def domain(url_or_domain: str) -> str:
+        """Domain of a URL (or the argument itself if it already is one), without a www. prefix"""
+        host = urlsplit(url_or_domain).hostname if "://" in url_or_domain else url_or_domain
+        host = (host or "").lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def limiter(self, url_or_domain: str) -> DomainRateLimiter:
+        domain = self.domain(url_or_domain)
+        limiter = self.limiters.get(domain)
+        if limiter is None:
+            limiter = self.limiters[domain] = DomainRateLimiter(
+                self.rates.get(domain, self.default_rate), self.burst, **self.limiter_options
+            )
+        return limiter
+
+    async def acquire(self, url_or_domain: str):
+        """Wait until a request to this URL's domain is allowed (rate and Retry-After only)"""
+        await self.limiter(url_or_domain).acquire()
+
+    @asynccontextmanager
+    async def slot(self, url_or_domain: str) -> AsyncIterator[DomainSlot]:
+        """Hold a concurrency slot for one request. Leaving with an exception before report() counts
+        as a timeout/connection failure; leaving normally without report() counts as a success."""
+        limiter = self.limiter(url_or_domain)
+        await limiter.open_slot()
+        slot = DomainSlot(limiter)
+        try:
+            yield slot
+        except Exception:
+            if not slot.reported:
+                limiter.record_congestion()
+            raise
+        else:
+            if not slot.reported:
+                limiter.record_success()
+        finally:
+            limiter.close_slot()
+
+    def get_stats(self) -> Dict:
+        return {domain: limiter.get_stats() for domain, limiter in self.limiters.items()}
+
+
+class PollingEngine:
+    """Polls many accounts concurrently with a bounded worker count and a per-account timeout.
+
+    Results are yielded as each account completes, so callers can process mentions while the rest
+    of the cycle is still running; cycle wall time scales with accounts / max_concurrency.
+    """
+
+    def __init__(self, max_concurrency: int = 10, account_timeout_seconds: float = 60.0):
+        self.max_concurrency = max_concurrency
+        self.account_timeout_seconds = account_timeout_seconds
+        self.last_cycle_seconds: Optional[float] = None
+        self.timeouts = 0
+        self.errors = 0
+
+    async def poll_all(self, accounts: List[str],
+                       poll: Callable[[str], Awaitable[List[Dict]]]) -> AsyncIterator[Tuple[str, List[Dict]]]:
+        """Run poll(account) for every account, yielding (account, mentions) in completion order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = time.monotonic()
+
+        async def run_one(account: str) -> Tuple[str, List[Dict]]:
+            async with semaphore:
+                try:
+                    return account, await asyncio.wait_for(poll(account), self.account_timeout_seconds)
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    logger.warning(f"Polling @{account} timed out after {self.account_timeout_seconds}s")
+                except Exception as e:
+                    self.errors += 1
+                    logger.error(f"Error monitoring @{account}: {e}")
+                return account, []
+
+        tasks = [asyncio.create_task(run_one(account)) for account in accounts]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Don't leave polls running if the consumer stops early
+            for task in tasks:
+                task.cancel()
+            self.last_cycle_seconds = time.monotonic() - started
+
+    def get_stats(self) -> Dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "account_timeout_seconds": self.account_timeout_seconds,
+            "last_cycle_seconds": round(self.last_cycle_seconds, 2) if self.last_cycle_seconds is not None else None,
+            "timeouts": self.timeouts,
+            "errors": self.errors
+        }
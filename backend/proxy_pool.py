@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, List, Optional
+import aiohttp
+from http_clients import BROWSER_HEADERS
+from polling_engine import DomainRateLimits, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean the exit IP is being refused rather than the request being bad
+BAN_STATUSES = {403, 429}
+
+
+def parse_proxy_list(value: Optional[str]) -> List[Optional[str]]:
+    """Proxies from a comma-separated config value; "direct" (or an empty value) means no proxy"""
+    proxies = [item.strip() for item in (value or "").split(",") if item.strip()]
+    return [None if proxy.lower() == "direct" else proxy for proxy in proxies] or [None]
+
+
+class ProxyEndpoint:
+    """One exit route (a proxy URL or None for direct) with its own pooled session and health score"""
+
+    def __init__(self, url: Optional[str], max_concurrency: int, rate_limits: DomainRateLimits):
+        self.url = url
+        self.max_concurrency = max_concurrency
+        self.rate_limits = rate_limits
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.in_flight = 0
+        self.latency = 1.0
+        self.error_rate = 0.0
+        self.cooldown_until = 0.0
+        self.cooldown_seconds = 0.0
+        self.requests = 0
+        self.bans = 0
+
+    @property
+    def name(self) -> str:
+        return self.url or "direct"
+
+    def available(self, now: float) -> bool:
+        return now >= self.cooldown_until and self.in_flight < self.max_concurrency
+
+    def weight(self) -> float:
+        """Selection weight: fast, reliable exits get proportionally more traffic"""
+        return max(1.0 - self.error_rate, 0.02) / (self.latency + 0.25)
+
+
+class ProxyPool:
+    """Health-scored pool of exit routes for the scrape path.
+
+    Each proxy gets its own keep-alive connector, its own per-domain rate limits and a concurrency
+    cap, so scrape throughput grows with the number of proxies. Requests pick a proxy at random,
+    weighted by its smoothed latency and error rate. A 403/429 puts the proxy on a cool-down that
+    doubles with every consecutive ban (honouring Retry-After), and the request moves on to the next
+    best proxy.
+    """
+
+    def __init__(self, proxies: Optional[List[Optional[str]]] = None, rate_limits: Optional[DomainRateLimits] = None,
+                 max_concurrency_per_proxy: int = 4, ban_cooldown_seconds: float = 120.0,
+                 max_cooldown_seconds: float = 3600.0, timeout_seconds: float = 15.0, max_attempts: int = 2,
+                 smoothing: float = 0.2, trace_configs: Optional[List[aiohttp.TraceConfig]] = None):
+        self.rate_limits = rate_limits or DomainRateLimits()
+        self.max_concurrency_per_proxy = max_concurrency_per_proxy
+        self.ban_cooldown_seconds = ban_cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self.timeout_seconds = timeout_seconds
+        self.max_attempts = max_attempts
+        self.smoothing = smoothing
+        self.trace_configs = trace_configs or []
+        self.endpoints: List[ProxyEndpoint] = []
+        self.slot_freed = asyncio.Event()
+        self.exhausted = 0
+        self.set_proxies(proxies or [None])
+
+    def set_proxies(self, proxies: List[Optional[str]]) -> List[ProxyEndpoint]:
+        """Replace the proxy list, keeping the state of proxies that stay; returns the dropped endpoints"""
+        current = {endpoint.url: endpoint for endpoint in self.endpoints}
+        self.endpoints = [
+            current.pop(url, None) or ProxyEndpoint(
+                # Direct traffic shares the monitor's domain limits; each proxy is its own exit IP
+                url, self.max_concurrency_per_proxy, self.rate_limits if url is None else DomainRateLimits()
+            )
+            for url in dict.fromkeys(proxies or [None])
+        ]
+        return list(current.values())
+
+    async def update_proxies(self, proxies: List[Optional[str]]):
+        for endpoint in self.set_proxies(proxies):
+            await self._close_endpoint(endpoint)
+        logger.info(f"Proxy pool: {', '.join(endpoint.name for endpoint in self.endpoints)}")
+
+    def _session(self, endpoint: ProxyEndpoint) -> aiohttp.ClientSession:
+        if endpoint.session is None or endpoint.session.closed:
+            endpoint.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=endpoint.max_concurrency, ttl_dns_cache=300, keepalive_timeout=30),
+                headers=BROWSER_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+                trace_configs=self.trace_configs
+            )
+        return endpoint.session
+
+    async def _checkout(self, exclude: List[ProxyEndpoint]) -> Optional[ProxyEndpoint]:
+        """Weighted pick among proxies with a free slot; waits while every healthy proxy is busy"""
+        while True:
+            now = time.monotonic()
+            candidates = [endpoint for endpoint in self.endpoints if endpoint not in exclude]
+            if not any(now >= endpoint.cooldown_until for endpoint in candidates):
+                return None
+            available = [endpoint for endpoint in candidates if endpoint.available(now)]
+            if available:
+                endpoint = random.choices(available, weights=[endpoint.weight() for endpoint in available])[0]
+                endpoint.in_flight += 1
+                return endpoint
+            self.slot_freed.clear()
+            await self.slot_freed.wait()
+
+    def _release(self, endpoint: ProxyEndpoint):
+        endpoint.in_flight -= 1
+        self.slot_freed.set()
+
+    def _record(self, endpoint: ProxyEndpoint, ok: bool, seconds: Optional[float] = None):
+        alpha = self.smoothing
+        endpoint.requests += 1
+        endpoint.error_rate += alpha * ((0.0 if ok else 1.0) - endpoint.error_rate)
+        if seconds is not None:
+            endpoint.latency += alpha * (seconds - endpoint.latency)
+
+    def _ban(self, endpoint: ProxyEndpoint, retry_after: Optional[str]):
+        endpoint.bans += 1
+        endpoint.cooldown_seconds = min(
+            max(2 * endpoint.cooldown_seconds, self.ban_cooldown_seconds), self.max_cooldown_seconds
+        )
+        cooldown = max(endpoint.cooldown_seconds, parse_retry_after(retry_after) or 0.0)
+        endpoint.cooldown_until = time.monotonic() + cooldown
+        logger.warning(f"Proxy {endpoint.name} refused, cooling down for {cooldown:.0f}s")
+
+    async def fetch(self, url: str) -> bytes:
+        """GET a page through the healthiest available proxies; raises if none of them returns it"""
+        tried: List[ProxyEndpoint] = []
+        errors = []
+        while len(tried) < self.max_attempts:
+            endpoint = await self._checkout(tried)
+            if endpoint is None:
+                break
+            tried.append(endpoint)
+            try:
+                async with endpoint.rate_limits.slot(url) as slot:
+                    started = time.monotonic()
+                    async with self._session(endpoint).get(url, proxy=endpoint.url) as response:
+                        slot.report(response.status, response.headers.get("Retry-After"))
+                        if response.status == 200:
+                            body = await response.read()
+                            self._record(endpoint, True, time.monotonic() - started)
+                            endpoint.cooldown_seconds = 0.0
+                            return body
+                        self._record(endpoint, False, time.monotonic() - started)
+                        if response.status in BAN_STATUSES:
+                            self._ban(endpoint, response.headers.get("Retry-After"))
+                        errors.append(f"{endpoint.name}: HTTP {response.status}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._record(endpoint, False)
+                errors.append(f"{endpoint.name}: {type(e).__name__}")
+            finally:
+                self._release(endpoint)
+
+        self.exhausted += 1
+        raise RuntimeError(f"no proxy returned {url}: {'; '.join(errors) or 'all proxies cooling down'}")
+
+    async def _close_endpoint(self, endpoint: ProxyEndpoint):
+        if endpoint.session is not None:
+            try:
+                await endpoint.session.close()
+            except Exception as e:
+                logger.error(f"Error closing session for proxy {endpoint.name}: {e}")
+            endpoint.session = None
+
+    async def close(self):
+        for endpoint in self.endpoints:
+            await self._close_endpoint(endpoint)
+
+    def get_stats(self) -> Dict:
+        now = time.monotonic()
+        return {
+            "exhausted": self.exhausted,
+            "proxies": {
+                endpoint.name: {
+                    "requests": endpoint.requests,
+                    "in_flight": endpoint.in_flight,
+                    "latency_ms": round(1000 * endpoint.latency, 1),
+                    "error_rate": round(endpoint.error_rate, 3),
+                    "bans": endpoint.bans,
+                    "cooldown_seconds": round(max(0.0, endpoint.cooldown_until - now), 1)
+                }
+                for endpoint in self.endpoints
+            }
+        }
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Awaitable, Dict, List, Optional, Set, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+logger = logging.getLogger(__name__)
+
+
+class _TokenWindow:
+    """Time-bucketed mentions of one token"""
+    __slots__ = ("buckets", "account_counts")
+
+    def __init__(self):
+        # bucket index -> [(mentioned_at, account, tweet_url), ...]
+        self.buckets: Dict[int, List[Tuple[datetime, str, str]]] = {}
+        # account -> number of mentions still inside the window
+        self.account_counts: Dict[str, int] = {}
+
+
+class QuorumEngine:
+    """In-memory sliding-window quorum: distinct accounts mentioning each token in the last hour.
+
+    Mentions are grouped into fixed-size time buckets per token; whole buckets expire as the window
+    slides, so counting distinct accounts never touches Mongo. reset() forgets a token once its
+    quorum has been acted on (the in-memory equivalent of marking its mentions processed).
+    """
+
+    def __init__(self, window: timedelta = timedelta(hours=1), bucket_seconds: int = 60):
+        self.window = window
+        self.bucket_seconds = bucket_seconds
+        self.tokens: Dict[str, _TokenWindow] = {}
+        self.loaded = False
+
+    async def load(self, db: AsyncIOMotorDatabase) -> int:
+        """Warm the windows with the unprocessed mentions of the last window (once, at startup)"""
+        if self.loaded:
+            return 0
+        count = 0
+        try:
+            window_start = datetime.now(timezone.utc) - self.window
+            async for mention in db.token_mentions.find({
+                "mentioned_at": {"$gte": window_start},
+                "processed": {"$ne": True}
+            }):
+                self.add(mention['token_name'], mention['account_username'],
+                         mention['mentioned_at'], mention.get('tweet_url', ''))
+                count += 1
+            self.loaded = True
+            logger.info(f"Loaded {count} recent mentions into the quorum engine")
+        except Exception as e:
+            logger.error(f"Error loading recent mentions: {e}")
+        return count
+
+    @staticmethod
+    def _as_utc(moment: datetime) -> datetime:
+        return moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment
+
+    def _bucket(self, moment: datetime) -> int:
+        return int(moment.timestamp()) // self.bucket_seconds
+
+    def _expire(self, token_window: _TokenWindow, now: datetime):
+        oldest_allowed = self._bucket(now - self.window)
+        for bucket in [b for b in token_window.buckets if b < oldest_allowed]:
+            for _, account, _ in token_window.buckets.pop(bucket):
+                remaining = token_window.account_counts[account] - 1
+                if remaining:
+                    token_window.account_counts[account] = remaining
+                else:
+                    del token_window.account_counts[account]
+
+    def add(self, token_name: str, account_username: str, mentioned_at: Optional[datetime] = None,
+            tweet_url: str = '', now: Optional[datetime] = None) -> int:
+        """Record a mention and return the number of distinct accounts in the token's window"""
+        now = now or datetime.now(timezone.utc)
+        mentioned_at = self._as_utc(mentioned_at) if mentioned_at else now
+        token_name = token_name.upper()
+
+        token_window = self.tokens.get(token_name)
+        if token_window is None:
+            token_window = self.tokens[token_name] = _TokenWindow()
+        self._expire(token_window, now)
+
+        # Mentions that are already outside the window never count
+        if mentioned_at >= now - self.window:
+            token_window.buckets.setdefault(self._bucket(mentioned_at), []).append(
+                (mentioned_at, account_username, tweet_url)
+            )
+            token_window.account_counts[account_username] = token_window.account_counts.get(account_username, 0) + 1
+
+        return len(token_window.account_counts)
+
+    def distinct_accounts(self, token_name: str, now: Optional[datetime] = None) -> Set[str]:
+        token_window = self.tokens.get(token_name.upper())
+        if token_window is None:
+            return set()
+        self._expire(token_window, now or datetime.now(timezone.utc))
+        return set(token_window.account_counts)
+
+    def mentions(self, token_name: str, now: Optional[datetime] = None) -> List[Tuple[datetime, str, str]]:
+        """Mentions of a token inside the window as (mentioned_at, account, tweet_url), oldest first"""
+        token_window = self.tokens.get(token_name.upper())
+        if token_window is None:
+            return []
+        self._expire(token_window, now or datetime.now(timezone.utc))
+        return sorted(mention for bucket in token_window.buckets.values() for mention in bucket)
+
+    def reset(self, token_name: str):
+        """Forget a token after its quorum fired"""
+        self.tokens.pop(token_name.upper(), None)
+
+    def prune(self, now: Optional[datetime] = None) -> int:
+        """Expire old buckets everywhere and drop tokens with no mentions left; returns tokens dropped"""
+        now = now or datetime.now(timezone.utc)
+        idle = []
+        for token_name, token_window in self.tokens.items():
+            self._expire(token_window, now)
+            if not token_window.account_counts:
+                idle.append(token_name)
+        for token_name in idle:
+            del self.tokens[token_name]
+        return len(idle)
+
+    def get_stats(self) -> Dict:
+        return {
+            "tracked_tokens": len(self.tokens),
+            "window_seconds": int(self.window.total_seconds()),
+            "bucket_seconds": self.bucket_seconds
+        }
+
+
+# Shared by every monitor, so mentions from any of them count toward the same quorum
+shared_quorum = QuorumEngine(window=timedelta(hours=1))
+
+
+class BackgroundWrites:
+    """Fire-and-forget database writes that stay referenced until done and log their failures"""
+
+    def __init__(self):
+        self.tasks: Set[asyncio.Task] = set()
+
+    def submit(self, write: Awaitable, description: str):
+        async def run():
+            try:
+                await write
+            except Exception as e:
+                logger.error(f"Background write failed ({description}): {e}")
+
+        task = asyncio.create_task(run())
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def drain(self):
+        """Wait for every pending write"""
+        if self.tasks:
+            await asyncio.gather(*list(self.tasks), return_exceptions=True)
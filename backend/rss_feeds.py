@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+import aiohttp
+from polling_engine import DomainRateLimits
+
+logger = logging.getLogger(__name__)
+
+# Feed mirrors in preference order; {account} is the username without '@'
+RSS_MIRRORS = [
+    "https://nitter.net/{account}/rss",
+    "https://nitter.it/{account}/rss",
+    "https://twitter.com/{account}/rss",  # May not work
+]
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one mirror.
+
+    After `failure_threshold` failures in a row the mirror is skipped for `open_seconds`. Once that
+    passes a single trial request is let through; if it fails too the breaker reopens for twice as
+    long (up to `max_open_seconds`), if it succeeds the mirror is healthy again.
+    """
+
+    def __init__(self, failure_threshold: int = 3, open_seconds: float = 30.0, max_open_seconds: float = 600.0):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.backoff = open_seconds
+        self.failures = 0
+        self.opened_until = 0.0
+        self.trips = 0
+
+    def state(self, now: Optional[float] = None) -> str:
+        now = time.monotonic() if now is None else now
+        if self.failures < self.failure_threshold:
+            return "closed"
+        return "open" if now < self.opened_until else "half_open"
+
+    def allow(self, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        state = self.state(now)
+        if state == "half_open":
+            # Let exactly one trial through; everyone else waits out another window
+            self.opened_until = now + self.backoff
+        return state != "open"
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_until = 0.0
+        self.backoff = self.open_seconds
+
+    def record_failure(self, now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        self.failures += 1
+        if self.failures == self.failure_threshold:
+            self.trips += 1
+            self.opened_until = now + self.backoff
+        elif self.failures > self.failure_threshold:
+            # The half-open trial failed
+            self.backoff = min(2 * self.backoff, self.max_open_seconds)
+            self.opened_until = now + self.backoff
+
+
+class RssFeedFetcher:
+    """Fetches an account's RSS feed with conditional GETs, racing the healthy mirrors.
+
+    ETag/Last-Modified are remembered per account and mirror once the caller commit()s a processed
+    feed, so a feed that hasn't changed since the last poll costs a 304 and no parsing. Up to `race_width` healthy mirrors are queried at
+    once and the first good answer wins; mirrors that keep failing are skipped by their circuit
+    breaker instead of costing a timeout on every poll.
+    """
+
+    def __init__(self, rate_limits: Optional[DomainRateLimits] = None, mirrors: Optional[List[str]] = None, race_width: int = 2,
+                 failure_threshold: int = 3, open_seconds: float = 30.0, max_open_seconds: float = 600.0):
+        self.rate_limits = rate_limits or DomainRateLimits()
+        self.mirrors = list(RSS_MIRRORS if mirrors is None else mirrors)
+        self.race_width = race_width
+        self.breakers: Dict[str, CircuitBreaker] = {
+            mirror: CircuitBreaker(failure_threshold, open_seconds, max_open_seconds) for mirror in self.mirrors
+        }
+        self.validators: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self.fetched = 0
+        self.not_modified = 0
+        self.failures: Dict[str, int] = {}
+        self.skipped = 0
+
+    @staticmethod
+    def _key(account: str) -> str:
+        return account.lstrip('@').lower()
+
+    async def _get(self, session: aiohttp.ClientSession, mirror: str,
+                   account: str) -> Tuple[str, Optional[bytes], Dict[str, str]]:
+        url = mirror.format(account=account.lstrip('@'))
+        validator_key = (self._key(account), mirror)
+        breaker = self.breakers[mirror]
+        try:
+            async with self.rate_limits.slot(url) as slot, \
+                    session.get(url, headers=self.validators.get(validator_key)) as response:
+                slot.report(response.status, response.headers.get('Retry-After'))
+                if response.status == 304:
+                    breaker.record_success()
+                    self.not_modified += 1
+                    return mirror, None, {}
+                if response.status == 200:
+                    content = await response.read()
+                    validators = {}
+                    if response.headers.get('ETag'):
+                        validators['If-None-Match'] = response.headers['ETag']
+                    if response.headers.get('Last-Modified'):
+                        validators['If-Modified-Since'] = response.headers['Last-Modified']
+                    breaker.record_success()
+                    self.fetched += 1
+                    return mirror, content, validators
+                if response.status != 429 and response.status < 500:
+                    # The mirror is up, it just has no feed for this account
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+                error = f"HTTP {response.status}"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            breaker.record_failure()
+            error = type(e).__name__
+        self.failures[mirror] = self.failures.get(mirror, 0) + 1
+        raise RuntimeError(f"{url}: {error}")
+
+    async def fetch(self, session: aiohttp.ClientSession, account: str) -> Tuple[str, Optional[bytes], Dict[str, str]]:
+        """(mirror, raw feed, validators) from the first mirror that answers; the feed is None when unchanged (304).
+
+        Pass the validators to commit() once the feed has been processed, so a failed poll is refetched.
+        """
+        remaining = iter(self.mirrors)
+        errors = []
+        while True:
+            batch = self._next_batch(remaining)
+            if not batch:
+                break
+            tasks = [asyncio.create_task(self._get(session, mirror, account)) for mirror in batch]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        return await next_done
+                    except Exception as e:
+                        errors.append(str(e))
+            finally:
+                for task in tasks:
+                    if task.done() and not task.cancelled():
+                        task.exception()  # Mark losing failures as retrieved
+                    else:
+                        task.cancel()
+        raise RuntimeError(f"no RSS mirror answered for {account}: {'; '.join(errors) or 'all mirrors open'}")
+
+    def _next_batch(self, remaining: Iterator[str]) -> List[str]:
+        """Up to race_width mirrors whose breakers let a request through.
+
+        Breakers are only asked when their batch is about to run, so a half-open mirror keeps its
+        trial request for a poll that actually reaches it.
+        """
+        batch = []
+        for mirror in remaining:
+            if self.breakers[mirror].allow():
+                batch.append(mirror)
+                if len(batch) == self.race_width:
+                    break
+            else:
+                self.skipped += 1
+        return batch
+
+    def commit(self, account: str, mirror: str, validators: Dict[str, str]):
+        """Make the next poll of this account and mirror conditional on the feed just processed"""
+        if validators:
+            self.validators[(self._key(account), mirror)] = validators
+
+    def get_stats(self) -> Dict:
+        return {
+            "fetched": self.fetched,
+            "not_modified": self.not_modified,
+            "skipped_open_mirrors": self.skipped,
+            "failures": self.failures,
+            "mirrors": {
+                mirror: {"state": breaker.state(), "trips": breaker.trips}
+                for mirror, breaker in self.breakers.items()
+            }
+        }
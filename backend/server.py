@@ -13,9 +13,15 @@ import re
 from pathlib import Path
 import random
 from x_monitor_realtime import RealTimeXMonitor
+from token_extractor import shared_extraction_pool
+from token_dictionaries import TokenDictionaryStore
+from quorum_engine import QuorumEngine, BackgroundWrites, shared_quorum
+from token_index import token_key, ensure_token_indexes
+from ca_registry import known_ca_registry
+from proxy_pool import parse_proxy_list
 from github_integration import GitHubIntegration
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime, timezone
 from enum import Enum
 import uuid
@@ -108,13 +114,28 @@ class AppVersion(BaseModel):
 
 class MonitoringConfig(BaseModel):
     alert_threshold: int = 2
-    check_interval_seconds: int = 30
+    check_interval_seconds: int = 30  # Polling budget: average seconds between polls of one account
+    min_poll_interval_seconds: int = 10
+    max_poll_interval_seconds: int = 1800
+    max_concurrent_accounts: int = 10
+    account_timeout_seconds: int = 60
+    navigation_mode: Literal["lean", "full", "network"] = "lean"
+    hot_accounts: List[str] = []
+    x_list_ids: List[str] = []
+    fetch_mode: Literal["hedged", "sequential"] = "hedged"
+    hedge_delay_seconds: float = 1.5
+    scrape_proxies: Optional[List[str]] = None  # None keeps the current proxies (SCRAPE_PROXIES at startup)
     enable_browser_monitoring: bool = True
     enable_rss_monitoring: bool = True
     enable_scraping_monitoring: bool = True
     filter_old_tokens: bool = True
     filter_tokens_with_ca: bool = True
 
+class DictionaryUpdate(BaseModel):
+    words: Optional[List[str]] = None  # Replace the whole dictionary
+    add: List[str] = []
+    remove: List[str] = []
+
 class GitHubConfig(BaseModel):
     github_token: Optional[str] = None
     repository_name: str = "tweet-tracker-backups"
@@ -122,15 +143,13 @@ class GitHubConfig(BaseModel):
     backup_interval_hours: int = 24
 
 class XAccountMonitor:
-    def __init__(self):
+    def __init__(self, quorum: Optional[QuorumEngine] = None):
         self.monitored_accounts = []
         self.is_monitoring = False
-        self.known_tokens_with_ca = set()  # Track tokens that already have CAs
-        self.token_patterns = [
-            r'\$[A-Z]{2,10}\b',  # $TOKEN format
-            r'\b[A-Z]{2,10}(?:\s+(?:coin|token|gem|moon|pump|lambo))\b',  # TOKEN coin/token
-            r'\b(?:DOGE|PEPE|SHIB|BONK|WIF|FLOKI|MEME|APE|WOJAK|TURBO|BRETT|POPCAT|DEGEN|MEW|BOBO|PEPE2|LADYS|BABYDOGE|DOGELON|AKITA|KISHU|SAFEMOON|HOGE|NFD|ELON|MILADY|BEN|ANDY|BART|MATT|TOSHI|HOPPY|MUMU|BENJI|POKEMON|SPURDO|BODEN|MAGA|SLERF|BOOK|MYRO|PONKE)\b',  # Common meme coins
-        ]
+        self.known_tokens_with_ca = known_ca_registry  # Track tokens that already have CAs
+        self.extraction_pool = shared_extraction_pool  # Same extraction/filtering as RealTimeXMonitor
+        self.quorum = quorum or shared_quorum  # Distinct accounts per token over the last hour, shared by both monitors
+        self.background_writes = BackgroundWrites()
         
     async def start_monitoring(self):
         """Start monitoring X accounts for token mentions"""
@@ -143,6 +162,9 @@ class XAccountMonitor:
         
         logger.info(f"Monitoring {len(self.monitored_accounts)} X accounts")
         
+        # Restore the last hour of unprocessed mentions into the quorum engine (skipped if the other monitor did)
+        await self.quorum.load(db)
+        
         # Start monitoring loop
         asyncio.create_task(self.monitoring_loop())
         
@@ -190,80 +212,71 @@ class XAccountMonitor:
             
             await self.process_token_mention(mention)
             
-    async def process_token_mention(self, mention: TokenMention):
-        """Process a found token mention"""
+    async def process_token_mention(self, mention: TokenMention) -> bool:
+        """Process a found token mention; returns False if the filter rejected it"""
+        accepted = True
         try:
-            # Store in database
-            mention_dict = mention.dict()
-            await db.token_mentions.insert_one(mention_dict)
-            
-            logger.info(f"Found token mention: {mention.token_name} by @{mention.account_username}")
+            # Stopwords, established tokens and tokens with known CAs are stored but never counted
+            accepted = self.extraction_pool.extractor.accepts(mention.token_name.upper().strip(), self.known_tokens_with_ca)
+            if accepted:
+                logger.info(f"Found token mention: {mention.token_name} by @{mention.account_username}")
+                
+                # Count the mention in memory and check for name alerts
+                self.quorum.add(mention.token_name, mention.account_username, mention.mentioned_at, mention.tweet_url)
+                alert_created = await self.check_for_name_alerts(mention.token_name)
+            else:
+                logger.info(f"Filtered token mention: {mention.token_name} by @{mention.account_username}")
+                alert_created = False
             
-            # Check for name alerts
-            await self.check_for_name_alerts(mention.token_name)
+            # Store in database without holding up alerting
+            mention_dict = mention.dict()
+            mention_dict['token_key'] = token_key(mention.token_name)
+            mention_dict['processed'] = mention.processed or alert_created or not accepted
+            self.background_writes.submit(db.token_mentions.insert_one(mention_dict), "token mention")
             
         except Exception as e:
             logger.error(f"Error processing token mention: {e}")
             
+        return accepted
+            
     async def check_token_has_ca(self, token_name: str) -> bool:
         """Check if a token already has a Contract Address"""
-        try:
-            # Check in CA alerts collection
-            ca_exists = await db.ca_alerts.find_one({
-                "token_name": {"$regex": f"^{token_name}$", "$options": "i"}
-            })
-            
-            if ca_exists:
-                logger.info(f"Token {token_name} already has CA - filtering from Name Alerts")
-                return True
-                
-            # Also check known tokens with CAs
-            if token_name.upper() in self.known_tokens_with_ca:
-                logger.info(f"Token {token_name} is in known tokens with CA - filtering from Name Alerts")
-                return True
-                
-            return False
+        # The registry holds every CA alert, so this never needs the database
+        if token_name in self.known_tokens_with_ca:
+            logger.info(f"Token {token_name} is in known tokens with CA - filtering from Name Alerts")
+            return True
             
-        except Exception as e:
-            logger.error(f"Error checking if token has CA: {e}")
-            return False  # If unsure, allow the alert
+        return False
 
-    async def check_for_name_alerts(self, token_name: str):
+    async def check_for_name_alerts(self, token_name: str) -> bool:
         """Check if this token mention should trigger a name alert (ONLY for tokens WITHOUT CA)"""
         try:
             # CRITICAL: Check if token already has a CA - if yes, NO name alert
             if await self.check_token_has_ca(token_name):
                 logger.info(f"⚠️ Token {token_name} already has CA - skipping Name Alert")
-                return
-            
-            # Get recent mentions of this token (last hour)
-            from datetime import datetime, timedelta
-            one_hour_ago = datetime.now() - timedelta(hours=1)
+                return False
             
-            recent_mentions = await db.token_mentions.find({
-                "token_name": {"$regex": f"^{token_name}$", "$options": "i"},
-                "mentioned_at": {"$gte": one_hour_ago},
-                "processed": {"$ne": True}
-            }).to_list(100)
+            # Recent mentions of this token (last hour), from the in-memory window
+            recent_mentions = self.quorum.mentions(token_name)
             
             # Group by unique accounts
             unique_accounts = set()
             tweet_urls = []
             
-            for mention in recent_mentions:
-                unique_accounts.add(mention['account_username'])
-                tweet_urls.append(mention['tweet_url'])
+            for mentioned_at, account_username, tweet_url in recent_mentions:
+                unique_accounts.add(account_username)
+                tweet_urls.append(tweet_url)
                 
             # If 2+ unique accounts mentioned this token AND it has no CA, create alert
             if len(unique_accounts) >= 2:
                 # Double-check token doesn't have CA before creating alert
                 if await self.check_token_has_ca(token_name):
                     logger.info(f"⚠️ Token {token_name} got CA during processing - skipping Name Alert")
-                    return
+                    return False
                 
                 name_alert = NameAlert(
                     token_name=token_name,
-                    first_seen=min(mention['mentioned_at'] for mention in recent_mentions),
+                    first_seen=recent_mentions[0][0],
                     quorum_count=len(unique_accounts),
                     accounts_mentioned=list(unique_accounts),
                     tweet_urls=tweet_urls,
@@ -283,13 +296,17 @@ class XAccountMonitor:
                 })
                 
                 # Mark mentions as processed
-                await db.token_mentions.update_many(
-                    {"token_name": {"$regex": f"^{token_name}$", "$options": "i"}},
+                self.quorum.reset(token_name)
+                self.background_writes.submit(db.token_mentions.update_many(
+                    {"token_key": token_key(token_name)},
                     {"$set": {"processed": True}}
-                )
+                ), f"mark {token_name} mentions processed")
+                return True
                 
         except Exception as e:
             logger.error(f"Error checking for name alerts: {e}")
+            
+        return False
 
 class PumpFunWebSocketClient:
     def __init__(self):
@@ -363,8 +380,8 @@ class PumpFunWebSocketClient:
                 if time_diff <= 60:  # Less than 1 minute old
                     # Check if this token is being monitored (was trending)
                     monitored_token = await db.ca_monitoring_queue.find_one({
-                        "token_name": {"$regex": f"^{token_name}$", "$options": "i"},
-                        "status": "active"
+                        "status": "active",
+                        "token_key": token_key(token_name)
                     })
                     
                     ca_alert = CAAlert(
@@ -377,6 +394,7 @@ class PumpFunWebSocketClient:
                     
                     # Enhanced alert data for trending tokens
                     alert_data = ca_alert.dict()
+                    alert_data['token_key'] = token_key(token_name)
                     if monitored_token:
                         alert_data['was_trending'] = True
                         alert_data['mention_count'] = monitored_token.get('mention_count', 0)
@@ -395,6 +413,7 @@ class PumpFunWebSocketClient:
                         logger.info(f"🚨 CA ALERT: {token_name} - {ca_alert.contract_address}")
                     
                     ca_alerts.append(alert_data)
+                    known_ca_registry.add(token_name)
                     
                     # Store in database
                     await db.ca_alerts.insert_one(alert_data)
@@ -410,8 +429,11 @@ class PumpFunWebSocketClient:
 
 # Initialize WebSocket client and monitoring systems
 pump_client = PumpFunWebSocketClient()
-x_monitor = XAccountMonitor()
-real_time_monitor = RealTimeXMonitor(db)
+# One quorum window: realtime, API-posted and simulated mentions all count toward each other
+x_monitor = XAccountMonitor(shared_quorum)
+real_time_monitor = RealTimeXMonitor(db, quorum=shared_quorum)
+real_time_monitor.proxy_pool.set_proxies(parse_proxy_list(os.environ.get('SCRAPE_PROXIES')))
+dictionary_store = TokenDictionaryStore(db, shared_extraction_pool)
 github_integration = GitHubIntegration()
 
 # Global configuration
@@ -431,24 +453,6 @@ async def broadcast_to_clients(data: dict):
         for connection in disconnected_clients:
             active_websocket_connections.remove(connection)
 
-async def check_token_has_ca_server(token_name: str) -> bool:
-    """Check if a token already has a Contract Address (server version)"""
-    try:
-        # Check in CA alerts collection
-        ca_exists = await db.ca_alerts.find_one({
-            "token_name": {"$regex": f"^{token_name}$", "$options": "i"}
-        })
-        
-        if ca_exists:
-            logger.info(f"Token {token_name} already has CA - filtering from Name Alerts")
-            return True
-            
-        return False
-        
-    except Exception as e:
-        logger.error(f"Error checking if token has CA: {e}")
-        return False  # If unsure, allow the alert
-
 async def check_name_alerts(token_mentions: List[TokenMention], threshold: int = 2):
     """Check if token mentions meet alert threshold (ONLY for tokens WITHOUT CA)"""
     token_counts = {}
@@ -458,7 +462,7 @@ async def check_name_alerts(token_mentions: List[TokenMention], threshold: int =
             token_name = mention.token_name.lower()
             
             # CRITICAL: Skip tokens that already have CA
-            if await check_token_has_ca_server(mention.token_name):
+            if mention.token_name in known_ca_registry:
                 logger.info(f"⚠️ Token {mention.token_name} already has CA - skipping Name Alert")
                 continue
             
@@ -475,8 +479,8 @@ async def check_name_alerts(token_mentions: List[TokenMention], threshold: int =
             token_counts[token_name]['urls'].append(mention.tweet_url)
             
             if token_counts[token_name]['count'] >= threshold:
-                # Double-check token doesn't have CA before creating alert
-                if await check_token_has_ca_server(mention.token_name):
+                # Double-check token doesn't have CA before creating alert (in memory, catches new CA alerts)
+                if mention.token_name in known_ca_registry:
                     logger.info(f"⚠️ Token {mention.token_name} got CA during processing - skipping Name Alert")
                     continue
                 
@@ -534,13 +538,11 @@ async def remove_tracked_account(account_id: str):
 @api_router.post("/mentions")
 async def add_token_mention(mention: TokenMention):
     """Add token mention from X account (manual input for testing)"""
-    mention_dict = mention.dict()
-    await db.token_mentions.insert_one(mention_dict)
-    
-    # Use X monitor to process the mention
-    await x_monitor.process_token_mention(mention)
+    # Use X monitor to filter, store and process the mention
+    if not await x_monitor.process_token_mention(mention):
+        return {"message": "Token mention stored but filtered (stopword, established token or known CA)", "filtered": True}
     
-    return {"message": "Token mention added successfully"}
+    return {"message": "Token mention added successfully", "filtered": False}
 
 @api_router.post("/monitoring/start")
 async def start_monitoring():
@@ -577,6 +579,23 @@ async def get_monitoring_status():
         "monitoring_type": "sploofmeme_auto_follow_tracking",
         "last_check": real_time_monitor.last_check_time.isoformat() if real_time_monitor.last_check_time else None,
         "known_tokens_filtered": len(real_time_monitor.known_tokens_with_ca),
+        "extraction_cache": real_time_monitor.extraction_cache.stats(),
+        "polling": real_time_monitor.polling_engine.get_stats(),
+        "poll_scheduler": real_time_monitor.poll_scheduler.get_stats(),
+        "http": real_time_monitor.http.get_stats(),
+        "rss_feeds": real_time_monitor.rss_fetcher.get_stats(),
+        "parsing": real_time_monitor.parsing_pool.get_stats(),
+        "proxies": real_time_monitor.proxy_pool.get_stats(),
+        "rate_limits": real_time_monitor.rate_limits.get_stats(),
+        "following_list": real_time_monitor.following_list.get_stats(),
+        "hedged_fetch": real_time_monitor.hedged_fetcher.get_stats(),
+        "source_ranking": real_time_monitor.source_ranking.get_stats(),
+        "browser_pool": real_time_monitor.browser_pool.get_stats(),
+        "navigation_mode": real_time_monitor.navigation_mode,
+        "navigation_timings": real_time_monitor.navigation_timings.get_stats(),
+        "live_pages": real_time_monitor.live_streamer.get_stats(),
+        "x_lists": real_time_monitor.list_ingestor.get_stats(),
+        "account_cursors": len(real_time_monitor.account_cursors),
         "target_account": "Sploofmeme",
         "real_following_count": len(real_time_monitor.monitored_accounts)
     }
@@ -589,17 +608,72 @@ async def update_monitoring_config(config: MonitoringConfig):
     
     # Update real-time monitor settings
     real_time_monitor.set_alert_threshold(config.alert_threshold)
+    real_time_monitor.set_polling_config(config.max_concurrent_accounts, config.account_timeout_seconds)
+    real_time_monitor.set_polling_budget(config.check_interval_seconds, config.min_poll_interval_seconds,
+                                         config.max_poll_interval_seconds)
+    await real_time_monitor.set_navigation_mode(config.navigation_mode)
+    real_time_monitor.set_hot_accounts(config.hot_accounts)
+    real_time_monitor.set_x_lists(config.x_list_ids)
+    real_time_monitor.set_fetch_config(config.fetch_mode, config.hedge_delay_seconds, [
+        name for name, enabled in (("rss", config.enable_rss_monitoring),
+                                   ("browser", config.enable_browser_monitoring),
+                                   ("scrape", config.enable_scraping_monitoring)) if enabled
+    ])
+    if config.scrape_proxies is not None:
+        await real_time_monitor.set_scrape_proxies(parse_proxy_list(",".join(config.scrape_proxies)))
     
     return {
         "message": "Monitoring configuration updated",
         "config": config.dict()
     }
 
+@api_router.get("/monitoring/x-lists")
+async def get_x_list_membership():
+    """Which monitored accounts each configured X List must contain"""
+    return {
+        "member_limit": real_time_monitor.list_ingestor.member_limit,
+        "lists": real_time_monitor.list_ingestor.list_members,
+        "uncovered_accounts": len(real_time_monitor.monitored_accounts) - len(real_time_monitor.list_ingestor.covered_accounts())
+    }
+
 @api_router.get("/monitoring/config")
 async def get_monitoring_config():
     """Get current monitoring configuration"""
     return monitoring_config.dict()
 
+@api_router.get("/dictionaries")
+async def get_token_dictionaries():
+    """Get the keyword, stopword and established-token dictionaries used for extraction"""
+    return {"dictionaries": dictionary_store.dictionaries, **dictionary_store.get_status()}
+
+@api_router.put("/dictionaries/{name}")
+async def update_token_dictionary(name: str, update: DictionaryUpdate):
+    """Replace or edit a token dictionary; the extractor is hot-reloaded without a restart"""
+    try:
+        words = await dictionary_store.update(name, words=update.words, add=update.add, remove=update.remove)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Dictionary not found")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+        
+    return {"message": f"Dictionary {name} updated", "words": words, **dictionary_store.get_status()}
+
+@api_router.delete("/dictionaries/{name}")
+async def reset_token_dictionary(name: str):
+    """Restore a token dictionary to its built-in defaults"""
+    try:
+        words = await dictionary_store.reset(name)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Dictionary not found")
+        
+    return {"message": f"Dictionary {name} reset to defaults", "words": words, **dictionary_store.get_status()}
+
+@api_router.post("/dictionaries/reload")
+async def reload_token_dictionaries():
+    """Reload all token dictionaries from the database"""
+    await dictionary_store.reload()
+    return {"message": "Token dictionaries reloaded", **dictionary_store.get_status()}
+
 @api_router.get("/alerts/names")
 async def get_name_alerts():
     """Get all name alerts"""
@@ -817,6 +891,15 @@ async def startup_event():
     """Initialize services on startup"""
     logger.info("Starting Tweet Tracker...")
     
+    # Backfill token_key and make sure token lookups are index hits
+    await ensure_token_indexes(db)
+    
+    # Stream every known CA into memory; extraction and quorum only consult this registry
+    await known_ca_registry.load(db)
+    
+    # Load token dictionaries (built-in defaults plus stored overrides)
+    await dictionary_store.reload()
+    
     # Start Pump.fun WebSocket client in background
     asyncio.create_task(pump_client.connect())
     
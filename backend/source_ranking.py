@@ -0,0 +1,144 @@
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+from pymongo import UpdateOne
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+logger = logging.getLogger(__name__)
+
+# Relative resource cost of one fetch per source: Chromium navigations are by far the heaviest
+SOURCE_COSTS = {"rss": 1.0, "scrape": 2.0, "browser": 10.0}
+
+
+class _SourceStats:
+    """Rolling (EWMA) outcome of one source for one account"""
+    __slots__ = ("attempts", "success", "latency", "tweets")
+
+    def __init__(self, attempts: int = 0, success: float = 0.5, latency: float = 0.0, tweets: float = 0.0):
+        self.attempts = attempts
+        self.success = success
+        self.latency = latency
+        self.tweets = tweets
+
+    @classmethod
+    def from_doc(cls, doc: Dict) -> "_SourceStats":
+        # Fields this version doesn't know (e.g. the old mention counts) are ignored
+        return cls(**{field: doc[field] for field in cls.__slots__ if field in doc})
+
+    def to_doc(self) -> Dict:
+        return {"attempts": self.attempts, "success": round(self.success, 4),
+                "latency": round(self.latency, 3), "tweets": round(self.tweets, 3)}
+
+
+class SourceRanking:
+    """Learns, per account, which fetch source is the cheapest one that actually works.
+
+    Every finished fetch updates the account's rolling success rate, latency and new tweets yielded
+    for that source. A source only counts as effective in proportion to how many of the account's
+    new tweets it finds compared with the best source, so a mirror that keeps answering with a stale
+    feed loses its place. order() sorts sources by expected cost per effective fetch, so accounts
+    whose Nitter RSS is reliable and fresh are served by RSS first and the hedge delay is stretched
+    past its usual latency, and Chromium is only started when RSS stops working. Stats are flushed
+    to `source_stats` in batches.
+    """
+
+    def __init__(self, costs: Optional[Dict[str, float]] = None, smoothing: float = 0.2,
+                 latency_cost_per_second: float = 1.0, reliable_success: float = 0.9,
+                 tweets_prior: float = 0.1):
+        self.costs = dict(SOURCE_COSTS if costs is None else costs)
+        self.smoothing = smoothing
+        self.latency_cost_per_second = latency_cost_per_second
+        self.reliable_success = reliable_success
+        self.tweets_prior = tweets_prior
+        self.stats: Dict[str, Dict[str, _SourceStats]] = {}
+        self.dirty: Set[str] = set()
+        self.loaded = False
+
+    @staticmethod
+    def _key(account: str) -> str:
+        return account.lstrip('@').lower()
+
+    def record(self, account: str, source: str, success: bool, latency: float, tweets: int = 0):
+        """One finished fetch; `tweets` is the number of tweets past the account's cursor it returned"""
+        key = self._key(account)
+        stats = self.stats.setdefault(key, {}).get(source)
+        if stats is None:
+            # First observation sets the averages outright
+            stats = self.stats[key][source] = _SourceStats(0, float(success), latency, float(tweets))
+        else:
+            alpha = self.smoothing
+            stats.success += alpha * (float(success) - stats.success)
+            if success:
+                stats.latency += alpha * (latency - stats.latency)
+                stats.tweets += alpha * (tweets - stats.tweets)
+        stats.attempts += 1
+        self.dirty.add(key)
+
+    def effectiveness(self, account: str, source: str) -> float:
+        """Success rate scaled by the share of new tweets found relative to the account's best source"""
+        account_stats = self.stats.get(self._key(account), {})
+        stats = account_stats.get(source)
+        if stats is None:
+            return 0.5
+        best_tweets = max(other.tweets for other in account_stats.values())
+        freshness = (stats.tweets + self.tweets_prior) / (best_tweets + self.tweets_prior)
+        return stats.success * freshness
+
+    def expected_cost(self, account: str, source: str) -> float:
+        """Cost per effective fetch; unseen sources use their base cost at even odds"""
+        stats = self.stats.get(self._key(account), {}).get(source)
+        cost = self.costs.get(source, 1.0)
+        if stats is None:
+            return cost / 0.5
+        return (cost + self.latency_cost_per_second * stats.latency) / max(self.effectiveness(account, source), 0.05)
+
+    def order(self, account: str, sources: List[str]) -> List[str]:
+        """Sources cheapest-effective first; ties keep the given order"""
+        return sorted(sources, key=lambda source: self.expected_cost(account, source))
+
+    def hedge_delay(self, account: str, source: str, default: float) -> float:
+        """Wait past a reliable source's usual latency before hedging to the next one"""
+        stats = self.stats.get(self._key(account), {}).get(source)
+        if stats is None or self.effectiveness(account, source) < self.reliable_success:
+            return default
+        return max(default, 2 * stats.latency)
+
+    async def load(self, db: AsyncIOMotorDatabase):
+        if self.loaded:
+            return
+        try:
+            async for doc in db.source_stats.find({}):
+                self.stats.setdefault(doc["_id"], {
+                    source: _SourceStats.from_doc(values) for source, values in doc.get("sources", {}).items()
+                })
+            self.loaded = True
+            logger.info(f"Loaded source stats for {len(self.stats)} accounts")
+        except Exception as e:
+            logger.error(f"Error loading source stats: {e}")
+
+    async def flush(self, db: AsyncIOMotorDatabase, batch_size: int = 500) -> int:
+        """Write the accounts whose stats changed since the last flush in bulk"""
+        dirty, self.dirty = self.dirty, set()
+        updates = [
+            UpdateOne({"_id": key}, {"$set": {
+                "sources": {source: stats.to_doc() for source, stats in self.stats[key].items()},
+                "updated_at": datetime.now(timezone.utc)
+            }}, upsert=True)
+            for key in dirty if key in self.stats
+        ]
+        written = 0
+        try:
+            for start in range(0, len(updates), batch_size):
+                await db.source_stats.bulk_write(updates[start:start + batch_size], ordered=False)
+                written += len(updates[start:start + batch_size])
+        except Exception as e:
+            self.dirty |= dirty
+            logger.error(f"Error flushing source stats: {e}")
+        return written
+
+    def get_stats(self) -> Dict:
+        first_choice: Dict[str, int] = {}
+        for key in self.stats:
+            best = self.order(key, list(self.costs))[0]
+            first_choice[best] = first_choice.get(best, 0) + 1
+        return {"accounts": len(self.stats), "first_choice": first_choice}
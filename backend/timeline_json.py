@@ -0,0 +1,159 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Set
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# GraphQL operations whose responses carry timeline tweets
+TIMELINE_OPERATIONS = frozenset({
+    "UserTweets",
+    "UserTweetsAndReplies",
+    "ListLatestTweetsTimeline",
+    "HomeLatestTimeline",
+    "HomeTimeline",
+    "SearchTimeline",
+})
+
+TWITTER_DATE_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+
+
+def is_timeline_response(url: str) -> bool:
+    """Whether a response URL is one of X's GraphQL timeline calls"""
+    path = urlsplit(url).path
+    return "/graphql/" in path and path.rsplit("/", 1)[-1] in TIMELINE_OPERATIONS
+
+
+def _tweet_results(node: Any) -> Iterator[Dict]:
+    """Every tweet_results.result in a timeline payload, without descending into the tweets themselves"""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "tweet_results" and isinstance(value, dict):
+                result = value.get("result")
+                if isinstance(result, dict):
+                    yield result
+            else:
+                yield from _tweet_results(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _tweet_results(item)
+
+
+def parse_tweet(result: Dict) -> Optional[Dict]:
+    """Turn one GraphQL tweet result into {id, username, text, timestamp, url, retweet_of}.
+
+    A retweet keeps the retweeter's ID, username and time but carries the original's full text and
+    URL, with the original author in `retweet_of` (None for everything else).
+    """
+    # Tweets with visibility restrictions wrap the real tweet
+    if result.get("__typename") == "TweetWithVisibilityResults":
+        result = result.get("tweet") or {}
+
+    legacy = result.get("legacy") or {}
+    tweet_id = result.get("rest_id") or legacy.get("id_str")
+    created_at = legacy.get("created_at")
+    if not tweet_id or not created_at:
+        return None
+
+    # Long tweets keep their full text in note_tweet; legacy.full_text is truncated
+    note = ((result.get("note_tweet") or {}).get("note_tweet_results") or {}).get("result") or {}
+    text = note.get("text") or legacy.get("full_text") or ""
+
+    user = ((result.get("core") or {}).get("user_results") or {}).get("result") or {}
+    username = (user.get("legacy") or {}).get("screen_name") or (user.get("core") or {}).get("screen_name") or ""
+
+    try:
+        timestamp = datetime.strptime(created_at, TWITTER_DATE_FORMAT).isoformat()
+    except ValueError:
+        return None
+
+    tweet = {
+        "id": str(tweet_id),
+        "username": username,
+        "text": text,
+        "timestamp": timestamp,
+        "url": f"https://x.com/{username or 'i/web'}/status/{tweet_id}",
+        "retweet_of": None
+    }
+
+    # The retweet's own full_text is a truncated "RT @author: ..." copy of the original
+    original = parse_tweet((legacy.get("retweeted_status_result") or {}).get("result") or {})
+    if original:
+        tweet.update(text=original["text"], url=original["url"], retweet_of=original["username"])
+    return tweet
+
+
+def parse_timeline_payload(payload: Dict, author: Optional[str] = None) -> List[Dict]:
+    """All tweets in a timeline response, newest first and deduplicated by ID.
+
+    With `author`, only that account's own tweets and retweets are kept: promoted entries and other
+    people's tweets in reply threads are dropped.
+    """
+    author = author.lstrip("@").lower() if author else None
+    tweets: Dict[str, Dict] = {}
+    for result in _tweet_results(payload):
+        tweet = parse_tweet(result)
+        if not tweet or tweet["id"] in tweets:
+            continue
+        if author and tweet["username"].lower() != author:
+            continue
+        tweets[tweet["id"]] = tweet
+    return sorted(tweets.values(), key=lambda tweet: int(tweet["id"]), reverse=True)
+
+
+class TimelineCapture:
+    """Collects tweets from the timeline API responses a page receives while the block is active.
+
+    Use `async with TimelineCapture(page) as capture:` around the navigation, then
+    `await capture.wait()` for the first timeline response and read `capture.tweets()`. Pass
+    `author` when capturing a profile so only that account's tweets are collected.
+    """
+
+    def __init__(self, page, author: Optional[str] = None):
+        self.page = page
+        self.author = author
+        self.by_id: Dict[str, Dict] = {}
+        self.responses = 0
+        self.received = asyncio.Event()
+        self.pending: Set[asyncio.Task] = set()
+
+    def _on_response(self, response):
+        if is_timeline_response(response.url):
+            task = asyncio.create_task(self._read(response))
+            self.pending.add(task)
+            task.add_done_callback(self.pending.discard)
+
+    async def _read(self, response):
+        try:
+            payload = await response.json()
+            for tweet in parse_timeline_payload(payload, self.author):
+                self.by_id.setdefault(tweet["id"], tweet)
+            self.responses += 1
+        except Exception as e:
+            logger.debug(f"Unreadable timeline response {response.url}: {e}")
+        finally:
+            self.received.set()
+
+    async def __aenter__(self) -> "TimelineCapture":
+        self.page.on("response", self._on_response)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.page.remove_listener("response", self._on_response)
+        for task in list(self.pending):
+            task.cancel()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for the first timeline response to be parsed; False if none arrived in time"""
+        try:
+            await asyncio.wait_for(self.received.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        # Let responses that arrived together finish parsing
+        if self.pending:
+            await asyncio.wait(list(self.pending), timeout=timeout)
+        return True
+
+    def tweets(self) -> List[Dict]:
+        return sorted(self.by_id.values(), key=lambda tweet: int(tweet["id"]), reverse=True)
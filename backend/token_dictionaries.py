@@ -0,0 +1,131 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from token_extractor import (
+    TokenExtractor, ExtractionPool, MEME_KEYWORDS, CURRENCY_WORDS, HYPE_PHRASES, STOPWORDS, ESTABLISHED_TOKENS
+)
+
+logger = logging.getLogger(__name__)
+
+# Built-in dictionaries, used for any dictionary that has no override stored in Mongo
+DEFAULT_DICTIONARIES: Dict[str, tuple] = {
+    "meme_keywords": MEME_KEYWORDS,
+    "currency_words": CURRENCY_WORDS,
+    "hype_phrases": HYPE_PHRASES,
+    "stopwords": STOPWORDS,
+    "established_tokens": ESTABLISHED_TOKENS,
+}
+
+# The extractor matches these one word at a time, so a multi-word entry could never match
+SINGLE_WORD_DICTIONARIES = frozenset({"meme_keywords", "stopwords", "established_tokens"})
+
+
+class TokenDictionaryStore:
+    """Mongo-backed keyword, stopword and established-token dictionaries with hot reload.
+
+    Each dictionary is one document in `token_dictionaries`. Updates are persisted, the new
+    TokenExtractor is built in a background thread and swapped into the extraction pool in one
+    assignment, so extraction keeps running on the old tries until the new ones are ready.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase, pool: ExtractionPool):
+        self.db = db
+        self.pool = pool
+        self.dictionaries: Dict[str, List[str]] = {name: list(words) for name, words in DEFAULT_DICTIONARIES.items()}
+        self.version = 0
+        self.last_reload: Optional[datetime] = None
+        self._reload_lock = asyncio.Lock()
+
+    @staticmethod
+    def _normalize_words(name: str, words: List[str]) -> List[str]:
+        """Trim, dedupe (keeping order) and uppercase everything except the lowercase phrase lists.
+
+        Raises ValueError for multi-word entries in a single-word dictionary.
+        """
+        normalized = []
+        seen = set()
+        for word in words:
+            word = ' '.join(str(word).split())
+            word = word.lower() if name in ("currency_words", "hype_phrases") else word.upper()
+            if word and word not in seen:
+                seen.add(word)
+                normalized.append(word)
+        phrases = [word for word in normalized if ' ' in word] if name in SINGLE_WORD_DICTIONARIES else []
+        if phrases:
+            raise ValueError(f"{name} entries must be single words: {', '.join(phrases)}")
+        return normalized
+
+    async def load(self) -> Dict[str, List[str]]:
+        """Read stored overrides from Mongo on top of the built-in defaults"""
+        dictionaries = {name: list(words) for name, words in DEFAULT_DICTIONARIES.items()}
+        try:
+            async for doc in self.db.token_dictionaries.find({"name": {"$in": list(DEFAULT_DICTIONARIES)}}):
+                dictionaries[doc["name"]] = list(doc.get("words", []))
+        except Exception as e:
+            logger.error(f"Error loading token dictionaries, using defaults: {e}")
+        return dictionaries
+
+    async def _rebuild(self):
+        """Load dictionaries from Mongo, build the extractor in a worker thread and swap it in"""
+        dictionaries = await self.load()
+        extractor = await asyncio.to_thread(
+            TokenExtractor,
+            meme_keywords=dictionaries["meme_keywords"],
+            currency_words=dictionaries["currency_words"],
+            hype_phrases=dictionaries["hype_phrases"],
+            stopwords=dictionaries["stopwords"],
+            established_tokens=dictionaries["established_tokens"]
+        )
+        self.pool.swap_extractor(extractor)
+        self.dictionaries = dictionaries
+        self.version += 1
+        self.last_reload = datetime.now(timezone.utc)
+        logger.info(f"Token dictionaries reloaded (version {self.version}): " +
+                    ", ".join(f"{name}={len(words)}" for name, words in dictionaries.items()))
+
+    async def reload(self):
+        """Reload every dictionary from Mongo and hot-swap the extractor"""
+        async with self._reload_lock:
+            await self._rebuild()
+
+    async def update(self, name: str, words: Optional[List[str]] = None,
+                     add: Optional[List[str]] = None, remove: Optional[List[str]] = None) -> List[str]:
+        """Replace a dictionary or add/remove entries, persist it and hot-reload the extractor.
+
+        Raises KeyError for an unknown dictionary and ValueError for entries it could never match.
+        """
+        if name not in DEFAULT_DICTIONARIES:
+            raise KeyError(name)
+
+        async with self._reload_lock:
+            current = self.dictionaries[name] if words is None else words
+            updated = self._normalize_words(name, list(current) + list(add or []))
+            removed = set(self._normalize_words(name, list(remove or [])))
+            updated = [word for word in updated if word not in removed]
+
+            await self.db.token_dictionaries.update_one(
+                {"name": name},
+                {"$set": {"name": name, "words": updated, "updated_at": datetime.now(timezone.utc)}},
+                upsert=True
+            )
+            await self._rebuild()
+            return self.dictionaries[name]
+
+    async def reset(self, name: str) -> List[str]:
+        """Drop the stored override so the built-in dictionary is used again"""
+        if name not in DEFAULT_DICTIONARIES:
+            raise KeyError(name)
+
+        async with self._reload_lock:
+            await self.db.token_dictionaries.delete_one({"name": name})
+            await self._rebuild()
+            return self.dictionaries[name]
+
+    def get_status(self) -> Dict:
+        return {
+            "version": self.version,
+            "last_reload": self.last_reload.isoformat() if self.last_reload else None,
+            "sizes": {name: len(words) for name, words in self.dictionaries.items()}
+        }
@@ -0,0 +1,470 @@
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Meme coin names that only count as a token when followed by a currency word
+# (e.g. "FROG coin", "DRAGON token")
+MEME_KEYWORDS = (
+    'PEPE', 'DOGE', 'SHIB', 'BONK', 'WIF', 'FLOKI', 'MEME', 'APE', 'WOJAK', 'TURBO', 'BRETT',
+    'POPCAT', 'DEGEN', 'MEW', 'BOBO', 'PEPE2', 'LADYS', 'BABYDOGE', 'DOGELON', 'AKITA', 'KISHU',
+    'SAFEMOON', 'HOGE', 'NFD', 'ELON', 'MILADY', 'BEN', 'ANDY', 'BART', 'MATT', 'TOSHI', 'HOPPY',
+    'MUMU', 'BENJI', 'POKEMON', 'SPURDO', 'BODEN', 'MAGA', 'SLERF', 'BOOK', 'MYRO', 'PONKE',
+    'RETARDIO', 'GIGACHAD', 'CHAD', 'BASED', 'AAVE', 'UNI', 'SUSHI', 'CAKE', 'BANANA', 'HONEY',
+    'MILK', 'WATER', 'FIRE', 'EARTH', 'WIND', 'THUNDER', 'LIGHTNING', 'STORM', 'BLAZE', 'FROST',
+    'ICE', 'SNOW', 'RAIN', 'SUN', 'MOON', 'STAR', 'GALAXY', 'COMET', 'METEOR', 'ROCKET', 'SPACE',
+    'ALIEN', 'ROBOT', 'NINJA', 'PIRATE', 'VIKING', 'KNIGHT', 'WARRIOR', 'HERO', 'LEGEND', 'KING',
+    'QUEEN', 'PRINCE', 'PRINCESS', 'DUKE', 'LORD', 'MASTER', 'BOSS', 'CHIEF', 'CAPTAIN',
+    'COMMANDER', 'GENERAL', 'ADMIRAL', 'EMPEROR', 'GOD', 'ZEUS', 'THOR', 'ODIN', 'LOKI', 'FREYA',
+    'SAMURAI', 'SPARTA', 'GLADIATOR', 'TITAN', 'GIANT', 'DRAGON', 'PHOENIX', 'EAGLE', 'HAWK',
+    'WOLF', 'BEAR', 'LION', 'TIGER', 'SHARK', 'WHALE', 'DOLPHIN', 'OCTOPUS', 'SQUID', 'CRAB',
+    'LOBSTER', 'FISH', 'BIRD', 'BAT', 'OWL', 'RAVEN', 'CROW', 'SNAKE', 'SPIDER', 'SCORPION', 'BEE',
+    'ANT', 'BUTTERFLY', 'MOTH', 'LADYBUG', 'BEETLE', 'COCKROACH', 'FLY', 'MOSQUITO', 'WORM',
+    'SNAIL', 'SLUG', 'TURTLE', 'FROG', 'TOAD', 'LIZARD', 'GECKO', 'CHAMELEON', 'IGUANA',
+    'ALLIGATOR', 'CROCODILE', 'HIPPO', 'RHINO', 'ELEPHANT', 'GIRAFFE', 'ZEBRA', 'HORSE', 'DONKEY',
+    'MULE', 'COW', 'BULL', 'OX', 'BUFFALO', 'BISON', 'GOAT', 'SHEEP', 'LAMB', 'PIG', 'BOAR', 'DEER',
+    'ELK', 'MOOSE', 'CARIBOU', 'REINDEER', 'RABBIT', 'HARE', 'SQUIRREL', 'CHIPMUNK', 'BEAVER',
+    'OTTER', 'SEAL', 'WALRUS', 'PENGUIN', 'POLAR', 'PANDA', 'KOALA', 'KANGAROO', 'PLATYPUS',
+    'ECHIDNA', 'SLOTH', 'ARMADILLO', 'ANTEATER', 'HEDGEHOG', 'PORCUPINE', 'SKUNK', 'RACCOON',
+    'OPOSSUM', 'BADGER', 'WEASEL', 'FERRET', 'MINK', 'FOX', 'COYOTE', 'JACKAL', 'HYENA', 'CHEETAH',
+    'LEOPARD', 'JAGUAR', 'PUMA', 'LYNX', 'BOBCAT', 'SERVAL', 'CARACAL', 'OCELOT', 'MARGAY',
+    'JAGUARUNDI', 'KODKOD', 'ONCILLA', 'GUINA', 'SAND', 'DUNE', 'DESERT', 'OASIS', 'MIRAGE',
+    'PYRAMID', 'SPHINX', 'PHARAOH', 'MUMMY', 'TOMB', 'TREASURE', 'GOLD', 'SILVER', 'BRONZE',
+    'COPPER', 'IRON', 'STEEL', 'TITANIUM', 'PLATINUM', 'DIAMOND', 'RUBY', 'EMERALD', 'SAPPHIRE',
+    'PEARL', 'CRYSTAL', 'GEM', 'JEWEL', 'CROWN', 'SCEPTER', 'THRONE', 'CASTLE', 'PALACE', 'TOWER',
+    'BRIDGE', 'GATE', 'DOOR', 'WINDOW', 'WALL', 'ROOF', 'FLOOR', 'CEILING', 'ROOM', 'HOUSE', 'HOME',
+    'FAMILY', 'LOVE', 'HEART', 'SOUL', 'SPIRIT', 'MIND', 'BRAIN', 'DREAM', 'HOPE', 'WISH', 'LUCK',
+    'FORTUNE', 'DESTINY', 'FATE', 'KARMA', 'MAGIC', 'SPELL', 'CURSE', 'BLESSING', 'MIRACLE',
+    'WONDER', 'MYSTERY', 'SECRET', 'KEY', 'LOCK', 'CODE', 'PASSWORD', 'ACCESS', 'ENTER', 'EXIT',
+    'OPEN', 'CLOSE', 'START', 'STOP', 'GO', 'COME', 'MOVE', 'STAY', 'RUN', 'WALK', 'JUMP', 'SWIM',
+    'DIVE', 'CLIMB', 'FALL', 'RISE', 'UP', 'DOWN', 'LEFT', 'RIGHT', 'NORTH', 'SOUTH', 'EAST',
+    'WEST', 'CENTER', 'MIDDLE', 'EDGE', 'CORNER', 'SIDE', 'TOP', 'BOTTOM', 'FRONT', 'BACK',
+    'INSIDE', 'OUTSIDE', 'ABOVE', 'BELOW', 'OVER', 'UNDER', 'THROUGH', 'AROUND', 'BETWEEN', 'AMONG',
+    'WITHIN', 'WITHOUT', 'BEFORE', 'AFTER', 'DURING', 'SINCE', 'UNTIL', 'WHILE', 'WHEN', 'WHERE',
+    'WHY', 'HOW', 'WHAT', 'WHO', 'WHICH', 'WHOSE', 'WHOM', 'EVERYONE', 'SOMEONE', 'ANYONE',
+    'NOBODY', 'EVERYBODY', 'SOMEBODY', 'ANYBODY', 'NOTHING', 'EVERYTHING', 'SOMETHING', 'ANYTHING',
+    'ALL', 'NONE', 'SOME', 'ANY', 'MANY', 'FEW', 'SEVERAL', 'MOST', 'LEAST', 'MORE', 'LESS', 'MUCH',
+    'LITTLE', 'BIG', 'SMALL', 'LARGE', 'HUGE', 'TINY', 'MINI', 'MICRO', 'MACRO', 'MEGA', 'GIGA',
+    'TERA', 'ULTRA', 'SUPER', 'HYPER', 'NITRO', 'BOOST', 'POWER', 'ENERGY', 'FORCE', 'STRENGTH',
+    'SPEED', 'FAST', 'SLOW', 'QUICK', 'RAPID', 'SWIFT', 'FLASH', 'HURRICANE', 'TORNADO', 'TYPHOON',
+    'CYCLONE', 'BLIZZARD', 'AVALANCHE', 'EARTHQUAKE', 'TSUNAMI', 'VOLCANO', 'ERUPTION', 'EXPLOSION',
+    'BLAST', 'BOOM', 'BANG', 'CRASH', 'SMASH', 'BREAK', 'SHATTER', 'DESTROY', 'DEMOLISH',
+    'ANNIHILATE', 'OBLITERATE', 'VAPORIZE', 'EVAPORATE', 'MELT', 'FREEZE', 'BURN', 'IGNITE',
+    'FLAME', 'INFERNO', 'HELL', 'HEAVEN', 'PARADISE', 'UTOPIA', 'DYSTOPIA', 'CHAOS', 'ORDER',
+    'PEACE', 'WAR', 'BATTLE', 'FIGHT', 'COMBAT', 'CONFLICT', 'VICTORY', 'DEFEAT', 'WIN', 'LOSE',
+    'SUCCESS', 'FAILURE', 'TRIUMPH', 'DISASTER', 'CATASTROPHE', 'APOCALYPSE', 'ARMAGEDDON',
+    'JUDGMENT', 'DOOMSDAY', 'END', 'BEGINNING', 'GENESIS', 'CREATION', 'BIRTH', 'DEATH', 'LIFE',
+    'EXISTENCE', 'REALITY', 'TRUTH', 'LIE', 'FACT', 'FICTION', 'STORY', 'TALE', 'MYTH', 'FOLKLORE',
+    'HISTORY', 'FUTURE', 'PAST', 'PRESENT', 'NOW', 'THEN', 'SOON', 'LATER', 'EARLY', 'LATE', 'ON',
+    'TIME', 'SCHEDULE', 'PLAN', 'STRATEGY', 'TACTIC', 'METHOD', 'WAY', 'PATH', 'ROAD', 'STREET',
+    'AVENUE', 'BOULEVARD', 'HIGHWAY', 'FREEWAY', 'EXPRESSWAY', 'PARKWAY', 'LANE', 'ALLEY', 'COURT',
+    'CIRCLE', 'SQUARE', 'PLAZA', 'PARK', 'GARDEN', 'FOREST', 'JUNGLE', 'MOUNTAIN', 'HILL', 'VALLEY',
+    'CANYON', 'CLIFF', 'CAVE', 'TUNNEL', 'RIVER', 'LAKE', 'OCEAN', 'SEA', 'POND', 'STREAM', 'CREEK',
+    'WATERFALL', 'SPRING', 'WELL', 'FOUNTAIN', 'POOL', 'BEACH', 'SHORE', 'COAST', 'ISLAND',
+    'CONTINENT', 'COUNTRY', 'STATE', 'CITY', 'TOWN', 'VILLAGE', 'NEIGHBORHOOD', 'COMMUNITY',
+    'SOCIETY', 'CIVILIZATION', 'CULTURE', 'TRADITION', 'CUSTOM', 'RITUAL', 'CEREMONY',
+    'CELEBRATION', 'FESTIVAL', 'PARTY', 'EVENT', 'OCCASION', 'MOMENT', 'INSTANT', 'SECOND',
+    'MINUTE', 'HOUR', 'DAY', 'WEEK', 'MONTH', 'YEAR', 'DECADE', 'CENTURY', 'MILLENNIUM', 'ERA',
+    'AGE', 'EPOCH', 'PERIOD', 'PHASE', 'STAGE', 'STEP', 'LEVEL', 'DEGREE', 'GRADE', 'RANK', 'CLASS',
+    'CATEGORY', 'TYPE', 'KIND', 'SORT', 'VARIETY', 'SPECIES', 'BREED', 'RACE', 'ETHNICITY',
+    'NATIONALITY', 'CITIZENSHIP', 'IDENTITY', 'PERSONALITY', 'CHARACTER', 'TRAIT', 'QUALITY',
+    'ATTRIBUTE', 'FEATURE', 'ASPECT', 'ELEMENT', 'COMPONENT', 'PART', 'PIECE', 'FRAGMENT',
+    'SECTION', 'PORTION', 'SEGMENT', 'DIVISION', 'UNIT', 'ITEM', 'OBJECT', 'THING', 'STUFF',
+    'MATERIAL', 'SUBSTANCE', 'MATTER', 'PARTICLE', 'ATOM', 'MOLECULE', 'COMPOUND', 'MIXTURE',
+    'SOLUTION', 'LIQUID', 'SOLID', 'GAS', 'PLASMA', 'VACUUM', 'VOID', 'EMPTINESS', 'FULLNESS',
+    'COMPLETENESS', 'WHOLENESS', 'UNITY', 'HARMONY', 'BALANCE', 'EQUILIBRIUM', 'STABILITY',
+    'INSTABILITY', 'CHANGE', 'TRANSFORMATION', 'EVOLUTION', 'REVOLUTION', 'INNOVATION', 'INVENTION',
+    'DISCOVERY', 'EXPLORATION', 'ADVENTURE', 'JOURNEY', 'TRIP', 'VOYAGE', 'EXPEDITION', 'MISSION',
+    'QUEST', 'SEARCH', 'HUNT', 'CHASE', 'PURSUIT', 'FOLLOW', 'LEAD', 'GUIDE', 'DIRECT', 'CONTROL',
+    'COMMAND', 'RULE', 'GOVERN', 'MANAGE', 'OPERATE', 'FUNCTION', 'WORK', 'PERFORM', 'ACT',
+    'BEHAVE', 'CONDUCT', 'EXECUTE', 'IMPLEMENT', 'APPLY', 'USE', 'UTILIZE', 'EMPLOY', 'HIRE',
+    'RECRUIT', 'TRAIN', 'TEACH', 'LEARN', 'STUDY', 'RESEARCH', 'INVESTIGATE', 'EXAMINE', 'ANALYZE',
+    'EVALUATE', 'ASSESS', 'JUDGE', 'DECIDE', 'CHOOSE', 'SELECT', 'PICK', 'PREFER', 'LIKE', 'ADORE',
+    'CHERISH', 'VALUE', 'APPRECIATE', 'RESPECT', 'ADMIRE', 'WORSHIP', 'PRAISE', 'HONOR',
+    'CELEBRATE', 'COMMEMORATE', 'REMEMBER', 'RECALL', 'REMIND', 'FORGET', 'IGNORE', 'NEGLECT',
+    'ABANDON', 'LEAVE', 'DEPART', 'ARRIVE', 'RETURN', 'COMEBACK', 'REVIVAL', 'RESURRECTION',
+    'REBIRTH', 'REINCARNATION', 'RENEWAL', 'REFRESH', 'RESTORE', 'REPAIR', 'FIX', 'MEND', 'HEAL',
+    'CURE', 'TREAT', 'MEDICINE', 'DRUG', 'PILL', 'TABLET', 'CAPSULE', 'INJECTION', 'VACCINE',
+    'ANTIDOTE', 'REMEDY', 'ANSWER', 'RESPONSE', 'REPLY', 'REACTION', 'EFFECT', 'RESULT', 'OUTCOME',
+    'CONSEQUENCE', 'IMPACT', 'INFLUENCE', 'AUTHORITY', 'DOMINANCE', 'SUPREMACY', 'SUPERIORITY',
+    'EXCELLENCE', 'PERFECTION', 'FLAWLESSNESS', 'BEAUTY', 'ELEGANCE', 'GRACE', 'CHARM', 'APPEAL',
+    'ATTRACTION', 'MAGNETISM', 'CHARISMA'
+)
+
+# Currency, nationality and place words accepted after a meme keyword
+CURRENCY_WORDS = (
+    'coin', 'token', 'crypto', 'currency', 'money', 'cash', 'dollar', 'euro', 'yen', 'pound',
+    'franc', 'mark', 'ruble', 'peso', 'real', 'rand', 'rupee', 'dinar', 'dirham', 'riyal', 'shekel',
+    'won', 'yuan', 'baht', 'dong', 'kip', 'kyat', 'taka', 'afghani', 'manat', 'som', 'tenge',
+    'lari', 'dram', 'leu', 'lev', 'kuna', 'koruna', 'zloty', 'forint', 'krona', 'krone', 'markka',
+    'guilder', 'punt', 'escudo', 'peseta', 'lira', 'drachma', 'denar', 'tolar', 'lat', 'litas',
+    'kroon', 'cedi', 'naira', 'shilling', 'birr', 'nakfa', 'leone', 'dalasi', 'ouguiya', 'pula',
+    'loti', 'lilangeni', 'kwacha', 'metical', 'ariary', 'colon', 'quetzal', 'lempira', 'cordoba',
+    'balboa', 'sucre', 'nuevo', 'guarani', 'uruguayo', 'boliviano', 'chileno', 'colombiano',
+    'venezolano', 'guyanese', 'surinamese', 'falkland', 'bermudian', 'cayman', 'jamaican',
+    'barbadian', 'trinidad', 'tobago', 'dominican', 'haitian', 'cuban', 'bahamian', 'canadian',
+    'american', 'mexican', 'guatemalan', 'belizean', 'salvadoran', 'honduran', 'nicaraguan',
+    'costa', 'rican', 'panamanian', 'ecuadorian', 'peruvian', 'brazilian', 'argentine',
+    'paraguayan', 'uruguayan', 'bolivian', 'chilean', 'colombian', 'venezuelan', 'guyanan',
+    'surinamer', 'french', 'british', 'spanish', 'portuguese', 'dutch', 'german', 'italian',
+    'swiss', 'austrian', 'belgian', 'luxembourg', 'monaco', 'andorran', 'san', 'marino', 'vatican',
+    'maltese', 'cypriot', 'greek', 'bulgarian', 'romanian', 'moldovan', 'ukrainian', 'belarusian',
+    'russian', 'estonian', 'latvian', 'lithuanian', 'polish', 'czech', 'slovak', 'hungarian',
+    'slovene', 'croatian', 'bosnian', 'serbian', 'montenegrin', 'albanian', 'macedonian', 'turkish',
+    'georgian', 'armenian', 'azerbaijani', 'kazakh', 'kyrgyz', 'tajik', 'turkmen', 'uzbek',
+    'afghan', 'pakistani', 'indian', 'bangladeshi', 'sri', 'lankan', 'maldivian', 'nepali',
+    'bhutanese', 'myanmar', 'thai', 'laotian', 'cambodian', 'vietnamese', 'malaysian', 'bruneian',
+    'singaporean', 'indonesian', 'timorese', 'filipino', 'taiwanese', 'chinese', 'japanese',
+    'south', 'korean', 'north', 'mongolian', 'australian', 'new', 'zealand', 'fijian', 'papua',
+    'guinean', 'solomon', 'vanuatu', 'samoa', 'tonga', 'tuvalu', 'kiribati', 'nauru', 'marshall',
+    'micronesian', 'palau', 'hawaiian', 'alaskan', 'puerto', 'virgin', 'guam', 'northern',
+    'mariana', 'cook', 'niue', 'tokelau', 'pitcairn', 'norfolk', 'christmas', 'cocos', 'keeling',
+    'heard', 'mcdonald', 'macquarie', 'antarctic', 'georgia', 'sandwich', 'tristan', 'cunha',
+    'ascension', 'saint', 'helena', 'mauritius', 'seychelles', 'comoros', 'madagascar', 'reunion',
+    'mayotte', 'kerguelen', 'crozet', 'amsterdam', 'paul', 'prince', 'edward', 'marion', 'bouvet',
+    'peter', 'ross', 'dependency', 'marie', 'byrd', 'land', 'queen', 'maud', 'enderby', 'kemp',
+    'mac', 'robertson', 'princess', 'elizabeth', 'wilhelm', 'kaiser', 'mary', 'wilkes', 'adelie',
+    'george', 'oates', 'victoria', 'magnetic', 'pole', 'geographic', 'equator', 'tropic', 'cancer',
+    'capricorn', 'arctic', 'circle', 'prime', 'meridian', 'international', 'date', 'line',
+    'greenwich', 'mean', 'time', 'coordinated', 'universal', 'daylight', 'saving', 'standard',
+    'zone', 'utc', 'gmt', 'est', 'cst', 'mst', 'pst', 'edt', 'cdt', 'mdt', 'pdt', 'ast', 'hst',
+    'akst', 'akdt', 'nst', 'ndt', 'atlantic', 'pacific', 'mountain', 'central', 'eastern', 'hawaii',
+    'alaska', 'newfoundland', 'yukon', 'columbia', 'alberta', 'saskatchewan', 'manitoba', 'ontario',
+    'quebec', 'brunswick', 'nova', 'scotia', 'island', 'northwest', 'territories', 'nunavut',
+    'washington', 'oregon', 'california', 'nevada', 'idaho', 'montana', 'wyoming', 'utah',
+    'colorado', 'arizona', 'mexico', 'dakota', 'nebraska', 'kansas', 'oklahoma', 'texas',
+    'minnesota', 'iowa', 'missouri', 'arkansas', 'louisiana', 'wisconsin', 'illinois', 'michigan',
+    'indiana', 'ohio', 'kentucky', 'tennessee', 'mississippi', 'alabama', 'west', 'virginia',
+    'maryland', 'delaware', 'pennsylvania', 'jersey', 'york', 'connecticut', 'rhode',
+    'massachusetts', 'vermont', 'hampshire', 'maine', 'florida', 'carolina', 'district', 'rico',
+    'islands'
+)
+
+# Hype phrases that turn any 2-10 letter word in front of them into a token
+HYPE_PHRASES = (
+    'coin', 'token', 'gem', 'to the moon', 'moon', 'pump', 'lambo', 'rocket', 'bullish', 'bearish',
+    'hodl', 'diamond hands',
+)
+
+# Words that look like tokens but never are
+STOPWORDS = ('THE', 'AND', 'FOR', 'WITH')
+
+# Known old/established tokens to filter out
+ESTABLISHED_TOKENS = (
+    'BTC', 'ETH', 'BNB', 'ADA', 'SOL', 'XRP', 'USDT', 'USDC', 'BUSD', 'MATIC', 'AVAX', 'DOT', 'UNI',
+    'LINK', 'ATOM', 'ICP', 'LTC', 'BCH', 'FIL', 'ALGO', 'VET', 'ETC', 'THETA', 'AAVE', 'MKR', 'COMP',
+    'SUSHI', 'SNX', 'YFI', 'CRV', 'BAL', '1INCH',
+)
+
+# Characters that survive str.upper() but still match an ASCII letter under re.IGNORECASE
+_ASCII_FOLD = str.maketrans({'\u0130': 'I', '\u212a': 'K'})
+
+_WORD_RE = re.compile(r'\w+')
+
+_END = None  # Trie key marking the end of a phrase
+
+
+def _build_trie(phrases: Iterable[str]) -> Dict:
+    """Build a word-level trie from whitespace separated phrases"""
+    root: Dict = {}
+    for phrase in phrases:
+        node = root
+        for word in phrase.upper().split():
+            node = node.setdefault(word, {})
+        node[_END] = True
+    return root
+
+
+class TokenExtractor:
+    """Single-pass token extraction engine backed by precompiled word tries.
+
+    Produces exactly the tokens the old regex list produced ($TOKEN, "<WORD> <hype phrase>"
+    and "<meme keyword> <currency word>") but walks every text once, word by word, instead of
+    running a several-thousand-branch alternation at every word boundary.
+    """
+
+    def __init__(self, meme_keywords: Iterable[str] = MEME_KEYWORDS,
+                 currency_words: Iterable[str] = CURRENCY_WORDS,
+                 hype_phrases: Iterable[str] = HYPE_PHRASES,
+                 stopwords: Iterable[str] = STOPWORDS,
+                 established_tokens: Iterable[str] = ESTABLISHED_TOKENS):
+        self.meme_keywords: Set[str] = {word.upper() for word in meme_keywords}
+        self.currency_trie = _build_trie(currency_words)
+        self.hype_trie = _build_trie(hype_phrases)
+        self.stopwords: Set[str] = {word.upper() for word in stopwords}
+        self.established_tokens: Set[str] = {word.upper() for word in established_tokens}
+
+    @staticmethod
+    def _match_phrase(trie: Dict, text: str, words: List[Tuple[int, int, str]], index: int) -> Optional[int]:
+        """Return the index of the last word of the phrase starting at words[index], if any"""
+        node = trie
+        last = None
+        prev_end = words[index - 1][1]
+        for i in range(index, len(words)):
+            start, end, word = words[i]
+            # Words inside a phrase may only be separated by whitespace
+            if not text[prev_end:start].isspace():
+                break
+            node = node.get(word)
+            if node is None:
+                break
+            if _END in node:
+                last = i
+                break
+            prev_end = end
+        return last
+
+    def scan(self, text: str) -> Set[str]:
+        """Return every candidate token in text, before any filtering"""
+        text = text.upper()
+        words = [(match.start(), match.end(), match.group()) for match in _WORD_RE.finditer(text)]
+        if not text.isascii():
+            words = [(start, end, word.translate(_ASCII_FOLD)) for start, end, word in words]
+
+        candidates = set()
+        hype_trie = self.hype_trie
+        currency_trie = self.currency_trie
+        meme_keywords = self.meme_keywords
+        hype_resume = 0
+        currency_resume = 0
+
+        for index in range(len(words)):
+            start, end, word = words[index]
+            is_ticker = 2 <= len(word) <= 10 and word.isascii() and word.isalpha()
+
+            # $TOKEN
+            if is_ticker and start > 0 and text[start - 1] == '$':
+                candidates.add(text[start:end])
+
+            if index + 1 == len(words):
+                break
+            next_word = words[index + 1][2]
+
+            # TOKEN coin / TOKEN to the moon / ...
+            if is_ticker and index >= hype_resume and next_word in hype_trie:
+                phrase_end = self._match_phrase(hype_trie, text, words, index + 1)
+                if phrase_end is not None:
+                    candidates.add(text[start:end])
+                    hype_resume = phrase_end + 1
+
+            # DRAGON coin / FROG dollar / ...
+            if index >= currency_resume and next_word in currency_trie and word in meme_keywords:
+                phrase_end = self._match_phrase(currency_trie, text, words, index + 1)
+                if phrase_end is not None:
+                    candidates.add(text[start:end])
+                    currency_resume = phrase_end + 1
+
+        return candidates
+
+    def accepts(self, token: str, exclude: Iterable[str] = ()) -> bool:
+        """Whether an uppercased token should be reported (not a stopword, established or excluded)"""
+        return (len(token) >= 2 and token not in exclude and not token.isdigit() and
+                token not in self.stopwords and token not in self.established_tokens)
+
+    def filter(self, candidates: Iterable[str], exclude: Iterable[str] = ()) -> List[str]:
+        """Drop stopwords, established tokens, numbers and anything in exclude from scanned candidates"""
+        tokens = set()
+        for token in candidates:
+            token = token.upper().strip()
+            if self.accepts(token, exclude):
+                tokens.add(token)
+        return list(tokens)
+
+    def extract(self, text: str, exclude: Iterable[str] = ()) -> List[str]:
+        """Extract potential token names, dropping filtered tokens and anything in exclude"""
+        return self.filter(self.scan(text), exclude)
+
+
+# Per-process extractor used by ExtractionPool workers
+_worker_extractor: Optional[TokenExtractor] = None
+
+
+def _init_worker(extractor: TokenExtractor):
+    """Keep the parent's prebuilt tries in the worker for its whole lifetime"""
+    global _worker_extractor
+    _worker_extractor = extractor
+
+
+def _scan_chunk(texts: List[str]) -> List[List[str]]:
+    return [list(_worker_extractor.scan(text)) for text in texts]
+
+
+class ExtractionCache:
+    """Bounded LRU of scan results keyed by a digest of the normalized text.
+
+    Entries hold unfiltered candidates, so changes to the known-token set never make them stale;
+    call clear() whenever the extractor (keyword lists or patterns) is replaced. Each clear()
+    starts a new generation so scans that were in flight across it can skip their put().
+    """
+
+    # Rough per-entry overhead (digest, OrderedDict node, tuple) used for the byte budget
+    ENTRY_OVERHEAD_BYTES = 120
+
+    def __init__(self, max_entries: int = 50000, max_bytes: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[bytes, Tuple[str, ...]]" = OrderedDict()
+        self.size_bytes = 0
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Uppercase and collapse whitespace runs; scan() gives identical results on the output"""
+        return ' '.join(text.upper().split())
+
+    @staticmethod
+    def key(normalized_text: str) -> bytes:
+        return hashlib.blake2b(normalized_text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+    @classmethod
+    def _entry_size(cls, candidates: Tuple[str, ...]) -> int:
+        return cls.ENTRY_OVERHEAD_BYTES + sum(len(token) for token in candidates)
+
+    def get(self, key: bytes) -> Optional[Tuple[str, ...]]:
+        candidates = self.entries.get(key)
+        if candidates is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return candidates
+
+    def put(self, key: bytes, candidates: Iterable[str]):
+        candidates = tuple(candidates)
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.size_bytes -= self._entry_size(previous)
+        self.entries[key] = candidates
+        self.size_bytes += self._entry_size(candidates)
+
+        while self.entries and (len(self.entries) > self.max_entries or self.size_bytes > self.max_bytes):
+            _, evicted = self.entries.popitem(last=False)
+            self.size_bytes -= self._entry_size(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        self.entries.clear()
+        self.size_bytes = 0
+        self.generation += 1
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "size_bytes": self.size_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "generation": self.generation,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class ExtractionPool:
+    """Cached token extraction with a process pool so large payloads never block the event loop.
+
+    Workers only scan; filtering against the caller's exclude set happens in the parent so the
+    (large, frequently changing) known-token set never has to be shipped to the workers.
+    """
+
+    def __init__(self, extractor: TokenExtractor, cache: Optional[ExtractionCache] = None,
+                 max_workers: Optional[int] = None, inline_threshold_chars: int = 20000):
+        self.extractor = extractor
+        self.cache = cache if cache is not None else ExtractionCache()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.inline_threshold_chars = inline_threshold_chars
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self):
+        """Start the worker processes (idempotent)"""
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.extractor,)
+            )
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def swap_extractor(self, extractor: TokenExtractor):
+        """Atomically replace the extractor, dropping cached results and restarting workers"""
+        self.extractor = extractor
+        self.cache.clear()
+
+        if self.executor is not None:
+            # In-flight chunks finish on the old workers; new work goes to workers with the new tries
+            old_executor = self.executor
+            self.executor = None
+            self.start()
+            old_executor.shutdown(wait=False)
+
+    async def scan_batch(self, texts: List[str]) -> List[List[str]]:
+        """Scan every text for unfiltered candidates, returning one list per input text"""
+        if not texts:
+            return []
+
+        # Small batches are cheaper inline than a round trip to the pool
+        executor = self.executor
+        if executor is None or sum(len(text) for text in texts) < self.inline_threshold_chars:
+            extractor = self.extractor
+            return [list(extractor.scan(text)) for text in texts]
+
+        loop = asyncio.get_running_loop()
+        chunk_size = -(-len(texts) // self.max_workers)
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        results = await asyncio.gather(*[
+            loop.run_in_executor(executor, _scan_chunk, chunk) for chunk in chunks
+        ])
+
+        return [candidates for chunk_result in results for candidates in chunk_result]
+
+    def extract(self, text: str, exclude: Iterable[str] = ()) -> List[str]:
+        """Extract tokens from a single text inline, going through the cache"""
+        extractor = self.extractor
+        normalized = ExtractionCache.normalize(text)
+        key = ExtractionCache.key(normalized)
+        candidates = self.cache.get(key)
+
+        if candidates is None:
+            candidates = extractor.scan(normalized)
+            self.cache.put(key, candidates)
+
+        return extractor.filter(candidates, exclude)
+
+    async def extract_batch(self, texts: List[str], exclude: Iterable[str] = ()) -> List[List[str]]:
+        """Extract tokens from every text, returning one token list per input text"""
+        normalized_texts = [ExtractionCache.normalize(text) for text in texts]
+        keys = [ExtractionCache.key(text) for text in normalized_texts]
+        results = [self.cache.get(key) for key in keys]
+
+        # Only cache misses are scanned
+        generation = self.cache.generation
+        misses = [i for i, candidates in enumerate(results) if candidates is None]
+        scanned = await self.scan_batch([normalized_texts[i] for i in misses])
+
+        for i, candidates in zip(misses, scanned):
+            # Don't cache results scanned with dictionaries that were swapped out meanwhile
+            if self.cache.generation == generation:
+                self.cache.put(keys[i], candidates)
+            results[i] = candidates
+
+        extractor = self.extractor
+        return [extractor.filter(candidates, exclude) for candidates in results]
+
+
+# Shared instance, built once at import time and used by every monitor and API path.
+# Always reach the extractor through shared_extraction_pool.extractor: it is swapped on dictionary reloads.
+shared_extraction_pool = ExtractionPool(TokenExtractor())
@@ -0,0 +1,70 @@
+import logging
+from datetime import datetime, timezone
+from pymongo import ASCENDING, UpdateOne
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+logger = logging.getLogger(__name__)
+
+# Collections that store a token_name and are looked up by it
+TOKEN_KEY_COLLECTIONS = ("token_mentions", "ca_alerts", "ca_monitoring_queue")
+
+# Indexes that serve every token lookup in the monitors and the API
+TOKEN_INDEXES = {
+    "token_mentions": [
+        [("token_key", ASCENDING), ("mentioned_at", ASCENDING)],
+        [("mentioned_at", ASCENDING), ("processed", ASCENDING)],
+    ],
+    "ca_alerts": [
+        [("token_key", ASCENDING)],
+    ],
+    "ca_monitoring_queue": [
+        [("status", ASCENDING), ("token_key", ASCENDING)],
+    ],
+}
+
+TOKEN_KEY_MIGRATION_ID = "token_key_v1"
+
+
+def token_key(token_name: str) -> str:
+    """Normalized lookup key for a token name: whitespace collapsed and uppercased"""
+    return ' '.join(str(token_name or '').split()).upper()
+
+
+async def migrate_token_keys(db: AsyncIOMotorDatabase, batch_size: int = 1000):
+    """One-time backfill of token_key on documents written before the field existed"""
+    if await db.migrations.find_one({"_id": TOKEN_KEY_MIGRATION_ID}):
+        return
+
+    for collection_name in TOKEN_KEY_COLLECTIONS:
+        collection = db[collection_name]
+        updates = []
+        migrated = 0
+
+        async for doc in collection.find({"token_key": {"$exists": False}}, {"token_name": 1}):
+            updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"token_key": token_key(doc.get("token_name"))}}))
+            if len(updates) >= batch_size:
+                await collection.bulk_write(updates, ordered=False)
+                migrated += len(updates)
+                updates = []
+
+        if updates:
+            await collection.bulk_write(updates, ordered=False)
+            migrated += len(updates)
+
+        logger.info(f"Backfilled token_key on {migrated} {collection_name} documents")
+
+    await db.migrations.insert_one({"_id": TOKEN_KEY_MIGRATION_ID, "completed_at": datetime.now(timezone.utc)})
+
+
+async def ensure_token_indexes(db: AsyncIOMotorDatabase):
+    """Run the token_key migration and make sure the token lookup indexes exist"""
+    try:
+        await migrate_token_keys(db)
+
+        for collection_name, indexes in TOKEN_INDEXES.items():
+            for keys in indexes:
+                await db[collection_name].create_index(keys)
+
+        logger.info("Token indexes ready")
+    except Exception as e:
+        logger.error(f"Error ensuring token indexes: {e}")
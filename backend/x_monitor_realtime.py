@@ -1,12 +1,28 @@
 import asyncio
 import logging
-import re
+import time
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Set
-from playwright.async_api import async_playwright, Browser, Page
-import aiohttp
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional, Set, Tuple
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from token_extractor import TokenExtractor, shared_extraction_pool
+from quorum_engine import QuorumEngine, BackgroundWrites, shared_quorum
+from token_index import token_key
+from ca_registry import KnownCARegistry, known_ca_registry
+from polling_engine import PollingEngine, DomainRateLimits
+from browser_pool import BrowserPool, NavigationTimings, navigate, BLOCKED_RESOURCE_TYPES, NETWORK_BLOCKED_RESOURCE_TYPES
+from timeline_json import TimelineCapture
+from live_pages import LiveTimelineStreamer
+from list_ingestion import XListIngestor
+from account_cursors import AccountCursors, tweet_id_from_url
+from poll_scheduler import AdaptivePollScheduler
+from http_clients import HttpClients
+from hedged_fetch import HedgedFetcher
+from rss_feeds import RssFeedFetcher
+from feed_parsing import ParsingPool
+from proxy_pool import ProxyPool
+from following_list import FollowingList
+from source_ranking import SourceRanking
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 logger = logging.getLogger(__name__)
 
@@ -18,46 +34,76 @@ class TokenCA:
         self.timestamp = timestamp or datetime.now(timezone.utc)
 
 class RealTimeXMonitor:
-    def __init__(self, db: AsyncIOMotorDatabase, alert_threshold: int = 2):
+    def __init__(self, db: AsyncIOMotorDatabase, alert_threshold: int = 2,
+                 max_concurrency: int = 10, account_timeout_seconds: float = 60.0,
+                 quorum: Optional[QuorumEngine] = None):
         self.db = db
         self.alert_threshold = alert_threshold
-        self.browser: Browser = None
-        self.page: Page = None
+        self.browser_pool = BrowserPool()
+        # "lean": block media and extract on first tweet, "full": networkidle + 2s,
+        # "network": parse the timeline API responses instead of the DOM
+        self.navigation_mode = "lean"
+        self.navigation_timings = NavigationTimings()
         self.is_monitoring = False
         self.monitored_accounts = []
-        self.known_tokens_with_ca: Set[str] = set()
+        self.known_tokens_with_ca: KnownCARegistry = known_ca_registry  # Shared, updated on every new CA
         self.token_mentions_cache = {}
         self.last_check_time = datetime.now(timezone.utc) - timedelta(hours=1)
+        self.account_cursors = AccountCursors(lookback=timedelta(hours=1))  # Per-account high-water marks
         self.ca_watchlist: Set[str] = set()  # Active tokens to monitor for CAs
         
-        # Advanced token patterns for meme coins
-        self.token_patterns = [
-            r'\$([A-Z]{2,10})\b',  # $TOKEN format
-            r'\b([A-Z]{2,10})(?:\s+(?:coin|token|gem|to\s+the\s+moon|moon|pump|lambo|rocket|bullish|bearish|hodl|diamond\s+hands))\b',
-            r'\b(PEPE|DOGE|SHIB|BONK|WIF|FLOKI|MEME|APE|WOJAK|TURBO|BRETT|POPCAT|DEGEN|MEW|BOBO|PEPE2|LADYS|BABYDOGE|DOGELON|AKITA|KISHU|SAFEMOON|HOGE|NFD|ELON|MILADY|BEN|ANDY|BART|MATT|TOSHI|HOPPY|MUMU|BENJI|POKEMON|SPURDO|BODEN|MAGA|SLERF|BOOK|MYRO|PONKE|RETARDIO|GIGACHAD|CHAD|BASED|WOJAK|AAVE|UNI|SUSHI|CAKE|BANANA|HONEY|MILK|WATER|FIRE|EARTH|WIND|THUNDER|LIGHTNING|STORM|BLAZE|FROST|ICE|SNOW|RAIN|SUN|MOON|STAR|GALAXY|COMET|METEOR|ROCKET|SPACE|ALIEN|ROBOT|NINJA|PIRATE|VIKING|KNIGHT|WARRIOR|HERO|LEGEND|KING|QUEEN|PRINCE|PRINCESS|DUKE|LORD|MASTER|BOSS|CHIEF|CAPTAIN|COMMANDER|GENERAL|ADMIRAL|EMPEROR|GOD|ZEUS|THOR|ODIN|LOKI|FREYA|VIKING|SAMURAI|SPARTA|GLADIATOR|TITAN|GIANT|DRAGON|PHOENIX|EAGLE|HAWK|WOLF|BEAR|LION|TIGER|SHARK|WHALE|DOLPHIN|OCTOPUS|SQUID|CRAB|LOBSTER|FISH|BIRD|BAT|OWL|RAVEN|CROW|SNAKE|SPIDER|SCORPION|BEE|ANT|BUTTERFLY|MOTH|LADYBUG|BEETLE|COCKROACH|FLY|MOSQUITO|WORM|SNAIL|SLUG|TURTLE|FROG|TOAD|LIZARD|GECKO|CHAMELEON|IGUANA|ALLIGATOR|CROCODILE|HIPPO|RHINO|ELEPHANT|GIRAFFE|ZEBRA|HORSE|DONKEY|MULE|COW|BULL|OX|BUFFALO|BISON|GOAT|SHEEP|LAMB|PIG|BOAR|DEER|ELK|MOOSE|CARIBOU|REINDEER|RABBIT|HARE|SQUIRREL|CHIPMUNK|BEAVER|OTTER|SEAL|WALRUS|PENGUIN|POLAR|PANDA|KOALA|KANGAROO|PLATYPUS|ECHIDNA|SLOTH|ARMADILLO|ANTEATER|HEDGEHOG|PORCUPINE|SKUNK|RACCOON|OPOSSUM|BADGER|WEASEL|FERRET|MINK|FOX|COYOTE|JACKAL|HYENA|CHEETAH|LEOPARD|JAGUAR|PUMA|LYNX|BOBCAT|SERVAL|CARACAL|OCELOT|MARGAY|JAGUARUNDI|KODKOD|ONCILLA|GUINA|SAND|DUNE|DESERT|OASIS|MIRAGE|PYRAMID|SPHINX|PHARAOH|MUMMY|TOMB|TREASURE|GOLD|SILVER|BRONZE|COPPER|IRON|STEEL|TITANIUM|PLATINUM|DIAMOND|RUBY|EMERALD|SAPPHIRE|PEARL|CRYSTAL|GEM|JEWEL|CROWN|SCEPTER|THRONE|CASTLE|PALACE|TOWER|BRIDGE|GATE|DOOR|WINDOW|WALL|ROOF|FLOOR|CEILING|ROOM|HOUSE|HOME|FAMILY|LOVE|HEART|SOUL|SPIRIT|MIND|BRAIN|DREAM|HOPE|WISH|LUCK|FORTUNE|DESTINY|FATE|KARMA|MAGIC|SPELL|CURSE|BLESSING|MIRACLE|WONDER|MYSTERY|SECRET|KEY|LOCK|CODE|PASSWORD|ACCESS|ENTER|EXIT|OPEN|CLOSE|START|STOP|GO|COME|MOVE|STAY|RUN|WALK|JUMP|FLY|SWIM|DIVE|CLIMB|FALL|RISE|UP|DOWN|LEFT|RIGHT|NORTH|SOUTH|EAST|WEST|CENTER|MIDDLE|EDGE|CORNER|SIDE|TOP|BOTTOM|FRONT|BACK|INSIDE|OUTSIDE|ABOVE|BELOW|OVER|UNDER|THROUGH|AROUND|BETWEEN|AMONG|WITHIN|WITHOUT|BEFORE|AFTER|DURING|SINCE|UNTIL|WHILE|WHEN|WHERE|WHY|HOW|WHAT|WHO|WHICH|WHOSE|WHOM|EVERYONE|SOMEONE|ANYONE|NOBODY|EVERYBODY|SOMEBODY|ANYBODY|NOTHING|EVERYTHING|SOMETHING|ANYTHING|ALL|NONE|SOME|ANY|MANY|FEW|SEVERAL|MOST|LEAST|MORE|LESS|MUCH|LITTLE|BIG|SMALL|LARGE|HUGE|TINY|GIANT|MINI|MICRO|MACRO|MEGA|GIGA|TERA|ULTRA|SUPER|HYPER|TURBO|NITRO|BOOST|POWER|ENERGY|FORCE|STRENGTH|SPEED|FAST|SLOW|QUICK|RAPID|SWIFT|FLASH|LIGHTNING|THUNDER|STORM|HURRICANE|TORNADO|TYPHOON|CYCLONE|BLIZZARD|AVALANCHE|EARTHQUAKE|TSUNAMI|VOLCANO|ERUPTION|EXPLOSION|BLAST|BOOM|BANG|CRASH|SMASH|BREAK|SHATTER|DESTROY|DEMOLISH|ANNIHILATE|OBLITERATE|VAPORIZE|EVAPORATE|MELT|FREEZE|BURN|IGNITE|FLAME|BLAZE|INFERNO|HELL|HEAVEN|PARADISE|UTOPIA|DYSTOPIA|CHAOS|ORDER|PEACE|WAR|BATTLE|FIGHT|COMBAT|CONFLICT|VICTORY|DEFEAT|WIN|LOSE|SUCCESS|FAILURE|TRIUMPH|DISASTER|CATASTROPHE|APOCALYPSE|ARMAGEDDON|JUDGMENT|DOOMSDAY|END|BEGINNING|GENESIS|CREATION|BIRTH|DEATH|LIFE|EXISTENCE|REALITY|TRUTH|LIE|FACT|FICTION|STORY|TALE|LEGEND|MYTH|FOLKLORE|HISTORY|FUTURE|PAST|PRESENT|NOW|THEN|SOON|LATER|EARLY|LATE|ON|TIME|SCHEDULE|PLAN|STRATEGY|TACTIC|METHOD|WAY|PATH|ROAD|STREET|AVENUE|BOULEVARD|HIGHWAY|FREEWAY|EXPRESSWAY|PARKWAY|LANE|ALLEY|COURT|CIRCLE|SQUARE|PLAZA|PARK|GARDEN|FOREST|JUNGLE|DESERT|MOUNTAIN|HILL|VALLEY|CANYON|CLIFF|CAVE|TUNNEL|BRIDGE|RIVER|LAKE|OCEAN|SEA|POND|STREAM|CREEK|WATERFALL|SPRING|WELL|FOUNTAIN|POOL|BEACH|SHORE|COAST|ISLAND|CONTINENT|COUNTRY|STATE|CITY|TOWN|VILLAGE|NEIGHBORHOOD|COMMUNITY|SOCIETY|CIVILIZATION|CULTURE|TRADITION|CUSTOM|RITUAL|CEREMONY|CELEBRATION|FESTIVAL|PARTY|EVENT|OCCASION|MOMENT|INSTANT|SECOND|MINUTE|HOUR|DAY|WEEK|MONTH|YEAR|DECADE|CENTURY|MILLENNIUM|ERA|AGE|EPOCH|PERIOD|PHASE|STAGE|STEP|LEVEL|DEGREE|GRADE|RANK|CLASS|CATEGORY|TYPE|KIND|SORT|VARIETY|SPECIES|BREED|RACE|ETHNICITY|NATIONALITY|CITIZENSHIP|IDENTITY|PERSONALITY|CHARACTER|TRAIT|QUALITY|ATTRIBUTE|FEATURE|ASPECT|ELEMENT|COMPONENT|PART|PIECE|FRAGMENT|SECTION|PORTION|SEGMENT|DIVISION|UNIT|ITEM|OBJECT|THING|STUFF|MATERIAL|SUBSTANCE|MATTER|ENERGY|PARTICLE|ATOM|MOLECULE|COMPOUND|MIXTURE|SOLUTION|LIQUID|SOLID|GAS|PLASMA|VACUUM|SPACE|VOID|EMPTINESS|FULLNESS|COMPLETENESS|WHOLENESS|UNITY|HARMONY|BALANCE|EQUILIBRIUM|STABILITY|INSTABILITY|CHANGE|TRANSFORMATION|EVOLUTION|REVOLUTION|INNOVATION|INVENTION|DISCOVERY|EXPLORATION|ADVENTURE|JOURNEY|TRIP|VOYAGE|EXPEDITION|MISSION|QUEST|SEARCH|HUNT|CHASE|PURSUIT|FOLLOW|LEAD|GUIDE|DIRECT|CONTROL|COMMAND|RULE|GOVERN|MANAGE|OPERATE|FUNCTION|WORK|PERFORM|ACT|BEHAVE|CONDUCT|EXECUTE|IMPLEMENT|APPLY|USE|UTILIZE|EMPLOY|HIRE|RECRUIT|TRAIN|TEACH|LEARN|STUDY|RESEARCH|INVESTIGATE|EXAMINE|ANALYZE|EVALUATE|ASSESS|JUDGE|DECIDE|CHOOSE|SELECT|PICK|PREFER|LIKE|LOVE|ADORE|CHERISH|TREASURE|VALUE|APPRECIATE|RESPECT|ADMIRE|WORSHIP|PRAISE|HONOR|CELEBRATE|COMMEMORATE|REMEMBER|RECALL|REMIND|FORGET|IGNORE|NEGLECT|ABANDON|DESERT|LEAVE|DEPART|GO|ARRIVE|COME|RETURN|COMEBACK|REVIVAL|RESURRECTION|REBIRTH|REINCARNATION|RENEWAL|REFRESH|RESTORE|REPAIR|FIX|MEND|HEAL|CURE|TREAT|MEDICINE|DRUG|PILL|TABLET|CAPSULE|INJECTION|VACCINE|ANTIDOTE|REMEDY|SOLUTION|ANSWER|RESPONSE|REPLY|REACTION|EFFECT|RESULT|OUTCOME|CONSEQUENCE|IMPACT|INFLUENCE|POWER|AUTHORITY|CONTROL|DOMINANCE|SUPREMACY|SUPERIORITY|EXCELLENCE|PERFECTION|FLAWLESSNESS|BEAUTY|ELEGANCE|GRACE|CHARM|APPEAL|ATTRACTION|MAGNETISM|CHARISMA|PERSONALITY|SPIRIT|SOUL)(?:\s+(?:coin|token|crypto|currency|money|cash|dollar|euro|yen|pound|franc|mark|ruble|peso|real|rand|rupee|dinar|dirham|riyal|shekel|won|yuan|yen|baht|dong|kip|kyat|taka|afghani|manat|som|tenge|lari|dram|leu|lev|kuna|koruna|zloty|forint|krona|krone|markka|guilder|punt|escudo|peseta|lira|drachma|denar|tolar|lat|litas|kroon|cedi|naira|shilling|birr|nakfa|leone|dalasi|ouguiya|franc|dinar|pound|pula|loti|lilangeni|rand|kwacha|metical|ariary|rupee|dollar|franc|peso|colon|quetzal|lempira|cordoba|balboa|sucre|nuevo|real|guarani|peso|uruguayo|boliviano|chileno|colombiano|venezolano|guyanese|surinamese|falkland|bermudian|cayman|jamaican|barbadian|trinidad|tobago|dominican|haitian|cuban|bahamian|canadian|american|mexican|guatemalan|belizean|salvadoran|honduran|nicaraguan|costa|rican|panamanian|ecuadorian|peruvian|brazilian|argentine|paraguayan|uruguayan|bolivian|chilean|colombian|venezuelan|guyanan|surinamer|french|british|spanish|portuguese|dutch|german|italian|swiss|austrian|belgian|luxembourg|monaco|andorran|san|marino|vatican|maltese|cypriot|greek|bulgarian|romanian|moldovan|ukrainian|belarusian|russian|estonian|latvian|lithuanian|polish|czech|slovak|hungarian|slovene|croatian|bosnian|serbian|montenegrin|albanian|macedonian|turkish|georgian|armenian|azerbaijani|kazakh|kyrgyz|tajik|turkmen|uzbek|afghan|pakistani|indian|bangladeshi|sri|lankan|maldivian|nepali|bhutanese|myanmar|thai|laotian|cambodian|vietnamese|malaysian|bruneian|singaporean|indonesian|timorese|filipino|taiwanese|chinese|japanese|south|korean|north|korean|mongolian|australian|new|zealand|fijian|papua|guinean|solomon|vanuatu|samoa|tonga|tuvalu|kiribati|nauru|marshall|micronesian|palau|hawaiian|alaskan|puerto|rican|virgin|guam|samoa|northern|mariana|cook|niue|tokelau|pitcairn|norfolk|christmas|cocos|keeling|heard|mcdonald|macquarie|antarctic|falkland|south|georgia|sandwich|tristan|cunha|ascension|saint|helena|mauritius|seychelles|comoros|madagascar|reunion|mayotte|kerguelen|crozet|amsterdam|saint|paul|prince|edward|marion|bouvet|peter|macquarie|heard|mcdonald|antarctic|ross|dependency|marie|byrd|land|queen|maud|land|enderby|land|kemp|land|mac|robertson|land|princess|elizabeth|land|wilhelm|kaiser|land|queen|mary|land|wilkes|land|adelie|land|george|land|oates|land|victoria|land|south|magnetic|pole|north|magnetic|pole|geographic|south|pole|geographic|north|pole|equator|tropic|cancer|capricorn|arctic|circle|antarctic|circle|prime|meridian|international|date|line|greenwich|mean|time|coordinated|universal|time|daylight|saving|time|standard|time|time|zone|utc|gmt|est|cst|mst|pst|edt|cdt|mdt|pdt|ast|hst|akst|akdt|nst|ndt|atlantic|pacific|mountain|central|eastern|hawaii|alaska|newfoundland|yukon|british|columbia|alberta|saskatchewan|manitoba|ontario|quebec|new|brunswick|nova|scotia|prince|edward|island|northwest|territories|nunavut|washington|oregon|california|nevada|idaho|montana|wyoming|utah|colorado|arizona|new|mexico|north|dakota|south|dakota|nebraska|kansas|oklahoma|texas|minnesota|iowa|missouri|arkansas|louisiana|wisconsin|illinois|michigan|indiana|ohio|kentucky|tennessee|mississippi|alabama|west|virginia|virginia|maryland|delaware|pennsylvania|new|jersey|new|york|connecticut|rhode|island|massachusetts|vermont|new|hampshire|maine|florida|georgia|south|carolina|north|carolina|hawaii|alaska|district|columbia|puerto|rico|virgin|islands|guam|american|samoa|northern|mariana|islands))\b'
-        ]
+        # Shared single-pass token extraction engine for meme coins (cached, process-pooled)
+        self.extraction_pool = shared_extraction_pool
+        self.extraction_cache = shared_extraction_pool.cache
         
-        # Known old/established tokens to filter out
-        self.established_tokens = {
-            'BTC', 'ETH', 'BNB', 'ADA', 'SOL', 'XRP', 'USDT', 'USDC', 'BUSD', 'MATIC', 'AVAX', 'DOT', 'UNI', 'LINK', 'ATOM', 'ICP', 'LTC', 'BCH', 'FIL', 'ALGO', 'VET', 'ETC', 'THETA', 'AAVE', 'MKR', 'COMP', 'SUSHI', 'SNX', 'YFI', 'CRV', 'BAL', '1INCH'
-        }
+        # In-memory sliding-window quorum shared with the API monitor; Mongo only receives the persisted mentions
+        self.quorum = quorum or shared_quorum
+        self.background_writes = BackgroundWrites()
+        
+        # Concurrent account polling with per-domain rate limits instead of fixed sleeps
+        self.polling_engine = PollingEngine(max_concurrency, account_timeout_seconds)
+        
+        # Decides which sources are due: active, quorum-moving accounts are polled most often
+        self.poll_scheduler = AdaptivePollScheduler(budget_interval_seconds=30)
+        self.rate_limits = DomainRateLimits()
+        self.http = HttpClients()  # Long-lived sessions for RSS and Pump.fun
+        self.proxy_pool = ProxyPool(rate_limits=self.rate_limits, trace_configs=[self.http.trace_config])
+        self.rss_fetcher = RssFeedFetcher(self.rate_limits)  # Conditional GETs, mirror racing, circuit breakers
+        self.parsing_pool = ParsingPool()  # Streaming lxml parsing; large pages go to worker processes
+        
+        # Per-account fetch: "hedged" races the sources cheapest first, "sequential" is the old fallback chain
+        self.fetch_mode = "hedged"
+        self.source_order = ["rss", "browser", "scrape"]
+        self.hedged_fetcher = HedgedFetcher(hedge_delay_seconds=1.5)
+        self.source_ranking = SourceRanking()  # Learned cheapest working source order per account
+        
+        # Hot accounts stream from persistent live pages; everyone else is polled each cycle
+        self.hot_accounts: Set[str] = set()
+        self.live_streamer = LiveTimelineStreamer(self.browser_pool, self.process_live_tweets,
+                                                  rate_limits=self.rate_limits)
+        
+        # Accounts that are members of a configured X List are read from the List timelines
+        self.x_list_ids: List[str] = []
+        self.list_ingestor = XListIngestor(self.browser_pool, self.rate_limits)
+        
+        # Followed accounts come from the last crawl at startup and are refreshed in the background
+        self.following_list = FollowingList(db, self.browser_pool, rate_limits=self.rate_limits,
+                                            on_change=self.apply_following_diff)
+        
+    @property
+    def token_extractor(self) -> TokenExtractor:
+        """Current extraction engine (replaced whenever the token dictionaries are reloaded)"""
+        return self.extraction_pool.extractor
+        
+    @property
+    def established_tokens(self) -> Set[str]:
+        """Known old/established tokens to filter out"""
+        return self.token_extractor.established_tokens
         
     async def initialize_browser(self):
-        """Initialize Playwright browser for X monitoring"""
+        """Initialize the Playwright page pool for X monitoring"""
         try:
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-features=VizDisplayCompositor',
-                    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                ]
-            )
-            self.page = await self.browser.new_page()
-            await self.page.set_viewport_size({"width": 1920, "height": 1080})
+            await self.browser_pool.start()
             logger.info("Browser initialized successfully")
             return True
         except Exception as e:
@@ -67,10 +113,7 @@ class RealTimeXMonitor:
     async def close_browser(self):
         """Close browser resources"""
         try:
-            if self.page:
-                await self.page.close()
-            if self.browser:
-                await self.browser.close()
+            await self.browser_pool.close()
             logger.info("Browser closed successfully")
         except Exception as e:
             logger.error(f"Error closing browser: {e}")
@@ -78,226 +121,303 @@ class RealTimeXMonitor:
     async def load_known_tokens_with_ca(self):
         """Load tokens that already have contract addresses to filter them out"""
         try:
-            # Load from CA alerts (tokens that already have CAs)
-            ca_alerts = await self.db.ca_alerts.find().to_list(1000)
-            for alert in ca_alerts:
-                token_name = alert.get('token_name', '').upper()
-                if token_name:
-                    self.known_tokens_with_ca.add(token_name)
-                    
-            # Add established tokens
-            self.known_tokens_with_ca.update(self.established_tokens)
+            # Stream all CA alerts (tokens that already have CAs) into the registry
+            await self.known_tokens_with_ca.load(self.db)
             
+            # Established tokens are not copied in: the extractor filters them from the live dictionary
             logger.info(f"Loaded {len(self.known_tokens_with_ca)} known tokens with CAs")
         except Exception as e:
             logger.error(f"Error loading known tokens: {e}")
             
+    async def load_recent_mentions(self):
+        """Warm the quorum engine with unprocessed mentions from the last hour (once, at startup)"""
+        await self.quorum.load(self.db)
+            
     def extract_token_names(self, text: str) -> List[str]:
         """Extract potential token names from text using advanced patterns"""
-        tokens = set()
-        text = text.upper()
-        
-        for pattern in self.token_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    token = match[0] if match[0] else (match[1] if len(match) > 1 else '')
-                else:
-                    token = match
-                    
-                token = token.upper().strip()
-                
-                # Filter out tokens that already have CAs or are established
-                if (len(token) >= 2 and token not in self.known_tokens_with_ca and 
-                    not token.isdigit() and token not in ['THE', 'AND', 'FOR', 'WITH']):
-                    tokens.add(token)
-                    
-        return list(tokens)
+        return self.extraction_pool.extract(text, self.known_tokens_with_ca)
         
-    async def check_x_timeline_with_browser(self, account_username: str) -> List[Dict]:
-        """Check X timeline using browser automation"""
-        mentions = []
-        try:
-            # Navigate to user's X profile
-            url = f"https://x.com/{account_username}"
-            await self.page.goto(url, wait_until="networkidle", timeout=30000)
-            
-            # Wait for tweets to load
-            await self.page.wait_for_timeout(2000)
-            
-            # Extract tweets from the last hour
-            tweets = await self.page.evaluate("""
-                () => {
-                    const tweets = [];
-                    const tweetElements = document.querySelectorAll('[data-testid="tweet"]');
+    async def extract_token_names_batch(self, texts: List[str]) -> List[List[str]]:
+        """Extract token names from many texts in the process pool without blocking the event loop"""
+        return await self.extraction_pool.extract_batch(texts, self.known_tokens_with_ca)
+        
+    async def extract_tweets_from_dom(self, page) -> List[Dict]:
+        """Read the first 10 rendered tweets (text, timestamp, url) from a timeline page"""
+        return await page.evaluate("""
+            () => {
+                const tweets = [];
+                const tweetElements = document.querySelectorAll('[data-testid="tweet"]');
+                
+                for (let i = 0; i < Math.min(tweetElements.length, 10); i++) {
+                    const tweet = tweetElements[i];
+                    const textElement = tweet.querySelector('[data-testid="tweetText"]');
+                    const timeElement = tweet.querySelector('time');
                     
-                    for (let i = 0; i < Math.min(tweetElements.length, 10); i++) {
-                        const tweet = tweetElements[i];
-                        const textElement = tweet.querySelector('[data-testid="tweetText"]');
-                        const timeElement = tweet.querySelector('time');
+                    if (textElement && timeElement) {
+                        const text = textElement.innerText;
+                        const timestamp = timeElement.getAttribute('datetime');
+                        const tweetUrl = tweet.querySelector('a[href*="/status/"]')?.href || '';
                         
-                        if (textElement && timeElement) {
-                            const text = textElement.innerText;
-                            const timestamp = timeElement.getAttribute('datetime');
-                            const tweetUrl = tweet.querySelector('a[href*="/status/"]')?.href || '';
-                            
-                            tweets.push({
-                                text: text,
-                                timestamp: timestamp,
-                                url: tweetUrl
-                            });
-                        }
+                        tweets.push({
+                            text: text,
+                            timestamp: timestamp,
+                            url: tweetUrl
+                        });
                     }
-                    return tweets;
                 }
-            """)
+                return tweets;
+            }
+        """)
+        
+    async def navigate(self, page, url: str, wait_until: str):
+        """page.goto through the domain's adaptive limiter"""
+        return await navigate(page, url, wait_until, self.rate_limits)
             
-            # Process tweets and extract token mentions
-            for tweet in tweets:
-                if tweet['timestamp']:
-                    tweet_time = datetime.fromisoformat(tweet['timestamp'].replace('Z', '+00:00'))
-                    
-                    # Only process tweets from the last hour
-                    if tweet_time > self.last_check_time:
-                        tokens = self.extract_token_names(tweet['text'])
-                        
-                        for token in tokens:
-                            mentions.append({
-                                'token_name': token,
-                                'account_username': account_username,
-                                'tweet_url': tweet['url'],
-                                'tweet_text': tweet['text'][:200],
-                                'mentioned_at': tweet_time
-                            })
+    async def check_x_timeline_with_browser(self, account_username: str) -> Tuple[List[Dict], List[Tuple]]:
+        """Check X timeline using browser automation; returns (mentions, seen) without moving the cursor"""
+        mentions, seen = [], []
+        try:
+            # Check a page out of the pool; other accounts use the remaining pages in parallel
+            async with self.browser_pool.page() as page:
+                # Navigate to user's X profile
+                url = f"https://x.com/{account_username}"
+                mode = self.navigation_mode
+                started = time.monotonic()
+                if mode == "network":
+                    # Exact IDs and timestamps straight from the timeline API, no DOM traversal
+                    # Promoted entries and other accounts in reply threads aren't this account's mentions
+                    async with TimelineCapture(page, author=account_username) as capture:
+                        await self.navigate(page, url, "commit")
+                        if not await capture.wait(timeout=15):
+                            logger.debug(f"No timeline response for @{account_username}")
+                        tweets = capture.tweets()
+                elif mode == "lean":
+                    # Media is blocked by the pool; extract as soon as the first tweet renders
+                    await self.navigate(page, url, "domcontentloaded")
+                    try:
+                        await page.wait_for_selector('[data-testid="tweet"]', timeout=15000)
+                    except PlaywrightTimeoutError:
+                        logger.debug(f"No tweets rendered for @{account_username}")
+                    tweets = await self.extract_tweets_from_dom(page)
+                else:
+                    await self.navigate(page, url, "networkidle")
+                
+                    # Wait for tweets to load
+                    await page.wait_for_timeout(2000)
+                    tweets = await self.extract_tweets_from_dom(page)
+                self.navigation_timings.record(mode, time.monotonic() - started)
+            
+            if not tweets:
+                # Nothing rendered at all (login wall, suspended, layout change): let another source answer
+                raise RuntimeError("no tweets on the timeline page")
+            mentions, seen = await self.scan_tweets(account_username, tweets)
                             
         except Exception as e:
-            logger.error(f"Error checking X timeline for {account_username}: {e}")
+            logger.debug(f"Error checking X timeline for {account_username}: {e}")
+            raise
             
-        return mentions
+        return mentions, seen
         
-    async def check_rss_feeds(self, account_username: str) -> List[Dict]:
-        """Check RSS feeds for X accounts (backup method)"""
+    async def scan_tweets(self, account_username: str, tweets: List[Dict]) -> Tuple[List[Dict], List[Tuple]]:
+        """Token mentions in the tweets past the account's high-water mark, and the (tweet_id, time) pairs seen"""
         mentions = []
+        
+        # Only process tweets this account hasn't had processed yet
+        recent_tweets = []
+        seen = []
+        for tweet in tweets:
+            if tweet['timestamp']:
+                tweet_time = datetime.fromisoformat(tweet['timestamp'].replace('Z', '+00:00'))
+                tweet_id = int(tweet['id']) if tweet.get('id') else tweet_id_from_url(tweet.get('url'))
+                seen.append((tweet_id, tweet_time))
+                if self.account_cursors.is_new(account_username, tweet_id, tweet_time):
+                    recent_tweets.append((tweet, tweet_time))
+                    
+        # Extract token mentions for all recent tweets in one batch
+        batch_tokens = await self.extract_token_names_batch([tweet['text'] for tweet, _ in recent_tweets])
+        
+        for (tweet, tweet_time), tokens in zip(recent_tweets, batch_tokens):
+            for token in tokens:
+                mentions.append({
+                    'token_name': token,
+                    'account_username': account_username,
+                    'tweet_url': tweet['url'],
+                    'tweet_text': tweet['text'][:200],
+                    'mentioned_at': tweet_time
+                })
+                
+        return mentions, seen
+        
+    async def mentions_from_tweets(self, account_username: str, tweets: List[Dict]) -> List[Dict]:
+        """Token mentions in the tweets past the account's high-water mark, moving the mark past them"""
+        mentions, seen = await self.scan_tweets(account_username, tweets)
+        self.advance_cursor(account_username, seen)
+        return mentions
+        
+    def count_new_tweets(self, account_username: str, seen: List[Tuple]) -> int:
+        """Distinct seen (tweet_id, time) pairs past the account's high-water mark"""
+        return len({
+            tweet_id or tweet_time for tweet_id, tweet_time in seen
+            if self.account_cursors.is_new(account_username, tweet_id, tweet_time)
+        })
+        
+    def advance_cursor(self, account_username: str, seen: List[Tuple]):
+        """Move the account's high-water mark past the seen tweets and feed the new ones to the scheduler"""
+        new_tweets = self.count_new_tweets(account_username, seen)
+        self.account_cursors.advance(account_username, seen)
+        self.poll_scheduler.record_tweets(account_username, new_tweets)
+        
+    async def process_live_tweets(self, account_username: str, tweets: List[Dict]):
+        """Feed tweets streamed from a live page straight into extraction and the quorum"""
+        mentions = await self.mentions_from_tweets(account_username, tweets)
+        if mentions:
+            await self.process_mentions_for_alerts(mentions)
+            logger.info(f"Live page: {len(mentions)} mentions from @{account_username}")
+            
+    async def check_rss_feeds(self, account_username: str) -> Tuple[List[Dict], List[Tuple]]:
+        """Check RSS feeds for X accounts (backup method); returns (mentions, seen) without moving the cursor"""
+        mentions, seen = [], []
         try:
-            # Try multiple RSS endpoints
-            rss_urls = [
-                f"https://nitter.net/{account_username}/rss",
-                f"https://nitter.it/{account_username}/rss",
-                f"https://twitter.com/{account_username}/rss"  # May not work
-            ]
+            # Conditional GET raced across the healthy mirrors; None means unchanged since the last poll
+            mirror, content, validators = await self.rss_fetcher.fetch(self.http.session("rss"), account_username)
+            if content is None:
+                return mentions, seen
+                
+            recent_items = []
+            since = self.account_cursors.since(account_username)
             
-            async with aiohttp.ClientSession() as session:
-                for rss_url in rss_urls:
-                    try:
-                        async with session.get(rss_url, timeout=10) as response:
-                            if response.status == 200:
-                                content = await response.text()
-                                soup = BeautifulSoup(content, 'xml')
-                                
-                                for item in soup.find_all('item')[:10]:
-                                    title = item.find('title')
-                                    pub_date = item.find('pubDate')
-                                    link = item.find('link')
-                                    description = item.find('description')
-                                    
-                                    if title and pub_date:
-                                        tweet_text = title.text
-                                        if description:
-                                            tweet_text += " " + description.text
-                                            
-                                        # Parse date
-                                        try:
-                                            from email.utils import parsedate_to_datetime
-                                            tweet_time = parsedate_to_datetime(pub_date.text)
-                                            
-                                            if tweet_time > self.last_check_time:
-                                                tokens = self.extract_token_names(tweet_text)
-                                                
-                                                for token in tokens:
-                                                    mentions.append({
-                                                        'token_name': token,
-                                                        'account_username': account_username,
-                                                        'tweet_url': link.text if link else '',
-                                                        'tweet_text': tweet_text[:200],
-                                                        'mentioned_at': tweet_time
-                                                    })
-                                        except:
-                                            continue
-                                            
-                                break  # Success, no need to try other URLs
-                                
-                    except:
-                        continue
-                        
+            # Parsing stops after the first 10 items instead of building the whole feed tree
+            for item in await self.parsing_pool.rss_items(content, limit=10):
+                tweet_time = item['published']
+                if item['title'] is None or tweet_time is None:
+                    continue
+                    
+                tweet_text = item['title']
+                if item['description'] is not None:
+                    tweet_text += " " + item['description']
+                tweet_url = item['link'] or ''
+                tweet_id = tweet_id_from_url(tweet_url)
+                
+                # Feeds are newest first: stop once past the account's high-water mark
+                if tweet_time < since:
+                    break
+                if not self.account_cursors.is_new(account_username, tweet_id, tweet_time):
+                    continue
+                recent_items.append((tweet_text, tweet_url, tweet_time))
+                seen.append((tweet_id, tweet_time))
+                
+            batch_tokens = await self.extract_token_names_batch([item[0] for item in recent_items])
+            
+            for (tweet_text, tweet_url, tweet_time), tokens in zip(recent_items, batch_tokens):
+                for token in tokens:
+                    mentions.append({
+                        'token_name': token,
+                        'account_username': account_username,
+                        'tweet_url': tweet_url,
+                        'tweet_text': tweet_text[:200],
+                        'mentioned_at': tweet_time
+                    })
+                    
+            # Only now is the feed safe to skip next time; a poll that failed above is refetched in full
+            self.rss_fetcher.commit(account_username, mirror, validators)
+                    
         except Exception as e:
-            logger.error(f"Error checking RSS for {account_username}: {e}")
+            logger.debug(f"Error checking RSS for {account_username}: {e}")
+            raise
             
-        return mentions
+        return mentions, seen
         
-    async def scrape_with_rotating_proxies(self, account_username: str) -> List[Dict]:
-        """Custom scraping with rotating proxies (backup method)"""
+    async def scrape_with_rotating_proxies(self, account_username: str) -> Tuple[List[Dict], List[Tuple]]:
+        """Custom scraping with rotating proxies (backup method); script mentions carry no tweet to mark seen"""
         mentions = []
         try:
-            # List of proxy servers (you would add real proxy servers here)
-            proxies = [
-                None,  # No proxy
-                # 'http://proxy1:port',
-                # 'http://proxy2:port',
-            ]
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-            }
-            
-            for proxy in proxies:
-                try:
-                    connector = aiohttp.TCPConnector()
-                    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
-                        url = f"https://x.com/{account_username}"
-                        
-                        async with session.get(url, proxy=proxy, timeout=15) as response:
-                            if response.status == 200:
-                                html = await response.text()
-                                
-                                # Basic HTML parsing for tweet content
-                                soup = BeautifulSoup(html, 'html.parser')
-                                
-                                # Look for potential tweet content
-                                for script in soup.find_all('script'):
-                                    if script.string and 'tweet' in script.string.lower():
-                                        # Extract potential token mentions from script content
-                                        tokens = self.extract_token_names(script.string)
-                                        
-                                        for token in tokens:
-                                            mentions.append({
-                                                'token_name': token,
-                                                'account_username': account_username,
-                                                'tweet_url': f"https://x.com/{account_username}",
-                                                'tweet_text': f"Extracted from {account_username}",
-                                                'mentioned_at': datetime.now(timezone.utc)
-                                            })
-                                            
-                                break  # Success
-                                
-                except:
-                    continue
+            # The pool picks the healthiest proxy with a free slot and moves on if it gets refused
+            url = f"https://x.com/{account_username}"
+            html = await self.proxy_pool.fetch(url)
+            
+            # Only the scripts carrying tweet content come back from the parsing workers
+            scripts = await self.parsing_pool.profile_scripts(html, 'tweet')
+            
+            # Extract potential token mentions from script content in the process pool
+            batch_tokens = await self.extract_token_names_batch(scripts)
+            
+            for tokens in batch_tokens:
+                for token in tokens:
+                    mentions.append({
+                        'token_name': token,
+                        'account_username': account_username,
+                        'tweet_url': url,
+                        'tweet_text': f"Extracted from {account_username}",
+                        'mentioned_at': datetime.now(timezone.utc)
+                    })
                     
         except Exception as e:
-            logger.error(f"Error scraping with proxies for {account_username}: {e}")
+            logger.debug(f"Error scraping with proxies for {account_username}: {e}")
+            raise
             
-        return mentions
+        return mentions, []
+        
+    @property
+    def source_fetchers(self) -> Dict:
+        return {
+            "rss": self.check_rss_feeds,
+            "browser": self.check_x_timeline_with_browser,
+            "scrape": self.scrape_with_rotating_proxies,
+        }
         
     async def monitor_account(self, account_username: str) -> List[Dict]:
         """Monitor a single X account using multiple methods"""
+        if self.fetch_mode == "hedged":
+            return await self.monitor_account_hedged(account_username)
+        return await self.monitor_account_sequential(account_username)
+        
+    async def monitor_account_hedged(self, account_username: str) -> List[Dict]:
+        """Race the enabled sources: first answer wins, slower ones start only after the hedge delay"""
+        fetchers = self.source_fetchers
+        order = self.source_ranking.order(account_username, self.source_order)
+        
+        async def run(fetch) -> List[Tuple[List[Dict], List[Tuple]]]:
+            # One (mentions, seen) entry per source, so simultaneous winners merge into a list of them
+            return [await fetch(account_username)]
+            
+        sources = [(name, lambda fetch=fetchers[name]: run(fetch)) for name in order]
+        hedge_delay = self.source_ranking.hedge_delay(account_username, order[0], self.hedged_fetcher.hedge_delay_seconds) if order else None
+        
+        def observe(source: str, succeeded: bool, seconds: float, results):
+            # Runs before the cursor moves, so every source is judged against the same mark
+            self.source_ranking.record(account_username, source, succeeded, seconds, sum(
+                self.count_new_tweets(account_username, seen) for _, seen in results or []
+            ))
+            
+        try:
+            source, results = await self.hedged_fetcher.fetch(sources, hedge_delay, observe)
+        except Exception as e:
+            logger.error(f"Every method failed for @{account_username}: {e}")
+            return []
+            
+        # Only the winning results move the cursor; the cancelled losers never touched it
+        mentions, seen, merged = [], [], set()
+        for source_mentions, source_seen in results:
+            seen.extend(source_seen)
+            for mention in source_mentions:
+                tweet_id = tweet_id_from_url(mention['tweet_url'])
+                if tweet_id is not None:
+                    if (tweet_id, mention['token_name']) in merged:
+                        continue
+                    merged.add((tweet_id, mention['token_name']))
+                mentions.append(mention)
+        self.advance_cursor(account_username, seen)
+        logger.info(f"Found {len(mentions)} mentions via {source} for @{account_username}")
+        return mentions
+            
+    async def monitor_account_sequential(self, account_username: str) -> List[Dict]:
+        """Try browser, then RSS, then scraping, each only if the previous found nothing"""
         all_mentions = []
         
         # Method 1: Browser automation (most reliable)
         try:
-            browser_mentions = await self.check_x_timeline_with_browser(account_username)
+            browser_mentions, seen = await self.check_x_timeline_with_browser(account_username)
+            self.advance_cursor(account_username, seen)
             all_mentions.extend(browser_mentions)
             logger.info(f"Found {len(browser_mentions)} mentions via browser for @{account_username}")
         except Exception as e:
@@ -306,7 +426,8 @@ class RealTimeXMonitor:
         # Method 2: RSS feeds (backup)
         if not all_mentions:
             try:
-                rss_mentions = await self.check_rss_feeds(account_username)
+                rss_mentions, seen = await self.check_rss_feeds(account_username)
+                self.advance_cursor(account_username, seen)
                 all_mentions.extend(rss_mentions)
                 logger.info(f"Found {len(rss_mentions)} mentions via RSS for @{account_username}")
             except Exception as e:
@@ -315,7 +436,7 @@ class RealTimeXMonitor:
         # Method 3: Custom scraping (fallback)
         if not all_mentions:
             try:
-                scrape_mentions = await self.scrape_with_rotating_proxies(account_username)
+                scrape_mentions, _ = await self.scrape_with_rotating_proxies(account_username)
                 all_mentions.extend(scrape_mentions)
                 logger.info(f"Found {len(scrape_mentions)} mentions via scraping for @{account_username}")
             except Exception as e:
@@ -323,69 +444,46 @@ class RealTimeXMonitor:
                 
         return all_mentions
         
-    async def get_sploofmeme_following_list(self) -> List[str]:
-        """Get all accounts that @Sploofmeme follows"""
-        following_accounts = []
-        try:
-            # Navigate to Sploofmeme's following page
-            url = "https://x.com/Sploofmeme/following"
-            await self.page.goto(url, wait_until="networkidle", timeout=30000)
-            
-            # Wait for the page to load
-            await self.page.wait_for_timeout(3000)
-            
-            # Scroll and collect following accounts
-            for scroll_count in range(20):  # Scroll multiple times to load more accounts
-                try:
-                    # Extract usernames from current view
-                    usernames = await self.page.evaluate("""
-                        () => {
-                            const usernames = [];
-                            const userElements = document.querySelectorAll('[data-testid="UserCell"] [href^="/"]');
-                            
-                            for (let element of userElements) {
-                                const href = element.getAttribute('href');
-                                if (href && href.startsWith('/') && !href.includes('/status/')) {
-                                    const username = href.substring(1);
-                                    if (username && !usernames.includes(username)) {
-                                        usernames.push(username);
-                                    }
-                                }
-                            }
-                            return usernames;
-                        }
-                    """)
-                    
-                    # Add new usernames to our list
-                    for username in usernames:
-                        if username not in following_accounts and username != 'Sploofmeme':
-                            following_accounts.append(username)
-                    
-                    # Scroll down to load more
-                    await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await self.page.wait_for_timeout(2000)
-                    
-                    # Stop if we haven't found new accounts in the last few scrolls
-                    if len(following_accounts) > 50 and scroll_count > 10:
-                        break
-                        
-                except Exception as e:
-                    logger.error(f"Error during scroll {scroll_count}: {e}")
-                    break
-                    
-            logger.info(f"Found {len(following_accounts)} accounts that @Sploofmeme follows")
-            return following_accounts[:1000]  # Limit to 1000 accounts for performance
-            
-        except Exception as e:
-            logger.error(f"Error getting Sploofmeme's following list: {e}")
-            return []
+    async def monitor_list(self, list_id: str) -> List[Dict]:
+        """Mentions by every member of one X List, from a single List timeline navigation"""
+        # The List's own high-water mark ends the scroll; members' marks filter the tweets
+        list_cursor = f"list:{list_id}"
+        tweets = await self.list_ingestor.fetch_list(list_id, self.account_cursors.since(list_cursor))
+        self.account_cursors.advance(list_cursor, [
+            (tweet_id_from_url(tweet['url']), datetime.fromisoformat(tweet['timestamp'].replace('Z', '+00:00')))
+            for tweet in tweets if tweet.get('timestamp')
+        ])
+        mentions = []
+        for member, member_tweets in self.list_ingestor.group_by_member(tweets).items():
+            mentions.extend(await self.mentions_from_tweets(member, member_tweets))
+        logger.info(f"Found {len(mentions)} mentions via X List {list_id} ({len(tweets)} tweets)")
+        return mentions
+        
+    async def poll_source(self, source: str) -> List[Dict]:
+        """Poll one cycle source: "list:<id>" for an X List timeline, otherwise an account"""
+        if source.startswith("list:"):
+            return await self.monitor_list(source[len("list:"):])
+        return await self.monitor_account(source)
+        
+    def apply_following_diff(self, added: List[str], removed: List[str]):
+        """Follows/unfollows found by the background crawl: update the monitored set and the scheduler"""
+        removed_keys = {account.lower() for account in removed}
+        self.monitored_accounts = [account for account in self.monitored_accounts
+                                   if account.lower() not in removed_keys] + added
+        self.list_ingestor.assign(self.monitored_accounts, self.x_list_ids)
+        list_members = self.list_ingestor.covered_accounts()
+        self.poll_scheduler.apply_diff(
+            [account for account in added if account not in self.hot_accounts and account not in list_members],
+            removed
+        )
 
     async def ultra_fast_ca_monitoring(self):
-        """ULTRA-FAST CA monitoring - checks every 2 seconds"""
+        """ULTRA-FAST CA monitoring - as often as the Pump.fun limiters allow"""
         while self.is_monitoring:
             try:
-                await self.check_for_trending_ca_alerts()
-                await asyncio.sleep(2)  # ULTRA-FAST: Check every 2 seconds for CAs
+                # Pump.fun polls are paced by its adaptive limiter; only an idle watchlist sleeps
+                if not await self.check_for_trending_ca_alerts():
+                    await asyncio.sleep(2)
             except Exception as e:
                 logger.error(f"Error in ultra-fast CA monitoring: {e}")
                 await asyncio.sleep(1)
@@ -395,32 +493,55 @@ class RealTimeXMonitor:
         try:
             self.is_monitoring = True
             
+            # Start token extraction workers and the shared HTTP sessions
+            self.extraction_pool.start()
+            self.parsing_pool.start()
+            await self.http.start()
+            
             # Initialize browser
             await self.initialize_browser()
             
-            # Get all accounts that Sploofmeme follows
-            logger.info(f"Getting all accounts that @{target_account} follows...")
-            following_accounts = await self.get_sploofmeme_following_list()
+            # Serve the followed accounts from the last crawl; only a first run has to crawl up front
+            self.following_list.account = target_account
+            following_accounts = list(await self.following_list.load())
+            if not following_accounts:
+                logger.info(f"Getting all accounts that @{target_account} follows...")
+                await self.following_list.refresh()
+                following_accounts = list(self.following_list.accounts)
             
             if not following_accounts:
                 logger.warning("No following accounts found, using fallback accounts")
                 following_accounts = ["elonmusk", "VitalikButerin", "cz_binance", "justinsuntron"]
+                # A later complete crawl diffs against these, replacing them with the real list
+                self.following_list.accounts = list(following_accounts)
             
             self.monitored_accounts = following_accounts
+            self.list_ingestor.assign(self.monitored_accounts, self.x_list_ids)
             
             # Load known tokens with CAs
             await self.load_known_tokens_with_ca()
             
-            logger.info(f"Started DUAL-SPEED monitoring: Tweets({len(following_accounts)} accounts, 30s) + CAs(2s ultra-fast)")
+            # Restore the last hour of quorum state and every account's high-water mark
+            await self.load_recent_mentions()
+            await self.account_cursors.load(self.db)
+            await self.source_ranking.load(self.db)
+            
+            logger.info(f"Started DUAL-SPEED monitoring: Tweets({len(following_accounts)} accounts, adaptive "
+                        f"~{self.poll_scheduler.budget_interval_seconds}s budget) + CAs(2s ultra-fast)")
             
             # Start ULTRA-FAST CA monitoring in parallel
             asyncio.create_task(self.ultra_fast_ca_monitoring())
             
-            # Tweet monitoring loop (30-second intervals)
+            # Open live pages for the hot accounts and keep the following list fresh
+            await self.live_streamer.start()
+            self.following_list.start()
+            
+            # Tweet monitoring loop: poll whatever the scheduler says is due, then sleep until the next one
             while self.is_monitoring:
                 try:
                     await self.monitoring_cycle()
-                    await asyncio.sleep(30)  # Tweet mentions: 30 seconds
+                    next_due = self.poll_scheduler.seconds_until_next()
+                    await asyncio.sleep(min(max(next_due if next_due is not None else 1.0, 0.5), 5.0))
                 except Exception as e:
                     logger.error(f"Error in tweet monitoring cycle: {e}")
                     await asyncio.sleep(15)
@@ -428,34 +549,47 @@ class RealTimeXMonitor:
         except Exception as e:
             logger.error(f"Error starting monitoring: {e}")
         finally:
+            await self.live_streamer.stop()
+            await self.following_list.stop()
             await self.close_browser()
+            await self.http.close()
+            await self.proxy_pool.close()
+            self.extraction_pool.shutdown()
+            self.parsing_pool.shutdown()
             
     async def monitoring_cycle(self):
-        """Single monitoring cycle - check all accounts"""
+        """Single monitoring cycle - check every source that is due concurrently"""
         try:
             current_time = datetime.now(timezone.utc)
-            all_mentions = []
+            mention_count = 0
+            
+            # Hot accounts arrive through their live pages, List members through their List timelines
+            list_members = self.list_ingestor.covered_accounts()
+            cold_accounts = [account for account in self.monitored_accounts
+                             if account not in self.hot_accounts and account not in list_members]
+            list_sources = {f"list:{list_id}": self.poll_scheduler.min_interval_seconds
+                            for list_id in self.list_ingestor.list_members}
+            self.poll_scheduler.sync(cold_accounts, list_sources)
+            
+            due_sources = self.poll_scheduler.due()
+            if not due_sources:
+                return
             
-            # Monitor each account
-            for account in self.monitored_accounts:
-                try:
-                    mentions = await self.monitor_account(account)
-                    all_mentions.extend(mentions)
-                    
-                    # Small delay between accounts to avoid rate limiting
-                    await asyncio.sleep(2)
-                    
-                except Exception as e:
-                    logger.error(f"Error monitoring @{account}: {e}")
+            # Process each source's mentions for name alerts as soon as it completes
+            async for source, mentions in self.polling_engine.poll_all(due_sources, self.poll_source):
+                self.poll_scheduler.record_poll(source)
+                if mentions:
+                    await self.process_mentions_for_alerts(mentions)
+                    mention_count += len(mentions)
                     
-            # Process all mentions for name alerts
-            await self.process_mentions_for_alerts(all_mentions)
-            
-            # Update last check time
+            # Update last check time and persist the high-water marks moved this cycle in one batch
             self.last_check_time = current_time
+            self.background_writes.submit(self.account_cursors.flush(self.db), "account cursors")
+            self.background_writes.submit(self.source_ranking.flush(self.db), "source stats")
             
-            if all_mentions:
-                logger.info(f"Monitoring cycle complete: {len(all_mentions)} new mentions found")
+            if mention_count:
+                logger.info(f"Monitoring cycle complete: {mention_count} new mentions found "
+                            f"in {self.polling_engine.last_cycle_seconds:.1f}s")
                 
         except Exception as e:
             logger.error(f"Error in monitoring cycle: {e}")
@@ -463,25 +597,36 @@ class RealTimeXMonitor:
     async def process_mentions_for_alerts(self, mentions: List[Dict]):
         """Process mentions for background tracking (no visual alerts)"""
         try:
-            # Store all mentions in database first
-            if mentions:
-                await self.db.token_mentions.insert_many(mentions)
-                
-            # Group mentions by token name for background tracking
-            token_groups = {}
+            now = datetime.now(timezone.utc)
             
+            # Count distinct accounts per token in memory
+            token_names = set()
             for mention in mentions:
                 token_name = mention['token_name'].upper()
+                self.quorum.add(token_name, mention['account_username'], mention['mentioned_at'],
+                                mention.get('tweet_url', ''), now)
+                token_names.add(token_name)
                 
-                if token_name not in token_groups:
-                    token_groups[token_name] = []
+            # Check each token for background tracking activation
+            activated = set()
+            for token_name in token_names:
+                if await self.check_for_background_tracking(token_name):
+                    activated.add(token_name)
                     
-                token_groups[token_name].append(mention)
+            # Persist mentions asynchronously; mentions of activated tokens are already processed
+            if mentions:
+                for mention in mentions:
+                    mention['token_key'] = token_key(mention['token_name'])
+                    mention['processed'] = mention['token_name'].upper() in activated
+                self.background_writes.submit(self.db.token_mentions.insert_many(mentions), "token mentions")
                 
-            # Check each token for background tracking activation
-            for token_name, token_mentions in token_groups.items():
-                # Use background tracking instead of alerts
-                await self.check_for_background_tracking(token_name)
+            for token_name in activated:
+                self.background_writes.submit(self.db.token_mentions.update_many(
+                    {"token_key": token_key(token_name)},
+                    {"$set": {"processed": True}}
+                ), f"mark {token_name} mentions processed")
+                
+            self.quorum.prune(now)
                 
         except Exception as e:
             logger.error(f"Error processing mentions for background tracking: {e}")
@@ -492,6 +637,7 @@ class RealTimeXMonitor:
             # Add to database monitoring queue
             await self.db.ca_monitoring_queue.insert_one({
                 "token_name": token_name,
+                "token_key": token_key(token_name),
                 "mention_count": mention_count,
                 "activated_at": datetime.now(timezone.utc),
                 "status": "active"
@@ -505,42 +651,33 @@ class RealTimeXMonitor:
         except Exception as e:
             logger.error(f"Error activating CA monitoring: {e}")
 
-    async def check_for_background_tracking(self, token_name: str):
+    async def check_for_background_tracking(self, token_name: str) -> bool:
         """Background tracking - no alerts, just CA monitoring activation"""
         try:
-            # Get recent mentions of this token (last hour)
-            from datetime import datetime, timedelta
-            one_hour_ago = datetime.now() - timedelta(hours=1)
-            
-            recent_mentions = await self.db.token_mentions.find({
-                "token_name": {"$regex": f"^{token_name}$", "$options": "i"},
-                "mentioned_at": {"$gte": one_hour_ago},
-                "processed": {"$ne": True}
-            }).to_list(100)
-            
-            # Group by unique accounts
-            unique_accounts = set()
-            
-            for mention in recent_mentions:
-                unique_accounts.add(mention['account_username'])
+            # Unique accounts that mentioned this token in the last hour
+            unique_accounts = self.quorum.distinct_accounts(token_name)
                 
             # If threshold met, activate CA monitoring (no visual alert)
             if len(unique_accounts) >= self.alert_threshold:
                 await self.activate_ca_monitoring(token_name, len(unique_accounts))
                 
-                # Mark mentions as processed
-                await self.db.token_mentions.update_many(
-                    {"token_name": {"$regex": f"^{token_name}$", "$options": "i"}},
-                    {"$set": {"processed": True}}
-                )
+                # Accounts that moved this token earn a larger share of the polling budget
+                for account in unique_accounts:
+                    self.poll_scheduler.record_quorum(account)
+                    
+                # Start counting this token from scratch
+                self.quorum.reset(token_name)
                 
                 logger.info(f"🔍 BACKGROUND TRACKING: {token_name} → CA monitoring activated")
+                return True
                 
         except Exception as e:
             logger.error(f"Error in background tracking: {e}")
+            
+        return False
 
-    async def check_for_trending_ca_alerts(self):
-        """ULTRA-FAST: Check for new CAs using multiple sources"""
+    async def check_for_trending_ca_alerts(self) -> bool:
+        """ULTRA-FAST: Check for new CAs using multiple sources; False when there was nothing to poll"""
         try:
             # Get tokens being monitored for CAs
             monitored_tokens = await self.db.ca_monitoring_queue.find({
@@ -548,7 +685,7 @@ class RealTimeXMonitor:
             }).to_list(100)
             
             if not monitored_tokens:
-                return
+                return False
                 
             # Create watchlist of token names for fast lookup
             watchlist = {token['token_name'].upper() for token in monitored_tokens}
@@ -558,60 +695,63 @@ class RealTimeXMonitor:
             
             # SPEED METHOD 2: Multiple WebSocket connections (if needed)
             # This runs in parallel with the main WebSocket
+            return True
             
         except Exception as e:
             logger.error(f"Error in ultra-fast CA monitoring: {e}")
+        return False
             
     async def poll_pumpfun_api_direct(self, watchlist: set):
         """Direct API polling to Pump.fun for maximum speed"""
         try:
-            # Direct API call to Pump.fun for recent tokens
-            async with aiohttp.ClientSession() as session:
-                # Try multiple endpoints for redundancy
-                endpoints = [
-                    "https://client-api-v1.pump.fun/coins?limit=50&sort=created&includeNsfw=true",
-                    "https://api.pump.fun/coins/recently-created"  # Alternative endpoint
-                ]
-                
-                for endpoint in endpoints:
-                    try:
-                        async with session.get(endpoint, timeout=5) as response:
-                            if response.status == 200:
-                                data = await response.json()
+            # Direct API call to Pump.fun for recent tokens over the shared keep-alive session
+            session = self.http.session("pump")
+            # Try multiple endpoints for redundancy
+            endpoints = [
+                "https://client-api-v1.pump.fun/coins?limit=50&sort=created&includeNsfw=true",
+                "https://api.pump.fun/coins/recently-created"  # Alternative endpoint
+            ]
+            
+            for endpoint in endpoints:
+                try:
+                    async with self.rate_limits.slot(endpoint) as slot, session.get(endpoint) as response:
+                        slot.report(response.status, response.headers.get('Retry-After'))
+                        if response.status == 200:
+                            data = await response.json()
+                            
+                            # Process recent tokens
+                            if isinstance(data, list):
+                                tokens = data
+                            elif isinstance(data, dict) and 'coins' in data:
+                                tokens = data['coins']
+                            else:
+                                continue
                                 
-                                # Process recent tokens
-                                if isinstance(data, list):
-                                    tokens = data
-                                elif isinstance(data, dict) and 'coins' in data:
-                                    tokens = data['coins']
-                                else:
-                                    continue
-                                    
-                                for token in tokens[:20]:  # Check last 20 tokens
-                                    token_name = token.get('name', '').upper()
-                                    mint_address = token.get('mint', '')
-                                    created_timestamp = token.get('created_timestamp', 0)
-                                    
-                                    # Check if token is in our watchlist
-                                    if token_name in watchlist and mint_address:
-                                        # Check if less than 60 seconds old
-                                        current_time = datetime.now(timezone.utc).timestamp()
-                                        if (current_time - created_timestamp/1000) <= 60:
-                                            
-                                            # FOUND TRENDING TOKEN WITH NEW CA!
-                                            await self.create_trending_ca_alert(
-                                                token_name, 
-                                                mint_address, 
-                                                token.get('marketCap', 0),
-                                                created_timestamp
-                                            )
-                                            
-                                break  # Success - no need to try other endpoints
+                            for token in tokens[:20]:  # Check last 20 tokens
+                                token_name = token.get('name', '').upper()
+                                mint_address = token.get('mint', '')
+                                created_timestamp = token.get('created_timestamp', 0)
                                 
-                    except Exception as e:
-                        logger.debug(f"API endpoint {endpoint} failed: {e}")
-                        continue
-                        
+                                # Check if token is in our watchlist
+                                if token_name in watchlist and mint_address:
+                                    # Check if less than 60 seconds old
+                                    current_time = datetime.now(timezone.utc).timestamp()
+                                    if (current_time - created_timestamp/1000) <= 60:
+                                        
+                                        # FOUND TRENDING TOKEN WITH NEW CA!
+                                        await self.create_trending_ca_alert(
+                                            token_name, 
+                                            mint_address, 
+                                            token.get('marketCap', 0),
+                                            created_timestamp
+                                        )
+                                        
+                            break  # Success - no need to try other endpoints
+                            
+                except Exception as e:
+                    logger.debug(f"API endpoint {endpoint} failed: {e}")
+                    continue
+                    
         except Exception as e:
             logger.error(f"Error in direct API polling: {e}")
             
@@ -620,8 +760,8 @@ class RealTimeXMonitor:
         try:
             # Get monitoring data
             monitored_token = await self.db.ca_monitoring_queue.find_one({
-                "token_name": {"$regex": f"^{token_name}$", "$options": "i"},
-                "status": "active"
+                "status": "active",
+                "token_key": token_key(token_name)
             })
             
             if not monitored_token:
@@ -631,6 +771,7 @@ class RealTimeXMonitor:
             ca_alert = {
                 'contract_address': ca_address,
                 'token_name': token_name,
+                'token_key': token_key(token_name),
                 'market_cap': market_cap,
                 'photon_url': f"https://photon-sol.tinyastro.io/en/lp/{ca_address}?timeframe=1s",
                 'alert_time_utc': datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
@@ -643,6 +784,7 @@ class RealTimeXMonitor:
             
             # Store in database
             await self.db.ca_alerts.insert_one(ca_alert)
+            self.known_tokens_with_ca.add(token_name)
             
             # Mark monitoring as completed
             await self.db.ca_monitoring_queue.update_one(
@@ -661,10 +803,72 @@ class RealTimeXMonitor:
     async def stop_monitoring(self):
         """Stop monitoring"""
         self.is_monitoring = False
+        await self.live_streamer.stop()
+        await self.following_list.stop()
         await self.close_browser()
+        await self.http.close()
+        await self.proxy_pool.close()
+        self.extraction_pool.shutdown()
+        self.parsing_pool.shutdown()
+        await self.account_cursors.flush(self.db)
+        await self.source_ranking.flush(self.db)
+        await self.background_writes.drain()
         logger.info("Real-time monitoring stopped")
         
     def set_alert_threshold(self, threshold: int):
         """Set the number of accounts needed to trigger an alert"""
         self.alert_threshold = threshold
-        logger.info(f"Alert threshold set to {threshold} accounts")
\ No newline at end of file
+        logger.info(f"Alert threshold set to {threshold} accounts")
+        
+    def set_hot_accounts(self, accounts: List[str]):
+        """Stream these accounts from dedicated live pages instead of polling them"""
+        hot_accounts = {account.lstrip('@') for account in accounts if account}
+        for account in self.hot_accounts - hot_accounts:
+            self.live_streamer.unwatch(f"@{account}")
+        for account in hot_accounts - self.hot_accounts:
+            self.live_streamer.watch(f"@{account}", f"https://x.com/{account}", account)
+        self.hot_accounts = hot_accounts
+        logger.info(f"{len(hot_accounts)} hot accounts streamed from live pages")
+        
+    def set_x_lists(self, list_ids: List[str]):
+        """Read the monitored accounts from these X Lists, assigned to them in List-sized chunks"""
+        self.x_list_ids = [str(list_id) for list_id in list_ids if list_id]
+        self.list_ingestor.assign(self.monitored_accounts, self.x_list_ids)
+        logger.info(f"Ingesting {len(self.list_ingestor.covered_accounts())} accounts from {len(self.x_list_ids)} X Lists")
+        
+    async def set_navigation_mode(self, mode: str):
+        """Switch timeline navigation between "lean", "full" and "network" (timeline JSON capture)"""
+        if mode not in ("lean", "full", "network"):
+            raise ValueError(f"Unknown navigation mode: {mode}")
+        self.navigation_mode = mode
+        # "full" loads pages unrouted, exactly like a plain browser
+        await self.browser_pool.set_resource_blocking(
+            mode != "full", NETWORK_BLOCKED_RESOURCE_TYPES if mode == "network" else BLOCKED_RESOURCE_TYPES
+        )
+        logger.info(f"Navigation mode set to {mode}")
+        
+    async def set_scrape_proxies(self, proxies: List[Optional[str]]):
+        """Replace the scrape path's proxies (None is the direct connection)"""
+        await self.proxy_pool.update_proxies(proxies)
+        
+    def set_fetch_config(self, fetch_mode: str, hedge_delay_seconds: float, enabled_sources: List[str]):
+        """Choose hedged or sequential per-account fetching and which sources take part"""
+        self.fetch_mode = fetch_mode
+        self.hedged_fetcher.hedge_delay_seconds = hedge_delay_seconds
+        self.source_order = [name for name in ("rss", "browser", "scrape") if name in enabled_sources]
+        logger.info(f"Account fetch: {fetch_mode}, sources {self.source_order}, hedge delay {hedge_delay_seconds}s")
+        
+    def set_polling_budget(self, budget_interval_seconds: float, min_interval_seconds: float,
+                           max_interval_seconds: float):
+        """Average seconds between polls per account, shared out by activity within [min, max]"""
+        self.poll_scheduler.budget_interval_seconds = budget_interval_seconds
+        self.poll_scheduler.min_interval_seconds = min_interval_seconds
+        self.poll_scheduler.max_interval_seconds = max_interval_seconds
+        logger.info(f"Polling budget: one poll per account every {budget_interval_seconds}s on average "
+                    f"({min_interval_seconds}s-{max_interval_seconds}s)")
+        
+    def set_polling_config(self, max_concurrency: int, account_timeout_seconds: float):
+        """Set how many accounts are polled at once and how long one account may take"""
+        self.polling_engine.max_concurrency = max_concurrency
+        self.polling_engine.account_timeout_seconds = account_timeout_seconds
+        logger.info(f"Polling {max_concurrency} accounts at once, {account_timeout_seconds}s timeout per account")
\ No newline at end of file
@@ -0,0 +1,176 @@
+import asyncio
+import socket
+import sys
+import threading
+from itertools import count
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+# Backend modules import each other as top-level modules (see backend/server.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+
+@pytest.fixture
+def http_server():
+    """Factory for local aiohttp servers: http_server({path: handler}) returns the base URL.
+
+    The servers run on their own event loop in a background thread, so tests can drive their
+    clients with asyncio.run as usual; every server is stopped when the test ends.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    runners = []
+
+    async def start(routes, sock):
+        app = web.Application()
+        for path, handler in routes.items():
+            app.router.add_get(path, handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.SockSite(runner, sock).start()
+        return runner
+
+    def serve(routes) -> str:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        runners.append(asyncio.run_coroutine_threadsafe(start(routes, sock), loop).result(timeout=10))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+    try:
+        yield serve
+    finally:
+        for runner in runners:
+            asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result(timeout=10)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=10)
+        loop.close()
+
+
+def _matches(doc, query) -> bool:
+    for field, condition in (query or {}).items():
+        value = doc.get(field)
+        if not isinstance(condition, dict):
+            if value != condition:
+                return False
+            continue
+        for operator, operand in condition.items():
+            if operator == "$exists" and (field in doc) != operand:
+                return False
+            if operator == "$in" and value not in operand:
+                return False
+            if operator == "$ne" and value == operand:
+                return False
+            if operator == "$gte" and (value is None or value < operand):
+                return False
+    return True
+
+
+class FakeCursor:
+    """Async cursor over a snapshot of documents; `during` runs once, after the first one is read"""
+
+    def __init__(self, docs, during=None):
+        self.docs = docs
+        self.during = during
+        self.batch = None
+
+    def batch_size(self, size):
+        self.batch = size
+        return self
+
+    def __aiter__(self):
+        self.iterator = iter(self.docs)
+        return self
+
+    async def __anext__(self):
+        try:
+            doc = next(self.iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+        if self.during:
+            self.during()
+            self.during = None
+        return doc
+
+
+class FakeCollection:
+    """The slice of a Motor collection the backend uses, over an in-memory dict keyed by _id"""
+
+    def __init__(self):
+        self.docs = {}
+        self.ids = count(1)
+        self.queries = []
+        self.cursors = []
+        self.bulk_writes = []
+        self.indexes = []
+        self.during = None
+
+    def _insert(self, doc):
+        doc = dict(doc)
+        self.docs[doc.setdefault("_id", next(self.ids))] = doc
+        return doc
+
+    def seed(self, docs):
+        for doc in docs:
+            self._insert(doc)
+        return self
+
+    def find(self, query=None, projection=None):
+        self.queries.append((query, projection))
+        cursor = FakeCursor([doc for doc in self.docs.values() if _matches(doc, query)], self.during)
+        self.during = None
+        self.cursors.append(cursor)
+        return cursor
+
+    async def find_one(self, query):
+        return next((doc for doc in self.docs.values() if _matches(doc, query)), None)
+
+    async def insert_one(self, doc):
+        self._insert(doc)
+
+    def _update(self, query, update, upsert):
+        doc = next((doc for doc in self.docs.values() if _matches(doc, query)), None)
+        if doc is None:
+            if not upsert:
+                return
+            doc = self._insert({field: value for field, value in query.items() if not isinstance(value, dict)})
+        doc.update(update.get("$set", {}))
+
+    async def update_one(self, query, update, upsert=False):
+        self._update(query, update, upsert)
+
+    async def delete_one(self, query):
+        doc = await self.find_one(query)
+        if doc is not None:
+            del self.docs[doc["_id"]]
+
+    async def bulk_write(self, requests, ordered=True):
+        self.bulk_writes.append(len(requests))
+        for request in requests:
+            self._update(request._filter, request._doc, request._upsert)
+
+    async def create_index(self, keys, **options):
+        self.indexes.append((keys, options))
+
+
+class FakeDB:
+    """Collections are created on first access, by attribute or by name"""
+
+    def __init__(self):
+        self.collections = {}
+
+    def __getitem__(self, name):
+        return self.collections.setdefault(name, FakeCollection())
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self[name]
+
+
+@pytest.fixture
+def fake_db():
+    """An empty in-memory stand-in for the Motor database"""
+    return FakeDB()
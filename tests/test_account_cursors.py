@@ -0,0 +1,49 @@
+import asyncio
+from datetime import datetime, timezone, timedelta
+
+from account_cursors import AccountCursors, tweet_id_from_url
+
+
+def test_tweet_id_from_url():
+    assert tweet_id_from_url("https://x.com/frogwhale/status/1846000000000000123") == 1846000000000000123
+    assert tweet_id_from_url("https://nitter.net/frogwhale/status/42#m") == 42
+    assert tweet_id_from_url("https://x.com/frogwhale") is None
+
+
+def test_cursor_only_admits_tweets_past_the_high_water_mark():
+    cursors = AccountCursors(lookback=timedelta(hours=1))
+    now = datetime.now(timezone.utc)
+
+    # No mark yet: the last hour counts
+    assert cursors.is_new("FrogWhale", 100, now - timedelta(minutes=30))
+    assert not cursors.is_new("FrogWhale", 50, now - timedelta(hours=2))
+
+    cursors.advance("@FrogWhale", [(100, now - timedelta(minutes=30)), (90, now - timedelta(minutes=40))])
+    assert not cursors.is_new("frogwhale", 100, now - timedelta(minutes=30))
+    assert cursors.is_new("frogwhale", 101, now - timedelta(minutes=29))
+    # Without an ID the timestamp decides
+    assert cursors.is_new("frogwhale", None, now - timedelta(minutes=1))
+    assert cursors.since("frogwhale") == datetime.fromtimestamp((now - timedelta(minutes=30)).timestamp(), timezone.utc)
+
+    # Marks never move back
+    cursors.advance("frogwhale", [(10, now - timedelta(hours=3))])
+    assert cursors.marks["frogwhale"][0] == 100
+
+
+def test_cursors_flush_in_batches_and_survive_a_restart(fake_db):
+    db = fake_db
+    now = datetime.now(timezone.utc)
+    cursors = AccountCursors()
+    for n in range(5):
+        cursors.advance(f"account{n}", [(1000 + n, now)])
+
+    assert asyncio.run(cursors.flush(db, batch_size=2)) == 5
+    assert db.account_cursors.bulk_writes == [2, 2, 1]
+    assert not cursors.dirty
+    assert asyncio.run(cursors.flush(db)) == 0
+
+    restarted = AccountCursors()
+    asyncio.run(restarted.load(db))
+    assert len(restarted) == 5
+    assert not restarted.is_new("account3", 1003, now)
+    assert restarted.is_new("account3", 1004, now)
@@ -0,0 +1,179 @@
+import asyncio
+
+import pytest
+
+from browser_pool import BrowserPool, NavigationTimings, is_blocked_request
+
+
+class FakePage:
+    def __init__(self):
+        self.main_frame = object()
+        self.handlers = {}
+        self.closed = False
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    async def goto(self, url):
+        self.handlers["framenavigated"](self.main_frame)
+
+    async def evaluate(self, script):
+        return 1
+
+
+class FakeContext:
+    def __init__(self):
+        self.handler = None
+
+    async def route(self, pattern, handler):
+        self.handler = handler
+
+    async def unroute(self, pattern, handler):
+        assert handler == self.handler
+        self.handler = None
+
+    async def new_page(self):
+        page = FakePage()
+        page.context = self
+        return page
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        return FakeContext()
+
+    async def close(self):
+        self.connected = False
+
+
+class FakeChromium:
+    def __init__(self):
+        self.launches = 0
+
+    async def launch(self, **kwargs):
+        self.launches += 1
+        return FakeBrowser()
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+
+    async def stop(self):
+        pass
+
+
+def test_pool_hands_out_distinct_pages_and_waits_when_exhausted():
+    pool = BrowserPool(browsers=2, contexts_per_browser=2, pages_per_context=1)
+
+    async def run():
+        await pool.start(FakePlaywright())
+        active = 0
+        peak = 0
+
+        async def use():
+            nonlocal active, peak
+            async with pool.page():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(use() for _ in range(10)))
+        return peak
+
+    assert asyncio.run(run()) == 4
+    assert pool.get_stats()["idle_pages"] == 4
+    assert len(pool.slots) == 4
+
+
+def test_checkout_fails_fast_when_the_pool_is_not_started():
+    pool = BrowserPool()
+
+    async def run():
+        with pytest.raises(RuntimeError, match="not started"):
+            await asyncio.wait_for(pool.checkout(), timeout=1)
+
+    asyncio.run(run())
+
+
+def test_pool_recycles_after_max_navigations_and_crashes():
+    pool = BrowserPool(browsers=1, contexts_per_browser=1, pages_per_context=1, max_navigations=2)
+    playwright = FakePlaywright()
+
+    async def run():
+        await pool.start(playwright)
+        pages = []
+        for _ in range(3):
+            async with pool.page() as page:
+                await page.goto("https://x.com/a")
+                await page.goto("https://x.com/b")
+                pages.append(page)
+        assert len(set(map(id, pages))) == 3
+        assert all(page.closed for page in pages)
+
+        async with pool.page() as page:
+            page.handlers["crash"](page)
+        assert pool.crashes == 1
+
+        # A dead Chromium process is relaunched before the next checkout
+        pool.browsers[0].connected = False
+        async with pool.page() as page:
+            assert not page.closed
+
+    asyncio.run(run())
+    assert playwright.chromium.launches == 2
+    assert pool.recycled == 5
+
+
+def test_requests_are_only_routed_while_blocking_is_on():
+    pool = BrowserPool(browsers=1, contexts_per_browser=2, pages_per_context=1, block_resources=False)
+
+    async def run():
+        await pool.start(FakePlaywright())
+        contexts = [slot.context for slot in pool.slots] + [(await pool.open_dedicated_page()).context]
+        # "full" mode: nothing goes through Python, so Chromium keeps its HTTP cache
+        unrouted = [context.handler for context in contexts]
+        await pool.set_resource_blocking(True)
+        routed = [context.handler for context in contexts]
+        await pool.set_resource_blocking(False)
+        return unrouted, routed, [context.handler for context in contexts]
+
+    unrouted, routed, unrouted_again = asyncio.run(run())
+    assert unrouted == [None] * 3 and unrouted_again == [None] * 3
+    assert routed == [pool._route] * 3
+
+
+def test_lean_navigation_blocks_media_fonts_and_analytics():
+    assert is_blocked_request("image", "https://pbs.twimg.com/media/x.jpg")
+    assert is_blocked_request("font", "https://abs.twimg.com/fonts/chirp.woff2")
+    assert is_blocked_request("xhr", "https://www.google-analytics.com/collect")
+    assert is_blocked_request("script", "https://static.ads-twitter.com/uwt.js")
+    assert not is_blocked_request("document", "https://x.com/elonmusk")
+    assert not is_blocked_request("xhr", "https://x.com/i/api/graphql/UserTweets")
+
+
+def test_navigation_timings_are_kept_per_mode():
+    timings = NavigationTimings(max_samples=3)
+    for seconds in (4.0, 5.0, 6.0):
+        timings.record("full", seconds)
+    for seconds in (5.0, 1.0, 2.0, 1.5):
+        timings.record("lean", seconds)
+
+    stats = timings.get_stats()
+    assert stats["full"]["avg_seconds"] == 5.0
+    assert stats["lean"]["navigations"] == 4
+    assert stats["lean"]["p50_seconds"] == 1.5
+    assert stats["lean"]["last_seconds"] == 1.5
@@ -0,0 +1,45 @@
+import asyncio
+
+from ca_registry import KnownCARegistry
+
+
+def test_membership_uses_normalized_token_keys():
+    registry = KnownCARegistry()
+    registry.add("Dog  Wif Hat")
+    registry.update(["bonk", "BONK"])
+
+    assert "DOG WIF HAT" in registry
+    assert "Bonk" in registry
+    assert "WIF" not in registry
+    assert len(registry) == 2
+
+
+def test_load_streams_alerts_in_batches_with_token_name_fallback(fake_db):
+    registry = KnownCARegistry()
+    db = fake_db
+    db.ca_alerts.seed([
+        {"token_key": "BONK", "token_name": "ignored"},
+        {"token_name": " dog  wif hat "},
+        {"token_name": None},
+    ])
+
+    asyncio.run(registry.load(db, batch_size=2))
+    assert db.ca_alerts.cursors[0].batch == 2
+    assert db.ca_alerts.queries == [({}, {"token_key": 1, "token_name": 1})]
+    assert set(registry) == {"BONK", "DOG WIF HAT"}
+    assert registry.loaded and registry.loaded_at is not None
+
+    # Loaded once unless forced
+    asyncio.run(registry.load(db))
+    assert len(db.ca_alerts.queries) == 1
+
+
+def test_reload_keeps_cas_added_while_it_runs(fake_db):
+    registry = KnownCARegistry()
+    registry.add("OLD")
+    fake_db.ca_alerts.seed([{"token_key": "PEPE"}, {"token_key": "WIF"}])
+    # Something else registers a CA while the stream is still running
+    fake_db.ca_alerts.during = lambda: registry.add("fresh")
+
+    asyncio.run(registry.load(fake_db, force=True))
+    assert set(registry) == {"OLD", "PEPE", "WIF", "FRESH"}
@@ -0,0 +1,49 @@
+import asyncio
+from datetime import datetime, timezone
+
+from feed_parsing import ParsingPool, extract_scripts, parse_rss_items
+
+
+def feed(count: int, tail: bytes = b"</channel></rss>") -> bytes:
+    items = b"".join(
+        b"<item><title>$PEPE %d</title><pubDate>Mon, 06 Jan 2025 10:00:00 -0000</pubDate>"
+        b"<link>https://nitter.net/a/status/%d#m</link><description>&lt;p&gt;gm&lt;/p&gt;</description></item>" % (n, n)
+        for n in range(count)
+    )
+    return b'<?xml version="1.0" encoding="UTF-8"?><rss><channel><title>feed</title>' + items + tail
+
+
+def test_rss_parsing_stops_after_the_items_it_needs():
+    # Everything after the 10th item is never looked at, even when it's broken
+    items = parse_rss_items(feed(12, tail=b"<item><title>unterminated"), limit=10)
+
+    assert len(items) == 10
+    assert items[0] == {
+        "title": "$PEPE 0",
+        "description": "<p>gm</p>",
+        "link": "https://nitter.net/a/status/0#m",
+        "published": datetime(2025, 1, 6, 10, tzinfo=timezone.utc)
+    }
+    assert parse_rss_items(b"not a feed") == []
+
+
+def test_large_pages_are_parsed_in_workers_and_only_tweet_scripts_come_back():
+    filler = b"<div>" + b"<span>padding</span>" * 5000 + b"</div>"
+    html = (b"<html><head><script>window.tweet = {\"text\": \"$WIF\"}</script><script>analytics()</script>"
+            b"</head><body>" + filler + b"<div><script>TweetState = 1</script></div></body></html>")
+    assert extract_scripts(html) == ['window.tweet = {"text": "$WIF"}', "TweetState = 1"]
+
+    async def run():
+        pool = ParsingPool(max_workers=1, inline_threshold_bytes=10 * 1024)
+        pool.start()
+        try:
+            scripts = await pool.profile_scripts(html)
+            items = await pool.rss_items(feed(3))
+            return scripts, items, pool.get_stats()
+        finally:
+            pool.shutdown()
+
+    scripts, items, stats = asyncio.run(run())
+    assert scripts == extract_scripts(html)
+    assert len(items) == 3
+    assert stats == {"workers": 1, "inline": 1, "offloaded": 1}
@@ -0,0 +1,94 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from following_list import READ_USER_CELLS_JS, FollowingList
+from poll_scheduler import AdaptivePollScheduler
+
+
+class FakeFollowingPage:
+    """A following page that renders a window of cells and loads the next batch on each scroll"""
+
+    def __init__(self, batches):
+        self.batches = batches
+        self.loaded = 1
+        self.grew = False
+        self.visited = []
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        self.visited.append(url)
+
+    async def wait_for_selector(self, selector, timeout=None):
+        return True
+
+    async def evaluate(self, script):
+        if script == READ_USER_CELLS_JS:
+            # Virtualised list: only the latest two batches stay in the DOM
+            return [name for batch in self.batches[max(0, self.loaded - 2):self.loaded] for name in batch]
+        if self.loaded < len(self.batches):
+            self.loaded += 1
+            self.grew = True
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        if not self.grew:
+            raise PlaywrightTimeoutError("no new cells")
+        self.grew = False
+
+
+class FakePool:
+    def __init__(self, page):
+        self.current = page
+
+    @asynccontextmanager
+    async def page(self):
+        yield self.current
+
+
+def test_crawl_scrolls_to_the_end_with_set_dedup(fake_db):
+    page = FakeFollowingPage([["alice", "Bob", "Sploofmeme"], ["bob", "carol"], ["dave"]])
+    following = FollowingList(fake_db, FakePool(page), account="Sploofmeme")
+
+    accounts, complete = asyncio.run(following.crawl())
+
+    assert page.visited == ["https://x.com/Sploofmeme/following"]
+    assert list(accounts.values()) == ["alice", "Bob", "carol", "dave"]
+    assert complete
+
+
+def test_startup_serves_the_snapshot_and_refreshes_emit_diffs(fake_db):
+    db = fake_db
+    db.following_snapshots.seed([{"_id": "sploofmeme", "accounts": ["alice", "bob", "erin"]}])
+    page = FakeFollowingPage([["alice", "bob"], ["carol"]])
+    diffs = []
+    following = FollowingList(db, FakePool(page), on_change=lambda added, removed: diffs.append((added, removed)))
+
+    async def run():
+        loaded = list(await following.load())
+        return loaded, await following.refresh()
+
+    loaded, diff = asyncio.run(run())
+    assert loaded == ["alice", "bob", "erin"]
+    assert diff == (["carol"], ["erin"]) and diffs == [diff]
+    assert db.following_snapshots.docs["sploofmeme"]["accounts"] == ["alice", "bob", "carol"]
+    assert following.get_stats()["last_refresh"]["complete"]
+
+    # Diffs go straight to the scheduler: new follows are due now, unfollows stop being polled
+    scheduler = AdaptivePollScheduler()
+    scheduler.sync(["alice", "bob", "erin"], now=0)
+    scheduler.due(now=0)
+    scheduler.apply_diff(*diff, now=1)
+    assert scheduler.due(now=1) == ["carol"]
+    assert "erin" not in scheduler.sources
+
+
+def test_an_interrupted_crawl_never_drops_accounts(fake_db):
+    following = FollowingList(fake_db, pool=None)
+    following.accounts = ["alice", "bob"]
+
+    async def partial_crawl():
+        return {"alice": "alice", "carol": "carol"}, False
+
+    following.crawl = partial_crawl
+    assert asyncio.run(following.refresh()) == (["carol"], [])
+    assert following.accounts == ["alice", "bob", "carol"]
@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+import pytest
+
+from hedged_fetch import AllSourcesFailed, HedgedFetcher
+
+
+def source(delay, result=None, error=None, log=None, name=None):
+    async def fetch():
+        if log is not None:
+            log.append(name)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(f"{name} cancelled")
+            raise
+        if error:
+            raise error
+        return result
+    return fetch
+
+
+def test_fast_first_source_wins_without_starting_the_others():
+    fetcher = HedgedFetcher(hedge_delay_seconds=0.5)
+    log = []
+    sources = [("rss", source(0.01, ["a"], log=log, name="rss")),
+               ("browser", source(1, ["b"], log=log, name="browser"))]
+
+    assert asyncio.run(fetcher.fetch(sources)) == ("rss", ["a"])
+    assert log == ["rss"]
+    assert fetcher.get_stats()["hedges"] == 0
+
+
+def test_slow_source_is_hedged_and_the_loser_cancelled():
+    fetcher = HedgedFetcher(hedge_delay_seconds=0.1)
+    log = []
+    sources = [("rss", source(1, ["slow"], log=log, name="rss")),
+               ("browser", source(0.01, [], log=log, name="browser")),
+               ("scrape", source(1, ["never"], log=log, name="scrape"))]
+
+    async def run():
+        started = time.monotonic()
+        result = await fetcher.fetch(sources)
+        await asyncio.sleep(0)
+        return result, time.monotonic() - started
+
+    (winner, result), elapsed = asyncio.run(run())
+    # An empty answer from a healthy source is still an answer
+    assert (winner, result) == ("browser", [])
+    assert elapsed < 0.5
+    assert "rss cancelled" in log and "scrape" not in log
+    assert fetcher.hedges == 1
+
+
+def test_failures_hedge_immediately_and_all_failures_raise():
+    fetcher = HedgedFetcher(hedge_delay_seconds=10)
+    sources = [("rss", source(0, error=RuntimeError("no RSS feed answered"))),
+               ("browser", source(0.01, ["b"]))]
+    assert asyncio.run(fetcher.fetch(sources)) == ("browser", ["b"])
+
+    with pytest.raises(AllSourcesFailed) as failed:
+        asyncio.run(fetcher.fetch([("rss", source(0, error=RuntimeError("down"))),
+                                   ("scrape", source(0, error=RuntimeError("blocked")))]))
+    assert set(failed.value.errors) == {"rss", "scrape"}
+    assert fetcher.get_stats()["failures"] == {"rss": 2, "scrape": 1}
+    assert fetcher.exhausted == 1
@@ -0,0 +1,35 @@
+import asyncio
+
+from aiohttp import web
+
+from http_clients import HttpClients
+
+
+async def coins(request):
+    return web.json_response([{"name": "PEPE"}])
+
+
+def test_shared_sessions_are_reused_and_time_requests_per_host(http_server):
+    base_url = http_server({"/coins": coins})
+
+    async def run():
+        clients = HttpClients(profiles={"pump": {"limit": 4, "limit_per_host": 2, "timeout": 2}})
+        try:
+            await clients.start()
+            session = clients.session("pump")
+            for _ in range(3):
+                async with clients.session("pump").get(f"{base_url}/coins") as response:
+                    assert await response.json() == [{"name": "PEPE"}]
+            async with clients.session("pump").get(f"{base_url}/missing") as response:
+                assert response.status == 404
+            return session, clients.session("pump"), clients.get_stats()
+        finally:
+            await clients.close()
+
+    first, again, stats = asyncio.run(run())
+    assert first is again
+    assert stats["sessions"] == {"pump": True}
+    host = stats["hosts"]["127.0.0.1"]
+    assert host["requests"] == 4
+    assert host["statuses"] == {200: 3, 404: 1}
+    assert host["errors"] == 0
@@ -0,0 +1,106 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+import pytest
+
+from browser_pool import BrowserPool
+from list_ingestion import XListIngestor, chunk_accounts
+
+FIXTURE_URL = (Path(__file__).parent / "fixtures" / "x_list_timeline.html").as_uri()
+
+
+def test_accounts_are_assigned_to_lists_in_member_limit_chunks():
+    ingestor = XListIngestor(pool=None, member_limit=2)
+    accounts = ["FrogWhale", "memelord", "alice", "bob", "carol"]
+
+    assert chunk_accounts(accounts, 2) == [["FrogWhale", "memelord"], ["alice", "bob"], ["carol"]]
+    assert ingestor.assign(accounts, ["101", "102"]) == {"101": ["FrogWhale", "memelord"], "102": ["alice", "bob"]}
+    assert ingestor.covered_accounts() == {"FrogWhale", "memelord", "alice", "bob"}
+
+    grouped = ingestor.group_by_member([
+        {"username": "frogwhale", "url": "1"},
+        {"username": "carol", "url": "2"},
+        {"username": "bob", "url": "3"},
+        {"username": "FROGWHALE", "url": "4"},
+    ])
+    assert {member: [t["url"] for t in tweets] for member, tweets in grouped.items()} == {
+        "FrogWhale": ["1", "4"], "bob": ["3"]
+    }
+
+
+def test_fetch_list_scrolls_the_fixture_timeline_back_to_the_last_check():
+    pool = BrowserPool(browsers=1, contexts_per_browser=1, pages_per_context=1)
+    ingestor = XListIngestor(pool, url_template=FIXTURE_URL, scroll_pause_ms=300)
+    ingestor.assign(["frogwhale", "memelord"], ["fixture"])
+
+    async def run():
+        try:
+            await pool.start()
+        except Exception as e:
+            pytest.skip(f"Chromium not available: {e}")
+        try:
+            since = datetime.now(timezone.utc) - timedelta(minutes=60)
+            return since, await ingestor.fetch_list("fixture", since)
+        finally:
+            await pool.close()
+
+    since, tweets = asyncio.run(run())
+    times = [datetime.fromisoformat(t["timestamp"].replace("Z", "+00:00")) for t in tweets]
+
+    # One navigation, scrolled until a tweet older than the last check showed up
+    assert ingestor.navigations == 1
+    assert ingestor.last_fetch["fixture"]["scrolls"] >= 2
+    assert min(times) <= since
+    assert times == sorted(times, reverse=True)
+    grouped = ingestor.group_by_member(tweets)
+    assert set(grouped) == {"frogwhale", "memelord"}
+    assert all(t["username"] == "frogwhale" for t in grouped["frogwhale"])
+
+
+class FakeListPage:
+    """Renders the same tweets on every read; no timeline responses arrive"""
+
+    def __init__(self, rendered):
+        self.rendered = rendered
+
+    def on(self, event, handler):
+        pass
+
+    def remove_listener(self, event, handler):
+        pass
+
+    async def goto(self, url, **kwargs):
+        return None
+
+    async def wait_for_selector(self, selector, timeout=None):
+        pass
+
+    async def evaluate(self, script):
+        return self.rendered
+
+    async def wait_for_timeout(self, ms):
+        pass
+
+
+class FakeListPool:
+    def __init__(self, page):
+        self._page = page
+
+    @asynccontextmanager
+    async def page(self):
+        yield self._page
+
+
+def test_fetch_list_dedups_tweets_by_id_not_url():
+    old = "2020-01-01T00:00:00.000Z"
+    page = FakeListPage([
+        {"text": "$PEPE", "timestamp": old, "url": "https://x.com/frogwhale/status/5", "username": "frogwhale"},
+        {"text": "$PEPE", "timestamp": old, "url": "https://twitter.com/frogwhale/status/5", "username": "frogwhale"},
+        {"text": "$WIF", "timestamp": old, "url": "https://x.com/i/web/status/6", "username": "memelord"},
+    ])
+    ingestor = XListIngestor(FakeListPool(page))
+
+    tweets = asyncio.run(ingestor.fetch_list("1", datetime.now(timezone.utc)))
+    assert sorted(t["url"].rsplit("/", 1)[-1] for t in tweets) == ["5", "6"]
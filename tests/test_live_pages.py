@@ -0,0 +1,111 @@
+import asyncio
+
+from live_pages import LIVE_TWEET_BINDING, LiveTimelineStreamer
+from polling_engine import DomainRateLimits
+
+
+def tweet(n, username="frogwhale"):
+    return {"text": f"tweet {n}", "timestamp": "2026-10-16T12:00:00.000Z",
+            "url": f"https://x.com/{username}/status/{n}", "username": username}
+
+
+class FakeLivePage:
+    def __init__(self, renders):
+        self.renders = renders
+        self.bindings = {}
+        self.init_scripts = []
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    async def expose_binding(self, name, callback):
+        self.bindings[name] = callback
+
+    async def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+    async def goto(self, url, **kwargs):
+        # The observer reports what is rendered now and what React inserts afterwards
+        for rendered in self.renders:
+            self.bindings[LIVE_TWEET_BINDING](None, rendered)
+
+    async def reload(self, **kwargs):
+        await self.goto(None)
+
+
+class FakePool:
+    def __init__(self, page):
+        self.page = page
+
+    async def open_dedicated_page(self):
+        return self.page
+
+    async def close_dedicated_page(self, page):
+        page.closed = True
+
+
+def test_live_streamer_delivers_each_tweet_once_per_account():
+    page = FakeLivePage([
+        [tweet(1), tweet(2)],
+        [tweet(2), tweet(3, "otherwhale")],
+    ])
+    received = []
+
+    async def on_tweets(account, tweets):
+        received.append((account, [t["url"].rsplit("/", 1)[-1] for t in tweets]))
+
+    async def run():
+        streamer = LiveTimelineStreamer(FakePool(page), on_tweets, refresh_seconds=0.05)
+        streamer.watch("list:memes", "https://x.com/i/lists/1")
+        streamer.watch("@frogwhale", "https://x.com/frogwhale", "frogwhale")
+        streamer.unwatch("@frogwhale")
+        await streamer.start()
+        await asyncio.sleep(0.12)
+        await streamer.stop()
+        return streamer
+
+    streamer = asyncio.run(run())
+    # Attributed to each tweet's author on a List timeline; reloads re-render but never re-deliver
+    assert sorted(received) == [("frogwhale", ["1", "2"]), ("otherwhale", ["3"])]
+    assert page.init_scripts and page.closed
+    assert list(streamer.get_stats()["timelines"]) == ["list:memes"]
+    assert streamer.get_stats()["timelines"]["list:memes"]["tweets"] == 3
+
+
+class FakeResponse:
+    def __init__(self, status, retry_after=None):
+        self.status = status
+        self.retry_after = retry_after
+
+    async def header_value(self, name):
+        return self.retry_after if name == "retry-after" else None
+
+
+def test_live_navigations_and_reloads_report_to_the_rate_limiter():
+    statuses = [200, 200, 429]
+
+    class LimitedPage(FakeLivePage):
+        async def goto(self, url, **kwargs):
+            return FakeResponse(statuses.pop(0) if statuses else 200, "0")
+
+        async def reload(self, **kwargs):
+            return await self.goto(None)
+
+    async def on_tweets(account, tweets):
+        pass
+
+    async def run():
+        rate_limits = DomainRateLimits(rates={}, default_rate=1000.0)
+        streamer = LiveTimelineStreamer(FakePool(LimitedPage([])), on_tweets, refresh_seconds=0.02,
+                                        rate_limits=rate_limits)
+        streamer.watch("list:memes", "https://x.com/i/lists/1")
+        await streamer.start()
+        await asyncio.sleep(0.1)
+        await streamer.stop()
+        return rate_limits.get_stats()["x.com"]
+
+    stats = asyncio.run(run())
+    # The first load and every reload hold a slot and report their status
+    assert stats["successes"] >= 2
+    assert stats["throttled"] == 1
@@ -0,0 +1,43 @@
+from poll_scheduler import AdaptivePollScheduler
+
+
+def test_new_sources_are_due_immediately_and_lists_keep_a_fixed_interval():
+    scheduler = AdaptivePollScheduler(budget_interval_seconds=30, min_interval_seconds=10, max_interval_seconds=600)
+    scheduler.sync(["a", "b"], {"list:1": 15}, now=1000)
+
+    assert sorted(scheduler.due(now=1000)) == ["a", "b", "list:1"]
+    assert scheduler.due(now=1000) == []
+
+    scheduler.record_poll("list:1", now=1001)
+    assert scheduler.interval("list:1") == 15
+    assert scheduler.seconds_until_next(now=1001) == 15
+
+    # Dropped sources never come back out of the queue
+    scheduler.sync(["a"], {}, now=1002)
+    assert scheduler.due(now=5000) == []
+    assert scheduler.weighted_sources == 1
+
+
+def test_budget_goes_to_active_and_quorum_moving_accounts():
+    scheduler = AdaptivePollScheduler(budget_interval_seconds=30, min_interval_seconds=5, max_interval_seconds=600)
+    accounts = [f"quiet{n}" for n in range(8)] + ["poster", "mover"]
+    scheduler.sync(accounts, now=0)
+    scheduler.due(now=0)
+    for account in accounts:
+        scheduler.record_poll(account, now=0)
+
+    # Over an hour "poster" tweets a lot and "mover" keeps landing in quorums
+    for minute in range(1, 61):
+        now = minute * 60
+        scheduler.record_tweets("poster", 2)
+        scheduler.record_poll("poster", now=now)
+        if minute % 10 == 0:
+            scheduler.record_quorum("mover", now=now)
+
+    poster, mover, quiet = scheduler.interval("poster"), scheduler.interval("mover"), scheduler.interval("quiet0")
+    assert poster < quiet and mover < quiet
+    assert poster >= 5 and quiet <= 600
+
+    # On average the budget still works out to about one poll per account per 30s
+    polls_per_second = sum(1 / scheduler.interval(account) for account in accounts)
+    assert polls_per_second <= len(accounts) / 30 * 1.1
@@ -0,0 +1,118 @@
+import asyncio
+import time
+
+from polling_engine import DomainRateLimits, PollingEngine, parse_retry_after
+
+
+def test_poll_all_bounds_concurrency_and_yields_in_completion_order():
+    engine = PollingEngine(max_concurrency=3, account_timeout_seconds=5)
+    running = 0
+    peak = 0
+
+    async def poll(account):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05 if account == "slow" else 0.01)
+        running -= 1
+        return [{"account": account}]
+
+    async def run():
+        return [account async for account, _ in engine.poll_all(["slow", "a", "b", "c", "d"], poll)]
+
+    order = asyncio.run(run())
+    assert sorted(order) == ["a", "b", "c", "d", "slow"]
+    assert order[-1] == "slow"
+    assert peak == 3
+    assert engine.last_cycle_seconds is not None
+
+
+def test_poll_all_turns_timeouts_and_errors_into_empty_results():
+    engine = PollingEngine(max_concurrency=5, account_timeout_seconds=0.05)
+
+    async def poll(account):
+        if account == "hangs":
+            await asyncio.sleep(10)
+        if account == "breaks":
+            raise RuntimeError("boom")
+        return [{"account": account}]
+
+    async def run():
+        return {account: mentions async for account, mentions in engine.poll_all(["hangs", "breaks", "ok"], poll)}
+
+    results = asyncio.run(run())
+    assert results == {"hangs": [], "breaks": [], "ok": [{"account": "ok"}]}
+    assert engine.get_stats()["timeouts"] == 1
+    assert engine.get_stats()["errors"] == 1
+
+
+def test_domain_rate_limits_share_a_bucket_per_domain():
+    limits = DomainRateLimits(rates={"x.com": 20.0}, default_rate=1000.0, burst=1)
+    assert limits.domain("https://www.X.com/elonmusk") == "x.com"
+    assert limits.domain("nitter.net") == "nitter.net"
+    assert limits.limiter("https://x.com/a") is limits.limiter("https://www.x.com/b")
+
+    async def run():
+        started = time.monotonic()
+        for _ in range(3):
+            await limits.acquire("https://x.com/someone")
+        return time.monotonic() - started
+
+    # One request goes through immediately, the next two wait 1/20s each
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_domain_limits_grow_on_success_and_back_off_on_throttling():
+    limits = DomainRateLimits(rates={"nitter.net": 10.0}, burst=100, initial_concurrency=4, backoff_interval_seconds=60)
+
+    async def run():
+        for _ in range(20):
+            async with limits.slot("https://nitter.net/a/rss") as slot:
+                slot.report(200)
+        grown = limits.get_stats()["nitter.net"]
+
+        try:
+            async with limits.slot("https://nitter.net/a/rss"):
+                raise TimeoutError()
+        except TimeoutError:
+            pass
+
+        # A burst of 429s only cuts once per backoff interval; Retry-After pauses the domain
+        async def throttled():
+            async with limits.slot("https://nitter.net/a/rss") as slot:
+                await asyncio.sleep(0.01)  # All three are in flight when the first 429 lands
+                slot.report(429, "2")
+
+        await asyncio.gather(*[throttled() for _ in range(3)])
+        return grown, limits.get_stats()["nitter.net"]
+
+    grown, throttled = asyncio.run(run())
+    assert grown["concurrency"] > 4 and grown["rate"] > 10.0
+    assert throttled["concurrency"] == grown["concurrency"] // 2
+    assert throttled["rate"] < grown["rate"]
+    assert throttled["throttled"] == 3 and throttled["failures"] == 1
+    assert 1.0 < throttled["paused_seconds"] <= 2.0
+    assert throttled["in_flight"] == 0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_domain_slots_cap_requests_in_flight():
+    # Pinned window: additive increase would otherwise admit a third request after a few successes
+    limits = DomainRateLimits(default_rate=1000.0, burst=100, initial_concurrency=2, max_concurrency=2)
+    running = 0
+    peak = 0
+
+    async def request():
+        nonlocal running, peak
+        async with limits.slot("pump.fun"):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+    async def run():
+        await asyncio.gather(*[request() for _ in range(6)])
+
+    asyncio.run(run())
+    assert peak == 2
@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from proxy_pool import ProxyPool, parse_proxy_list
+
+
+def stand_in(http_server, handler) -> str:
+    """A local server answering every request itself, standing in for a forwarding proxy"""
+    return http_server({"/{tail:.*}": handler})
+
+
+def test_parse_proxy_list():
+    assert parse_proxy_list(None) == [None]
+    assert parse_proxy_list("http://a:1, direct ,") == ["http://a:1", None]
+
+
+def test_banned_proxy_is_skipped_during_its_cool_down_and_returns_afterwards(http_server):
+    hits = []
+
+    async def refuses_once(request):
+        hits.append(request.path)
+        if len(hits) == 1:
+            return web.Response(status=429)
+        return web.Response(body=b"<html>profile</html>")
+
+    url = stand_in(http_server, refuses_once)
+
+    async def run():
+        pool = ProxyPool([url], ban_cooldown_seconds=60)
+        endpoint = pool.endpoints[0]
+        try:
+            with pytest.raises(RuntimeError, match="HTTP 429"):
+                await pool.fetch("http://x.test/caller")
+            assert endpoint.bans == 1
+            assert 55 < pool.get_stats()["proxies"][url]["cooldown_seconds"] <= 60
+
+            with pytest.raises(RuntimeError, match="all proxies cooling down"):
+                await pool.fetch("http://x.test/caller")
+            assert len(hits) == 1
+
+            # Once the cool-down has passed the proxy is back in rotation
+            endpoint.cooldown_until = time.monotonic()
+            return await pool.fetch("http://x.test/caller")
+        finally:
+            await pool.close()
+
+    assert asyncio.run(run()) == b"<html>profile</html>"
+    assert len(hits) == 2
+
+
+def test_traffic_moves_to_healthy_proxies_while_one_cools_down(http_server):
+    async def banned(request):
+        return web.Response(status=429, headers={"Retry-After": "600"})
+
+    async def healthy(request):
+        return web.Response(body=b"<html>profile</html>")
+
+    banned_url, healthy_url = stand_in(http_server, banned), stand_in(http_server, healthy)
+
+    async def run():
+        pool = ProxyPool([banned_url], ban_cooldown_seconds=60)
+        try:
+            with pytest.raises(RuntimeError):
+                await pool.fetch("http://x.test/caller")
+            # The banned proxy keeps its cool-down when the list is updated
+            await pool.update_proxies([banned_url, healthy_url])
+            bodies = [await pool.fetch("http://x.test/caller") for _ in range(5)]
+            return bodies, pool.get_stats()["proxies"]
+        finally:
+            await pool.close()
+
+    bodies, proxies = asyncio.run(run())
+    assert bodies == [b"<html>profile</html>"] * 5
+    assert proxies[banned_url]["bans"] == 1 and proxies[banned_url]["requests"] == 1
+    assert proxies[healthy_url]["requests"] == 5
+    # Retry-After stretches the cool-down past ban_cooldown_seconds
+    assert proxies[banned_url]["cooldown_seconds"] > 500
+
+
+def test_per_proxy_concurrency_caps_spread_load_across_proxies(http_server):
+    active, peak = {}, {}
+
+    def handler_for(name):
+        async def handler(request):
+            active[name] = active.get(name, 0) + 1
+            peak[name] = max(peak.get(name, 0), active[name])
+            await asyncio.sleep(0.05)
+            active[name] -= 1
+            return web.Response(body=name.encode())
+        return handler
+
+    urls = [stand_in(http_server, handler_for(name)) for name in ("a", "b")]
+
+    async def run():
+        pool = ProxyPool(urls, max_concurrency_per_proxy=2)
+        try:
+            return await asyncio.gather(*[pool.fetch("http://x.test/caller") for _ in range(8)])
+        finally:
+            await pool.close()
+
+    bodies = asyncio.run(run())
+    assert len(bodies) == 8
+    assert peak["a"] <= 2 and peak["b"] <= 2
+    assert sum(body == b"a" for body in bodies) >= 1 and sum(body == b"b" for body in bodies) >= 1
@@ -0,0 +1,64 @@
+import asyncio
+from datetime import datetime, timezone, timedelta
+
+from quorum_engine import QuorumEngine, shared_quorum
+from x_monitor_realtime import RealTimeXMonitor
+
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def test_counts_distinct_accounts_per_token():
+    quorum = QuorumEngine()
+    assert quorum.add("bonk", "alice", NOW, now=NOW) == 1
+    assert quorum.add("BONK", "alice", NOW, now=NOW) == 1
+    assert quorum.add("BONK", "bob", NOW, now=NOW) == 2
+    assert quorum.add("WIF", "carol", NOW, now=NOW) == 1
+    assert quorum.distinct_accounts("bonk", now=NOW) == {"alice", "bob"}
+
+
+def test_mentions_slide_out_of_the_window():
+    quorum = QuorumEngine(window=timedelta(hours=1), bucket_seconds=60)
+    quorum.add("BONK", "alice", NOW - timedelta(minutes=50), now=NOW)
+    quorum.add("BONK", "bob", NOW - timedelta(minutes=5), now=NOW)
+    assert len(quorum.distinct_accounts("BONK", now=NOW)) == 2
+
+    later = NOW + timedelta(minutes=15)
+    assert quorum.distinct_accounts("BONK", now=later) == {"bob"}
+    # Mentions older than the window never count
+    assert quorum.add("BONK", "carol", later - timedelta(hours=2), now=later) == 1
+
+
+def test_reset_and_prune():
+    quorum = QuorumEngine()
+    quorum.add("BONK", "alice", NOW, now=NOW)
+    quorum.add("WIF", "bob", NOW, now=NOW)
+    quorum.reset("bonk")
+    assert quorum.mentions("BONK", now=NOW) == []
+
+    assert quorum.prune(now=NOW + timedelta(hours=2)) == 1
+    assert quorum.get_stats()["tracked_tokens"] == 0
+
+
+def test_startup_load_warms_the_window_once(fake_db):
+    now = datetime.now(timezone.utc)
+    fake_db.token_mentions.seed([
+        {"token_name": "PEPE", "account_username": "a", "mentioned_at": now - timedelta(minutes=5)},
+        {"token_name": "PEPE", "account_username": "b", "mentioned_at": now - timedelta(minutes=5), "processed": True},
+        {"token_name": "PEPE", "account_username": "c", "mentioned_at": now - timedelta(hours=2)},
+    ])
+    quorum = QuorumEngine()
+
+    assert asyncio.run(quorum.load(fake_db)) == 1
+    # The second monitor to start finds the shared window already warm
+    assert asyncio.run(quorum.load(fake_db)) == 0
+    assert len(quorum.mentions("pepe")) == 1
+
+
+def test_both_monitors_count_toward_one_quorum():
+    import server
+
+    assert server.x_monitor.quorum is server.real_time_monitor.quorum is shared_quorum
+    assert RealTimeXMonitor(db=None).quorum is shared_quorum
+    quorum = QuorumEngine()
+    assert RealTimeXMonitor(db=None, quorum=quorum).quorum is quorum
@@ -0,0 +1,77 @@
+import asyncio
+
+import aiohttp
+from aiohttp import web
+
+from polling_engine import DomainRateLimits
+from rss_feeds import CircuitBreaker, RssFeedFetcher
+
+FEED = b"<rss><channel><item><title>$PEPE</title></item></channel></rss>"
+
+
+async def feed(request):
+    if request.headers.get("If-None-Match") == '"v1"':
+        return web.Response(status=304)
+    return web.Response(body=FEED, headers={"ETag": '"v1"'})
+
+
+async def broken(request):
+    return web.Response(status=503)
+
+
+def test_unchanged_feeds_cost_a_304_and_dead_mirrors_get_skipped(http_server):
+    base_url = http_server({"/good/{account}/rss": feed, "/dead/{account}/rss": broken})
+
+    async def run():
+        dead, good = f"{base_url}/dead/{{account}}/rss", f"{base_url}/good/{{account}}/rss"
+        fetcher = RssFeedFetcher(DomainRateLimits(default_rate=1000.0), mirrors=[dead, good], race_width=1, failure_threshold=2, open_seconds=60)
+        async with aiohttp.ClientSession() as session:
+            results = [await fetcher.fetch(session, "@caller") for _ in range(2)]
+            # Validators only count once the caller has processed the feed
+            mirror, _, validators = results[-1]
+            fetcher.commit("@caller", mirror, validators)
+            results += [await fetcher.fetch(session, "@caller") for _ in range(2)]
+        return results, fetcher
+
+    results, fetcher = asyncio.run(run())
+    good = fetcher.mirrors[1]
+    assert results[:2] == [(good, FEED, {"If-None-Match": '"v1"'})] * 2
+    assert results[2:] == [(good, None, {})] * 2
+    assert fetcher.not_modified == 2
+    # Two 503s open the dead mirror's breaker, later polls go straight to the good one
+    assert fetcher.failures == {fetcher.mirrors[0]: 2}
+    assert fetcher.skipped == 2
+    assert fetcher.get_stats()["mirrors"][fetcher.mirrors[0]] == {"state": "open", "trips": 1}
+
+
+def test_half_open_mirrors_keep_their_trial_until_their_batch_runs(http_server):
+    base_url = http_server({"/good/{account}/rss": feed})
+    good, flaky = f"{base_url}/good/{{account}}/rss", f"{base_url}/flaky/{{account}}/rss"
+    fetcher = RssFeedFetcher(DomainRateLimits(default_rate=1000.0), mirrors=[good, flaky], race_width=1, failure_threshold=1)
+    fetcher.breakers[flaky].record_failure(now=0)
+    fetcher.breakers[flaky].opened_until = 0.0  # Open window already over
+
+    async def run():
+        async with aiohttp.ClientSession() as session:
+            return await fetcher.fetch(session, "@caller")
+
+    assert asyncio.run(run())[0] == good
+    # The first batch answered, so the flaky mirror's trial was never spent
+    assert fetcher.breakers[flaky].state() == "half_open" and fetcher.breakers[flaky].opened_until == 0.0
+    assert fetcher.skipped == 0
+
+
+def test_breaker_lets_one_trial_through_and_backs_off_when_it_fails():
+    breaker = CircuitBreaker(failure_threshold=2, open_seconds=10, max_open_seconds=25)
+    breaker.record_failure(now=0)
+    assert breaker.allow(now=0)
+    breaker.record_failure(now=0)
+    assert not breaker.allow(now=5)
+
+    assert breaker.allow(now=10)
+    assert not breaker.allow(now=10)  # Only one half-open trial at a time
+    breaker.record_failure(now=11)
+    assert breaker.state(now=30) == "open" and breaker.allow(now=31)
+
+    breaker.record_success()
+    assert breaker.state(now=31) == "closed"
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import server
+from quorum_engine import QuorumEngine
+from token_dictionaries import DEFAULT_DICTIONARIES, TokenDictionaryStore
+from token_extractor import ExtractionPool, TokenExtractor
+
+
+@pytest.fixture
+def api(fake_db, monkeypatch):
+    """server.py endpoints against the fake database, with a fresh quorum window"""
+    monkeypatch.setattr(server, "db", fake_db)
+    monkeypatch.setattr(server.x_monitor, "quorum", QuorumEngine())
+    monkeypatch.setattr(server, "dictionary_store", TokenDictionaryStore(fake_db, ExtractionPool(TokenExtractor())))
+    return server
+
+
+def post_mention(api, token_name, account="frogwhale"):
+    async def run():
+        response = await api.add_token_mention(api.TokenMention(
+            token_name=token_name, account_username=account, tweet_url=f"https://x.com/{account}/status/1"
+        ))
+        await api.x_monitor.background_writes.drain()
+        return response
+
+    return asyncio.run(run())
+
+
+def test_filtered_mentions_are_stored_processed_and_reported(api, fake_db):
+    assert post_mention(api, "THE")["filtered"] is True
+    assert post_mention(api, "FROGCOIN")["filtered"] is False
+
+    stored = {doc["token_name"]: doc for doc in fake_db.token_mentions.docs.values()}
+    assert stored["THE"]["processed"] and not stored["FROGCOIN"]["processed"]
+    assert api.x_monitor.quorum.distinct_accounts("THE") == set()
+    assert api.x_monitor.quorum.distinct_accounts("FROGCOIN") == {"frogwhale"}
+
+
+def test_dictionary_endpoints_edit_and_reset_what_extraction_uses(api):
+    pool = api.dictionary_store.pool
+
+    async def run():
+        put = await api.update_token_dictionary("meme_keywords", api.DictionaryUpdate(add=["zorp"]))
+        after_put = await pool.scan_batch(["ZORP dollar"])
+        delete = await api.reset_token_dictionary("meme_keywords")
+        after_delete = await pool.scan_batch(["ZORP dollar"])
+        return put, after_put, delete, after_delete
+
+    put, after_put, delete, after_delete = asyncio.run(run())
+    assert put["words"][-1] == "ZORP" and after_put == [["ZORP"]]
+    assert delete["words"] == list(DEFAULT_DICTIONARIES["meme_keywords"]) and after_delete == [[]]
+    assert asyncio.run(api.get_token_dictionaries())["version"] == 2
+
+
+def test_dictionary_endpoints_reject_unknown_names_and_unmatchable_entries(api):
+    with pytest.raises(HTTPException) as unknown:
+        asyncio.run(api.update_token_dictionary("nope", api.DictionaryUpdate(add=["x"])))
+    with pytest.raises(HTTPException) as phrase:
+        asyncio.run(api.update_token_dictionary("established_tokens", api.DictionaryUpdate(add=["dog wif hat"])))
+    assert unknown.value.status_code == 404
+    assert phrase.value.status_code == 400 and "DOG WIF HAT" in phrase.value.detail
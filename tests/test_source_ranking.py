@@ -0,0 +1,81 @@
+import asyncio
+
+from hedged_fetch import HedgedFetcher
+from source_ranking import SourceRanking
+
+
+def test_reliable_rss_goes_first_and_failures_demote_it():
+    ranking = SourceRanking()
+    sources = ["browser", "rss", "scrape"]
+    # Unseen accounts fall back to base costs: cheap sources first
+    assert ranking.order("@someone", sources) == ["rss", "scrape", "browser"]
+
+    for _ in range(5):
+        ranking.record("@Caller", "rss", True, 2.0, 3)
+    assert ranking.order("caller", sources)[0] == "rss"
+    assert ranking.hedge_delay("caller", "rss", 1.5) == 4.0
+    assert ranking.hedge_delay("someone", "rss", 1.5) == 1.5
+
+    for _ in range(10):
+        ranking.record("caller", "rss", False, 10.0)
+        ranking.record("caller", "scrape", True, 1.0, 3)
+    assert ranking.order("caller", sources)[0] == "scrape"
+    assert ranking.hedge_delay("caller", "rss", 1.5) == 1.5
+
+
+def test_hedged_fetch_reports_every_finished_source():
+    async def failing():
+        raise RuntimeError("nitter down")
+
+    async def working():
+        return ["mention"]
+
+    ranking = SourceRanking()
+    fetcher = HedgedFetcher(hedge_delay_seconds=5)
+    observe = lambda source, ok, seconds, result: ranking.record("a", source, ok, seconds, len(result or []))
+    winner, result = asyncio.run(fetcher.fetch([("rss", failing), ("scrape", working)], 0.01, observe))
+
+    assert (winner, result) == ("scrape", ["mention"])
+    assert ranking.stats["a"]["rss"].success == 0.0
+    assert ranking.stats["a"]["scrape"].tweets == 1.0
+
+
+def test_a_source_that_answers_but_finds_no_new_tweets_is_demoted():
+    ranking = SourceRanking()
+    sources = ["rss", "browser"]
+    # Quiet account: every source finds nothing, so a fast RSS mirror stays first
+    for _ in range(5):
+        ranking.record("quiet", "rss", True, 0.5, 0)
+    ranking.record("quiet", "browser", True, 5.0, 0)
+    assert ranking.order("quiet", sources) == ["rss", "browser"]
+    assert ranking.hedge_delay("quiet", "rss", 1.5) == 1.5
+
+    # Stale mirror: it keeps answering while the browser sees the account's new tweets
+    for _ in range(5):
+        ranking.record("busy", "rss", True, 0.5, 0)
+    ranking.record("busy", "browser", True, 5.0, 2)
+    assert ranking.order("busy", sources) == ["browser", "rss"]
+    assert ranking.hedge_delay("busy", "rss", 1.5) == 1.5
+
+
+def test_stats_survive_a_flush_and_reload(fake_db):
+    db = fake_db
+    ranking = SourceRanking()
+    ranking.record("a", "rss", True, 0.5, 2)
+    ranking.record("b", "browser", False, 9.0)
+    assert asyncio.run(ranking.flush(db)) == 2
+    assert asyncio.run(ranking.flush(db)) == 0
+
+    restored = SourceRanking()
+    asyncio.run(restored.load(db))
+    assert restored.stats["a"]["rss"].latency == 0.5 and restored.stats["a"]["rss"].tweets == 2
+    assert restored.get_stats() == {"accounts": 2, "first_choice": {"rss": 2}}
+
+
+def test_stats_stored_with_mention_counts_still_load(fake_db):
+    fake_db.source_stats.seed([{"_id": "a", "sources": {
+        "rss": {"attempts": 4, "success": 1.0, "latency": 0.5, "mentions": 2.0}
+    }}])
+    ranking = SourceRanking()
+    asyncio.run(ranking.load(fake_db))
+    assert ranking.stats["a"]["rss"].attempts == 4 and ranking.stats["a"]["rss"].tweets == 0.0
@@ -0,0 +1,117 @@
+import asyncio
+
+from timeline_json import TimelineCapture, is_timeline_response, parse_timeline_payload
+
+
+def tweet_result(tweet_id, text, screen_name="frogwhale", created_at="Fri Oct 16 12:00:00 +0000 2026"):
+    return {
+        "__typename": "Tweet",
+        "rest_id": tweet_id,
+        "core": {"user_results": {"result": {"legacy": {"screen_name": screen_name}}}},
+        "legacy": {"full_text": text, "created_at": created_at},
+    }
+
+
+def timeline_payload():
+    long_tweet = tweet_result("1846000000000000003", "truncated…")
+    long_tweet["note_tweet"] = {"note_tweet_results": {"result": {"text": "full long text about $PEPE"}}}
+    quoted = tweet_result("1846000000000000004", "quote $MOON")
+    quoted["quoted_status_result"] = {"result": tweet_result("1700000000000000000", "the quoted tweet", "someoneelse")}
+    return {"data": {"user": {"result": {"timeline_v2": {"timeline": {"instructions": [
+        {"type": "TimelinePinEntry", "entry": {"content": {"itemContent": {
+            "tweet_results": {"result": tweet_result("1846000000000000001", "pinned", created_at="Mon Oct 12 08:30:00 +0000 2026")}
+        }}}},
+        {"type": "TimelineAddEntries", "entries": [
+            {"content": {"itemContent": {"tweet_results": {"result": {
+                "__typename": "TweetWithVisibilityResults",
+                "tweet": tweet_result("1846000000000000002", "wrapped $DOGE")
+            }}}}},
+            {"content": {"itemContent": {"tweet_results": {"result": long_tweet}}}},
+            {"content": {"items": [{"item": {"itemContent": {"tweet_results": {"result": quoted}}}}]}},
+            {"content": {"itemContent": {"tweet_results": {"result": tweet_result("1846000000000000002", "duplicate")}}}},
+            {"content": {"cursorType": "Bottom", "value": "abc"}},
+        ]},
+    ]}}}}}}
+
+
+def test_parse_timeline_payload_reads_ids_text_and_timestamps():
+    tweets = parse_timeline_payload(timeline_payload())
+
+    assert [tweet["id"] for tweet in tweets] == [
+        "1846000000000000004", "1846000000000000003", "1846000000000000002", "1846000000000000001"
+    ]
+    assert tweets[0]["text"] == "quote $MOON"
+    assert tweets[1]["text"] == "full long text about $PEPE"
+    assert tweets[2]["text"] == "wrapped $DOGE"
+    assert tweets[3]["timestamp"] == "2026-10-12T08:30:00+00:00"
+    assert tweets[3]["url"] == "https://x.com/frogwhale/status/1846000000000000001"
+
+
+def test_author_filter_keeps_the_accounts_own_tweets_and_retweets():
+    payload = timeline_payload()
+    original = tweet_result("1845000000000000000", "RT-truncated", "someoneelse")
+    original["note_tweet"] = {"note_tweet_results": {"result": {"text": "full original about $WIF"}}}
+    retweet = tweet_result("1846000000000000006", "RT @someoneelse: full orig…")
+    retweet["legacy"]["retweeted_status_result"] = {"result": original}
+    entries = payload["data"]["user"]["result"]["timeline_v2"]["timeline"]["instructions"][1]["entries"]
+    entries += [
+        {"content": {"itemContent": {"tweet_results": {"result": retweet}}}},
+        {"content": {"itemContent": {
+            "promotedMetadata": {"advertiser_results": {}},
+            "tweet_results": {"result": tweet_result("1846000000000000007", "buy $SCAM", "brandaccount")}
+        }}},
+        {"content": {"items": [{"item": {"itemContent": {
+            "tweet_results": {"result": tweet_result("1846000000000000005", "reply $BONK", "replyguy")}
+        }}}]}},
+    ]
+
+    assert len(parse_timeline_payload(payload)) == 7
+    tweets = parse_timeline_payload(payload, author="@FrogWhale")
+    assert [tweet["id"][-1] for tweet in tweets] == ["6", "4", "3", "2", "1"]
+    assert tweets[0]["username"] == "frogwhale" and tweets[0]["retweet_of"] == "someoneelse"
+    assert tweets[0]["text"] == "full original about $WIF"
+    assert tweets[0]["url"] == "https://x.com/someoneelse/status/1845000000000000000"
+    assert tweets[1]["retweet_of"] is None
+
+
+def test_is_timeline_response_matches_graphql_timeline_operations():
+    assert is_timeline_response("https://x.com/i/api/graphql/abc123/UserTweets?variables=%7B%7D")
+    assert is_timeline_response("https://x.com/i/api/graphql/xyz/ListLatestTweetsTimeline")
+    assert not is_timeline_response("https://x.com/i/api/graphql/abc123/UserByScreenName")
+    assert not is_timeline_response("https://x.com/UserTweets")
+
+
+class FakeResponse:
+    def __init__(self, url, payload):
+        self.url = url
+        self.payload = payload
+
+    async def json(self):
+        return self.payload
+
+
+class FakePage:
+    def __init__(self):
+        self.listeners = {}
+
+    def on(self, event, handler):
+        self.listeners[event] = handler
+
+    def remove_listener(self, event, handler):
+        assert self.listeners.pop(event) == handler
+
+
+def test_timeline_capture_collects_responses_while_active():
+    page = FakePage()
+
+    async def run():
+        async with TimelineCapture(page) as capture:
+            page.listeners["response"](FakeResponse("https://x.com/i/api/graphql/a/UserByScreenName", {}))
+            page.listeners["response"](FakeResponse("https://x.com/i/api/graphql/a/UserTweets", timeline_payload()))
+            assert await capture.wait(timeout=1)
+        return capture
+
+    capture = asyncio.run(run())
+    assert capture.responses == 1
+    assert len(capture.tweets()) == 4
+    assert "response" not in page.listeners
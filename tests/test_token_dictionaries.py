@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from token_dictionaries import DEFAULT_DICTIONARIES, TokenDictionaryStore
+from token_extractor import ExtractionPool, TokenExtractor
+
+
+def make_store(fake_db):
+    return TokenDictionaryStore(fake_db, ExtractionPool(TokenExtractor()))
+
+
+def test_update_normalizes_persists_and_hot_swaps_the_extractor(fake_db):
+    store = make_store(fake_db)
+
+    async def run():
+        words = await store.update("meme_keywords", words=["  zorp ", "ZORP", "blib"], add=["Quux"], remove=["blib"])
+        return words, await store.pool.scan_batch(["ZORP dollar", "QUUX coin", "FROG dollar"])
+
+    words, scanned = asyncio.run(run())
+    assert words == ["ZORP", "QUUX"]
+    assert fake_db.token_dictionaries.docs[1]["words"] == ["ZORP", "QUUX"]
+    # The replaced dictionary no longer has the built-in FROG
+    assert scanned == [["ZORP"], ["QUUX"], []]
+    assert store.version == 1 and store.get_status()["sizes"]["meme_keywords"] == 2
+
+    asyncio.run(store.update("stopwords", add=[" wagmi "]))
+    assert store.dictionaries["stopwords"][-1] == "WAGMI"
+    assert not store.pool.extractor.accepts("WAGMI")
+
+
+def test_reset_restores_the_defaults_and_reload_picks_up_stored_overrides(fake_db):
+    store = make_store(fake_db)
+    asyncio.run(store.update("established_tokens", words=["FROGCOIN"]))
+    assert not store.pool.extractor.accepts("FROGCOIN") and store.pool.extractor.accepts("SOL")
+
+    assert asyncio.run(store.reset("established_tokens")) == list(DEFAULT_DICTIONARIES["established_tokens"])
+    assert store.pool.extractor.accepts("FROGCOIN") and not store.pool.extractor.accepts("SOL")
+    assert not fake_db.token_dictionaries.docs
+
+    # An override written by another process is applied on reload
+    fake_db.token_dictionaries.seed([{"name": "stopwords", "words": ["GM", "GN"]}])
+    asyncio.run(store.reload())
+    assert store.dictionaries["stopwords"] == ["GM", "GN"]
+    assert not store.pool.extractor.accepts("GN")
+
+
+def test_multi_word_entries_are_rejected_where_they_could_never_match(fake_db):
+    store = make_store(fake_db)
+    with pytest.raises(ValueError, match="DOG WIF HAT"):
+        asyncio.run(store.update("meme_keywords", add=["dog  wif hat"]))
+    assert not fake_db.token_dictionaries.docs and store.version == 0
+
+    # Phrase dictionaries are matched word by word through a trie
+    assert asyncio.run(store.update("hype_phrases", add=["Send  It"]))[-1] == "send it"
+    with pytest.raises(KeyError):
+        asyncio.run(store.update("nope", add=["x"]))
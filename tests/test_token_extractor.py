@@ -0,0 +1,84 @@
+import asyncio
+
+from token_extractor import TokenExtractor, ExtractionPool, ExtractionCache
+
+
+def extract(text, exclude=()):
+    return sorted(TokenExtractor().extract(text, exclude))
+
+
+def test_dollar_tickers():
+    assert extract("just aped $bonk and $WIF, skipping $ABCDEFGHIJK and $AB1") == ["BONK", "WIF"]
+
+
+def test_hype_phrases():
+    assert extract("FROG coin is next, CAT to the moon, DOG diamond hands") == ["CAT", "DOG", "FROG"]
+    # Phrase words must be separated by whitespace only
+    assert extract("CAT to-the moon") == []
+
+
+def test_meme_keyword_with_currency_word():
+    assert extract("DRAGON dollar and TIGER yen") == ["DRAGON", "TIGER"]
+    assert extract("DRAGON is cool") == []
+
+
+def test_matches_do_not_overlap():
+    # "COIN" is consumed by the first match and cannot start a second one
+    assert extract("AB COIN TOKEN") == ["AB"]
+    assert extract("AB COIN CD TOKEN") == ["AB", "CD"]
+
+
+def test_filters():
+    assert extract("THE coin and $SOL and $BONK", exclude={"SOL"}) == ["BONK"]
+
+
+def test_unicode_case_folding_matches_regex_semantics():
+    # U+212A KELVIN SIGN matches "K" under re.IGNORECASE
+    assert extract("\u212aISHU dollar") == ["\u212aISHU"]
+
+
+def test_extraction_pool_matches_inline_extraction():
+    texts = ["$BONK to the moon", "FROG coin", "nothing here", "DRAGON dollar $SOL"] * 5
+    extractor = TokenExtractor()
+    pool = ExtractionPool(extractor, max_workers=2, inline_threshold_chars=0)
+    pool.start()
+    try:
+        results = asyncio.run(pool.extract_batch(texts, exclude={"SOL"}))
+    finally:
+        pool.shutdown()
+    assert [sorted(tokens) for tokens in results] == [sorted(extractor.extract(text, {"SOL"})) for text in texts]
+
+
+def test_extraction_cache_is_bounded_lru_with_counters():
+    cache = ExtractionCache(max_entries=2)
+    keys = [ExtractionCache.key(ExtractionCache.normalize(text)) for text in ("$BONK", "$WIF", "$POPCAT")]
+    assert ExtractionCache.key(ExtractionCache.normalize("  $bonk\n")) == keys[0]
+
+    cache.put(keys[0], ["BONK"])
+    cache.put(keys[1], ["WIF"])
+    assert cache.get(keys[0]) == ("BONK",)
+    cache.put(keys[2], ["POPCAT"])  # evicts keys[1], the least recently used
+
+    assert cache.get(keys[1]) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_established_tokens_and_stopwords_are_filtered():
+    extractor = TokenExtractor(stopwords=["GM"], established_tokens=["BONK"])
+    assert not extractor.accepts("BONK")
+    assert not extractor.accepts("GM")
+    assert extractor.accepts("WIF")
+    assert sorted(extractor.extract("$BONK $GM $WIF $THE")) == ["THE", "WIF"]
+
+
+def test_swap_extractor_applies_new_dictionaries_and_drops_cache():
+    pool = ExtractionPool(TokenExtractor())
+    assert pool.extract("ZORP dollar") == []
+    generation = pool.cache.generation
+
+    pool.swap_extractor(TokenExtractor(meme_keywords=["ZORP"]))
+
+    assert pool.cache.generation == generation + 1
+    assert pool.extract("ZORP dollar") == ["ZORP"]
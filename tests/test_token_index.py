@@ -0,0 +1,45 @@
+import asyncio
+
+from pymongo import ASCENDING
+
+from token_index import TOKEN_INDEXES, TOKEN_KEY_MIGRATION_ID, ensure_token_indexes, migrate_token_keys, token_key
+
+
+def test_token_key_is_case_and_whitespace_insensitive():
+    assert token_key("bonk") == "BONK"
+    assert token_key("  Dog   wif\that ") == "DOG WIF HAT"
+    assert token_key(None) == ""
+
+
+def test_migration_backfills_missing_keys_in_batches_and_runs_once(fake_db):
+    db = fake_db
+    mentions = db.token_mentions.seed([{"_id": n, "token_name": f" pepe{n % 2} "} for n in range(5)]
+                                      + [{"_id": 9, "token_name": "wif", "token_key": "ALREADY"}])
+
+    asyncio.run(migrate_token_keys(db, batch_size=2))
+    assert mentions.bulk_writes == [2, 2, 1]
+    assert {doc["_id"]: doc["token_key"] for doc in mentions.docs.values()} == {
+        0: "PEPE0", 1: "PEPE1", 2: "PEPE0", 3: "PEPE1", 4: "PEPE0", 9: "ALREADY"
+    }
+    assert TOKEN_KEY_MIGRATION_ID in db.migrations.docs
+
+    # The marker makes later startups skip the scan entirely
+    mentions.docs[10] = {"_id": 10, "token_name": "new"}
+    asyncio.run(migrate_token_keys(db, batch_size=2))
+    assert mentions.bulk_writes == [2, 2, 1]
+    assert "token_key" not in mentions.docs[10]
+
+
+def test_ensure_token_indexes_creates_every_lookup_index(fake_db):
+    db = fake_db
+    asyncio.run(ensure_token_indexes(db))
+
+    assert db.token_mentions.indexes == [
+        ([("token_key", ASCENDING), ("mentioned_at", ASCENDING)], {}),
+        ([("mentioned_at", ASCENDING), ("processed", ASCENDING)], {}),
+    ]
+    assert db.ca_alerts.indexes == [([("token_key", ASCENDING)], {})]
+    assert db.ca_monitoring_queue.indexes == [([("status", ASCENDING), ("token_key", ASCENDING)], {})]
+    # Plain (non-unique, non-sparse) indexes: many mentions share a token_key
+    assert all(options == {} for name in TOKEN_INDEXES for _, options in db[name].indexes)
+    assert TOKEN_KEY_MIGRATION_ID in db.migrations.docs
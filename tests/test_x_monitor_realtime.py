@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from x_monitor_realtime import RealTimeXMonitor
+
+NOW = datetime.now(timezone.utc)
+
+
+def mention(tweet_id, token="PEPE"):
+    return {
+        'token_name': token,
+        'account_username': "alice",
+        'tweet_url': f"https://x.com/alice/status/{tweet_id}",
+        'tweet_text': f"${token}",
+        'mentioned_at': NOW
+    }
+
+
+def monitor_with_sources(rss, browser, hedge_delay_seconds):
+    monitor = RealTimeXMonitor(db=None)
+    monitor.source_order = ["rss", "browser"]
+    monitor.hedged_fetcher.hedge_delay_seconds = hedge_delay_seconds
+    monitor.check_rss_feeds = rss
+    monitor.check_x_timeline_with_browser = browser
+    return monitor
+
+
+def test_only_the_winning_source_moves_the_cursor():
+    async def rss(account):
+        await asyncio.sleep(0.1)
+        return [mention(101)], [(101, NOW - timedelta(minutes=1))]
+
+    async def browser(account):
+        # Starts after the hedge delay but sees newer tweets; it loses and must not move the mark
+        await asyncio.sleep(1)
+        return [mention(200)], [(200, NOW)]
+
+    monitor = monitor_with_sources(rss, browser, hedge_delay_seconds=0.05)
+    mentions = asyncio.run(monitor.monitor_account_hedged("alice"))
+
+    assert [m['tweet_url'] for m in mentions] == ["https://x.com/alice/status/101"]
+    assert monitor.account_cursors.marks["alice"][0] == 101
+    assert monitor.account_cursors.is_new("alice", 150, NOW)
+    assert monitor.source_ranking.stats["alice"]["rss"].tweets == 1
+
+
+def test_simultaneous_winners_are_merged_without_duplicate_mentions():
+    async def run():
+        answered = asyncio.Event()
+
+        async def rss(account):
+            await answered.wait()
+            return [mention(101), mention(102)], [(101, NOW), (102, NOW)]
+
+        async def browser(account):
+            await answered.wait()
+            return [mention(102), mention(102, "WIF"), mention(103)], [(102, NOW), (103, NOW)]
+
+        monitor = monitor_with_sources(rss, browser, hedge_delay_seconds=0.01)
+        asyncio.get_running_loop().call_later(0.05, answered.set)
+        return monitor, await monitor.monitor_account_hedged("alice")
+
+    monitor, mentions = asyncio.run(run())
+
+    assert sorted((m['tweet_url'][-3:], m['token_name']) for m in mentions) == [
+        ("101", "PEPE"), ("102", "PEPE"), ("102", "WIF"), ("103", "PEPE")
+    ]
+    assert monitor.account_cursors.marks["alice"][0] == 103
@@ -0,0 +1,85 @@
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "backend"))
+
+from token_extractor import TokenExtractor, MEME_KEYWORDS, CURRENCY_WORDS
+
+# The regex list RealTimeXMonitor used before the TokenExtractor engine
+LEGACY_TOKEN_PATTERNS = [
+    r'\$([A-Z]{2,10})\b',
+    r'\b([A-Z]{2,10})(?:\s+(?:coin|token|gem|to\s+the\s+moon|moon|pump|lambo|rocket|bullish|bearish|hodl|diamond\s+hands))\b',
+    r'\b(' + '|'.join(MEME_KEYWORDS) + r')(?:\s+(?:' + '|'.join(w.lower() for w in CURRENCY_WORDS) + r'))\b',
+]
+
+FILLER_WORDS = [
+    "gm", "just", "bought", "more", "of", "this", "looks", "like", "the", "next", "big", "play",
+    "ser", "wen", "listing", "chart", "is", "sending", "it", "anon", "ngmi", "wagmi", "dev", "based",
+    "community", "takeover", "liquidity", "locked", "fren", "lfg", "ape", "in", "now", "or", "never",
+]
+
+TOKEN_PHRASES = [
+    "$BONK", "$WIF", "$POPCAT", "FROG coin", "DRAGON token", "PEPE to the moon", "MOON pump",
+    "KING dollar", "TIGER yen", "CAT diamond hands", "$SOL", "DOGE euro", "ROCKET lambo",
+]
+
+
+def build_corpus(size: int, seed: int = 42):
+    """Generate a synthetic tweet corpus with a realistic token density"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(8, 40))]
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randint(0, len(words)), rng.choice(TOKEN_PHRASES))
+        corpus.append(" ".join(words))
+    return corpus
+
+
+def legacy_extract(text: str, exclude=frozenset()):
+    """Reference copy of the old RealTimeXMonitor.extract_token_names"""
+    tokens = set()
+    text = text.upper()
+    for pattern in LEGACY_TOKEN_PATTERNS:
+        for match in re.findall(pattern, text, re.IGNORECASE):
+            token = match.upper().strip()
+            if (len(token) >= 2 and token not in exclude and
+                    not token.isdigit() and token not in ['THE', 'AND', 'FOR', 'WITH']):
+                tokens.add(token)
+    return tokens
+
+
+def run_benchmark(corpus_size: int = 100000):
+    print(f"🔍 Building corpus of {corpus_size} tweets...")
+    corpus = build_corpus(corpus_size)
+    extractor = TokenExtractor()
+    exclude = {'BTC', 'ETH', 'SOL'}
+
+    start = time.perf_counter()
+    legacy_results = [legacy_extract(text, exclude) for text in corpus]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine_results = [set(extractor.extract(text, exclude)) for text in corpus]
+    engine_seconds = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(legacy_results, engine_results) if a != b)
+
+    print(f"   Legacy regex:     {legacy_seconds:.2f}s ({corpus_size / legacy_seconds:,.0f} tweets/s)")
+    print(f"   TokenExtractor:   {engine_seconds:.2f}s ({corpus_size / engine_seconds:,.0f} tweets/s)")
+    print(f"   Speedup:          {legacy_seconds / engine_seconds:.1f}x")
+    print(f"   Mismatched tweets: {mismatches}")
+
+    if mismatches:
+        print("❌ FAILED - extraction results differ from the legacy patterns")
+        return False
+    print("✅ PASSED - identical tokens on every tweet")
+    return True
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    sys.exit(0 if run_benchmark(size) else 1)